@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 
+import hashlib
+import json
 import os
 import platform
 import shutil
 import subprocess
+import sys
 import tempfile
+import time
+import zlib
 from datetime import datetime
 import boto3
 import typer
@@ -21,6 +26,9 @@ app = typer.Typer(help="Build and upload artifacts to S3")
 DEFAULT_PROJECT_DIR = Path(__file__).parent.parent
 DEFAULT_ENV = "dev"
 DEFAULT_PROJECT_NAME = "python-libs"
+SOUND_FORMATS = ("pcm", "ogg", "original")
+# Must match SOUND_MANIFEST in src/utils/media/sound_manifest.py
+SOUND_MANIFEST = "sounds_manifest.json"
 
 
 def get_s3_client():
@@ -45,7 +53,151 @@ def create_bucket_if_not_exists(bucket_name):
         s3_client.create_bucket(Bucket=bucket_name)
 
 
-def build_pyinstaller_executable(project_dir, temp_dir, entry_point="src/runners/run.py"):
+def prerender_sounds(project_dir, temp_dir):
+    """Copy resources/sounds and pre-render every sound to raw PCM next to it"""
+    typer.echo("Pre-rendering sounds to PCM...")
+
+    sounds_dir = os.path.join(temp_dir, "sounds")
+    shutil.copytree(os.path.join(project_dir, "resources", "sounds"), sounds_dir)
+
+    # Render headless with the same mixer settings the runtime uses
+    env = dict(os.environ, SDL_AUDIODRIVER=os.getenv("SDL_AUDIODRIVER", "dummy"))
+    subprocess.run(
+        [sys.executable, "-m", "src.utils.media.pcm_cache", sounds_dir],
+        cwd=project_dir,
+        env=env,
+        check=True,
+    )
+
+    return sounds_dir
+
+
+def get_mixer_frequency(project_dir):
+    """Get the sample rate of the mixer profile the runtime will use (MIXER_PROFILE)"""
+    result = subprocess.run(
+        [
+            sys.executable, "-c",
+            "from src.utils.media.mixer_profiles import get_mixer_profile; "
+            "print(get_mixer_profile()['frequency'])",
+        ],
+        cwd=project_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(result.stdout)
+
+
+def transcode_sounds(project_dir, temp_dir, quality=4, sample_rate=44100):
+    """Transcode resources/sounds to loudness-normalized Ogg Vorbis, deduplicating identical files"""
+    typer.echo(f"Transcoding sounds to Ogg Vorbis (quality {quality}, {sample_rate} Hz)...")
+
+    source_dir = os.path.join(project_dir, "resources", "sounds")
+    sounds_dir = os.path.join(temp_dir, "sounds")
+    os.makedirs(sounds_dir, exist_ok=True)
+
+    manifest = {}
+    bundled_by_digest = {}
+    for file_name in sorted(os.listdir(source_dir)):
+        source_file = os.path.join(source_dir, file_name)
+        if not os.path.isfile(source_file):
+            continue
+        with open(source_file, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+
+        if digest in bundled_by_digest:
+            typer.echo(f"  {file_name} is identical to {bundled_by_digest[digest]}, bundling it once")
+        else:
+            bundled_name = f"{os.path.splitext(file_name)[0]}.ogg"
+            if bundled_name in bundled_by_digest.values():
+                bundled_name = f"{os.path.splitext(file_name)[0]}-{digest[:8]}.ogg"
+            subprocess.run(
+                [
+                    "ffmpeg", "-y", "-loglevel", "error",
+                    "-i", source_file,
+                    "-af", "loudnorm",
+                    "-ar", str(sample_rate),
+                    "-c:a", "libvorbis", "-q:a", str(quality),
+                    os.path.join(sounds_dir, bundled_name),
+                ],
+                check=True,
+            )
+            bundled_by_digest[digest] = bundled_name
+        manifest[file_name] = bundled_by_digest[digest]
+
+    # The runtime maps SOUND_FILE names to the bundled files through this manifest
+    with open(os.path.join(sounds_dir, SOUND_MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    return sounds_dir
+
+
+def measure_sound_bundle(sounds_dir):
+    """Measure the size of a sounds directory and the time to extract it from a onefile binary"""
+    blobs = {}
+    size = 0
+    for file_name in sorted(os.listdir(sounds_dir)):
+        with open(os.path.join(sounds_dir, file_name), "rb") as f:
+            data = f.read()
+        size += len(data)
+        # PyInstaller --onefile stores data zlib-compressed and unpacks it on every launch
+        blobs[file_name] = zlib.compress(data)
+
+    with tempfile.TemporaryDirectory() as extract_dir:
+        start = time.perf_counter()
+        for file_name, blob in blobs.items():
+            with open(os.path.join(extract_dir, file_name), "wb") as f:
+                f.write(zlib.decompress(blob))
+        extraction_time = time.perf_counter() - start
+
+    return size, sum(len(blob) for blob in blobs.values()), extraction_time
+
+
+def report_sound_bundle(project_dir, sounds_dir):
+    """Compare the bundled sounds against bundling resources/sounds untouched"""
+    typer.echo("Sound bundle report:")
+    for label, directory in (
+        ("untouched", os.path.join(project_dir, "resources", "sounds")),
+        ("bundled", sounds_dir),
+    ):
+        size, compressed_size, extraction_time = measure_sound_bundle(directory)
+        typer.echo(
+            f"  {label}: {size} bytes, {compressed_size} bytes in binary, "
+            f"extraction {extraction_time * 1000:.1f} ms"
+        )
+
+
+def prepare_sounds(project_dir, temp_dir, sound_format="ogg", sound_quality=4):
+    """Prepare resources/sounds for bundling in the requested format
+
+    ogg shrinks the bundle. pcm keeps the sources and adds an uncompressed render
+    of each, trading a larger binary for sounds that load without decoding.
+    """
+    if sound_format not in SOUND_FORMATS:
+        raise typer.BadParameter(f"sound_format must be one of: {', '.join(SOUND_FORMATS)}")
+
+    if sound_format == "original":
+        return os.path.join(project_dir, "resources", "sounds")
+    if sound_format == "ogg":
+        # Resample once at build time to the rate the mixer runs at, not on every load
+        sounds_dir = transcode_sounds(
+            project_dir, temp_dir, quality=sound_quality, sample_rate=get_mixer_frequency(project_dir)
+        )
+    else:
+        sounds_dir = prerender_sounds(project_dir, temp_dir)
+
+    report_sound_bundle(project_dir, sounds_dir)
+    return sounds_dir
+
+
+def build_pyinstaller_executable(
+    project_dir,
+    temp_dir,
+    entry_point="src/runners/run.py",
+    bundle_sounds=True,
+    sound_format="ogg",
+    sound_quality=4,
+):
     """Build PyInstaller executable"""
     typer.echo("Building PyInstaller executable...")
     
@@ -63,10 +215,14 @@ def build_pyinstaller_executable(project_dir, temp_dir, entry_point="src/runners
         "--onefile",
         "--clean",
         "--name", "pomodoro",
-        "--add-data", f"resources/sounds:resources/sounds",
         "--add-data", f".env:.env",
         os.path.join(project_dir, entry_point)
     ]
+
+    # Builds relying on synthesized alarm tones (ALARM_TONE) need no sound files
+    if bundle_sounds:
+        sounds_dir = prepare_sounds(project_dir, temp_dir, sound_format, sound_quality)
+        pyinstaller_cmd.extend(["--add-data", f"{sounds_dir}:resources/sounds"])
     
     # Add platform-specific options
     if is_windows:
@@ -123,6 +279,11 @@ def build_and_upload(
     project_dir: Path = DEFAULT_PROJECT_DIR,
     env: str = DEFAULT_ENV,
     project_name: str = DEFAULT_PROJECT_NAME,
+    bundle_sounds: bool = typer.Option(True, help="Bundle resources/sounds into the executable"),
+    sound_format: str = typer.Option(
+        "ogg", help="How to bundle sounds: ogg (smallest), pcm (fastest to load) or original"
+    ),
+    sound_quality: int = typer.Option(4, help="Ogg Vorbis quality from 0 to 10 when transcoding"),
 ):
     """Build and upload artifacts to S3"""
     # Calculate bucket name
@@ -137,7 +298,13 @@ def build_and_upload(
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         
         # Build PyInstaller executable
-        executable_path = build_pyinstaller_executable(project_dir, temp_dir)
+        executable_path = build_pyinstaller_executable(
+            project_dir,
+            temp_dir,
+            bundle_sounds=bundle_sounds,
+            sound_format=sound_format,
+            sound_quality=sound_quality,
+        )
         
         # Create Linux shell script
         script_path = create_linux_script(project_dir, temp_dir)
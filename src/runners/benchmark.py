@@ -0,0 +1,47 @@
+from src.utils.abstract.abstract_runner import AbstractRunner
+from src.utils.benchmark import (  # noqa: F401 (registers suites)
+    env_benchmarks,
+    logging_benchmarks,
+    media_benchmarks,
+    mock_benchmarks,
+)
+from src.utils.benchmark.benchmark import get_benchmark, list_benchmarks
+
+
+class BenchmarkRunner(AbstractRunner):
+    """Runner executing the registered benchmark suites."""
+
+    @property
+    def argument_definitions(self):
+        """Argument definitions for the benchmark runner."""
+        return {
+            "--suite": {
+                "help": "The benchmark suite to run.",
+                "choices": list_benchmarks(),
+                "required": True,
+                "dest": "suite",
+            },
+            "--repeat": {
+                "help": "How many timing rounds to run.",
+                "type": int,
+                "default": 5,
+                "dest": "repeat",
+            },
+        }
+
+    def main(self, *args) -> None:
+        """
+        Run a benchmark suite and print its results.
+
+        The expected arguments are:
+        - --suite: The benchmark suite to run.
+        - --repeat: How many timing rounds to run.
+        """
+        self.initialized_arguments(*args)
+        results = get_benchmark(self.parsed_args.suite)(repeat=self.parsed_args.repeat)
+        for case, metrics in results.items():
+            formatted = ", ".join(
+                f"{name}={value:.6g}" if isinstance(value, float) else f"{name}={value}"
+                for name, value in metrics.items()
+            )
+            print(f"{self.parsed_args.suite}.{case}: {formatted}")
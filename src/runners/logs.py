@@ -0,0 +1,57 @@
+import logging
+import sys
+
+from src.utils.abstract.abstract_runner import AbstractRunner
+from src.utils.env_checks.path_resolver import anchor_path
+from src.utils.logging.log_index import query_logs
+
+
+class LogsRunner(AbstractRunner):
+    """Runner searching the log files."""
+
+    @property
+    def argument_definitions(self):
+        """Argument definitions for the logs runner."""
+        return {
+            "command": {
+                "help": "What to do with the logs.",
+                "choices": ["query"],
+            },
+            "--file": {
+                "help": "The active log file; its rotated segments are searched too.",
+                "default": "resources/logs/app.log",
+                "dest": "file",
+            },
+            "--start": {
+                "help": 'The start of the time range, e.g. "2024-05-01 12:00".',
+                "dest": "start",
+            },
+            "--end": {
+                "help": 'The end of the time range, inclusive, e.g. "2024-05-01 12:30".',
+                "dest": "end",
+            },
+            "--level": {
+                "help": "The minimum level of the records.",
+                "choices": ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+                "dest": "level",
+            },
+        }
+
+    def main(self, *args) -> None:
+        """
+        Print the log records of a time range and level.
+
+        The expected arguments are:
+        - command: "query".
+        - --file: The active log file.
+        - --start: The start of the time range.
+        - --end: The end of the time range.
+        - --level: The minimum level of the records.
+        """
+        self.initialized_arguments(*args)
+        level = logging.getLevelName(self.parsed_args.level) if self.parsed_args.level else 0
+        records = query_logs(anchor_path(self.parsed_args.file), self.parsed_args.start, self.parsed_args.end, level)
+        # Straight to the terminal: print is redirected into the very log being queried
+        for record in records:
+            sys.__stdout__.write(record)
+        sys.__stdout__.flush()
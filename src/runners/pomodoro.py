@@ -1,8 +1,11 @@
 import time
 
 from src.utils.abstract.abstract_runner import AbstractRunner
-from src.utils.env_checks.env_checks import get_path_based_env_var
+from src.utils.env_checks.path_resolver import anchor_path, resolve_path
+from src.utils.env_checks.settings import get_settings
 from src.utils.media.audio import PygameMixerSoundSingleton
+from src.utils.media.sound_manifest import resolve_sound_file
+from src.utils.media.synth import random_tone_parameters
 
 
 class PomodoroRunner(AbstractRunner):
@@ -28,6 +31,14 @@ class PomodoroRunner(AbstractRunner):
             },
         }
 
+    @property
+    def resource_requirements(self):
+        """The alarm sound file, unless a synthesized alarm tone is configured."""
+        if get_settings().alarm_tone:
+            return {}
+        # A sound file, so a build bundling it transcoded under another name passes the check
+        return {"sound_files": ["SOUND_FILE"]}
+
     def main(self, *args) -> None:
         """
         Set a Pomodoro timer for a given number of minutes.
@@ -52,12 +63,19 @@ class PomodoroRunner(AbstractRunner):
         # Wait for the Pomodoro timer to expire
         time.sleep(seconds)
 
-        # Get the sound file path from the environment variable
-        SOUND_FILE = get_path_based_env_var("SOUND_FILE")
-
         # Initialize and play the alarm sound
+        settings = get_settings()
         audio_player = PygameMixerSoundSingleton()
-        audio_player.load_sound(SOUND_FILE)
+        if settings.alarm_tone == "random":
+            audio_player.load_tone(**random_tone_parameters())
+        elif settings.alarm_tone:
+            audio_player.load_tone(settings.alarm_tone)
+        else:
+            # Get the sound file path from the environment variable
+            SOUND_FILE = self.resolved_paths.get("SOUND_FILE") or resolve_path(
+                resolve_sound_file(anchor_path(settings.require("sound_file")))
+            )
+            audio_player.load_sound(SOUND_FILE)
         audio_player.play_sound()
 
         if not audio_player.is_sound_playing():
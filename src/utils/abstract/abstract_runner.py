@@ -9,6 +9,8 @@ class AbstractRunner(ABC):
         """Initialize the runner."""
         self.parsed_args = None
         self._arguments_initialized = False
+        # Paths from resource_requirements, already checked by the preflight stage
+        self.resolved_paths = {}
 
     @staticmethod
     def parse_arguments(*args, **kwargs):
@@ -40,6 +42,16 @@ class AbstractRunner(ABC):
         """
         pass
 
+    @property
+    def resource_requirements(self):
+        """Declares what the runner needs before it can run.
+
+        Returns:
+            dict: Environment variable names under "env_vars" (must be set), "files"
+                and "directories" (must point at an existing file or directory).
+        """
+        return {}
+
     def initialized_arguments(self, *args):
         if not self.argument_definitions:
             raise NotImplementedError(
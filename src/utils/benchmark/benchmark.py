@@ -0,0 +1,74 @@
+import statistics
+import time
+from typing import Callable, Dict, List
+
+_BENCHMARKS: Dict[str, Callable[..., dict]] = {}
+
+
+def register_benchmark(name: str) -> Callable:
+    """Register a benchmark suite under a name.
+
+    Args:
+        name (str): The name used to select the suite from the benchmark runner.
+
+    Returns:
+        Callable: A decorator registering the decorated suite function.
+    """
+
+    def decorator(func: Callable[..., dict]) -> Callable[..., dict]:
+        if name in _BENCHMARKS:
+            raise ValueError(f"Benchmark '{name}' is already registered.")
+        _BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+def get_benchmark(name: str) -> Callable[..., dict]:
+    """Get a registered benchmark suite.
+
+    Args:
+        name (str): The name of the benchmark suite.
+
+    Returns:
+        Callable: The suite function.
+
+    Raises:
+        KeyError: If no suite is registered under the name.
+    """
+    try:
+        return _BENCHMARKS[name]
+    except KeyError:
+        raise KeyError(f"Benchmark '{name}' not found.")
+
+
+def list_benchmarks() -> List[str]:
+    """List the names of all registered benchmark suites."""
+    return sorted(_BENCHMARKS)
+
+
+def time_call(func: Callable, *args, repeat: int = 5, number: int = 1, **kwargs) -> dict:
+    """Time a callable with a monotonic clock.
+
+    Args:
+        func (Callable): The callable to time.
+        *args: Positional arguments passed to the callable.
+        repeat (int): How many timing rounds to run.
+        number (int): How many calls to make per round.
+        **kwargs: Keyword arguments passed to the callable.
+
+    Returns:
+        dict: Best and mean round time and best time per call, in seconds.
+    """
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*args, **kwargs)
+        rounds.append(time.perf_counter() - start)
+    best = min(rounds)
+    return {
+        "best": best,
+        "mean": statistics.fmean(rounds),
+        "per_call": best / number,
+    }
@@ -0,0 +1,28 @@
+import os
+import tempfile
+
+from dotenv import dotenv_values
+
+from src.utils.benchmark.benchmark import register_benchmark, time_call
+from src.utils.env_checks import env_loader
+
+
+def _parse_cold(path: str) -> dict:
+    """Parse a .env file with an empty parse cache."""
+    env_loader._parse_cache.clear()
+    return env_loader.parse_env_file(path)
+
+
+@register_benchmark("env_loader")
+def benchmark_env_loader(repeat: int = 5) -> dict:
+    """Compare python-dotenv against the cached .env parser on a large file."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        env_file = os.path.join(temp_dir, ".env")
+        with open(env_file, "w") as f:
+            for i in range(10000):
+                f.write(f"# setting {i}\nVAR_{i}=\"value {i}\" # trailing comment\n")
+        return {
+            "python_dotenv": time_call(dotenv_values, env_file, repeat=repeat),
+            "env_loader_cold": time_call(_parse_cold, env_file, repeat=repeat),
+            "env_loader_cached": time_call(env_loader.parse_env_file, env_file, repeat=repeat),
+        }
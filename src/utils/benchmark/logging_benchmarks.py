@@ -0,0 +1,182 @@
+import json
+import logging
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+from src.utils.benchmark.benchmark import register_benchmark, time_call
+from src.utils.logging.context import install_context_factory, log_context
+from src.utils.logging.flight_recorder import FlightRecorderHandler
+from src.utils.logging.json_formatter import JsonLinesFormatter
+from src.utils.logging.logger_stream import LoggerStream
+from src.utils.logging.logging_config_singleton import LoggingConfigSingleton, _original_print
+
+_LINES = 10000
+
+
+class _ConcatenatingStream:
+    """The previous LoggerStream, which grew one string and only logged writes ending in a newline."""
+
+    def __init__(self, level):
+        self.level = level
+        self.buffer = ""
+
+    def write(self, message: str) -> None:
+        self.buffer += message
+        if message.endswith("\n"):
+            self.level(self.buffer.strip())
+            self.buffer = ""
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.level(self.buffer.strip())
+        self.buffer = ""
+
+
+def _print_lines(stream) -> None:
+    """Print lines of several fields through a redirected stdout."""
+    with redirect_stdout(stream):
+        for i in range(_LINES):
+            print("line", i, "of the benchmark")
+    stream.flush()
+
+
+def _write_partial_line(stream) -> None:
+    """Write one long line character by character."""
+    for _ in range(_LINES):
+        stream.write("x")
+    stream.write("\n")
+
+
+def _ignore(message: str) -> None:
+    """Logging method discarding its message, so only the stream is measured."""
+
+
+@register_benchmark("logger_stream")
+def benchmark_logger_stream(repeat: int = 5) -> dict:
+    """Compare the throughput of the line splitting LoggerStream against string concatenation."""
+    results = {}
+    for name, stream_factory in (
+        ("concatenating", lambda: _ConcatenatingStream(_ignore)),
+        ("line_splitting", lambda: LoggerStream(_ignore)),
+    ):
+        printed = time_call(lambda: _print_lines(stream_factory()), repeat=repeat)
+        printed["lines_per_second"] = _LINES / printed["best"]
+        results[f"{name}_print"] = printed
+        results[f"{name}_partial_writes"] = time_call(lambda: _write_partial_line(stream_factory()), repeat=repeat)
+    return results
+
+
+@register_benchmark("print_redirect")
+def benchmark_print_redirect(repeat: int = 5) -> dict:
+    """Measure the per-call overhead of the redirected print against the native print."""
+    root = logging.root
+    saved_level, saved_handlers = root.level, root.handlers[:]
+    root.handlers = [logging.NullHandler()]
+    try:
+        with open(os.devnull, "w") as devnull:
+            results = {"native": time_call(_original_print, "line", 1, file=devnull, repeat=repeat, number=_LINES)}
+        root.setLevel(logging.INFO)
+        results["redirected_enabled"] = time_call(
+            LoggingConfigSingleton._custom_print, "line", 1, repeat=repeat, number=_LINES
+        )
+        root.setLevel(logging.WARNING)
+        results["redirected_disabled"] = time_call(
+            LoggingConfigSingleton._custom_print, "line", 1, repeat=repeat, number=_LINES
+        )
+    finally:
+        root.setLevel(saved_level)
+        root.handlers = saved_handlers
+    return results
+
+
+def _format_records(formatter, records) -> None:
+    """Format every record once."""
+    for record in records:
+        formatter.format(record)
+
+
+class _DictJsonFormatter(logging.Formatter):
+    """Straightforward JSON formatter building a dict per record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(
+            {
+                "asctime": self.formatTime(record),
+                "levelname": record.levelname,
+                "name": record.name,
+                "message": record.getMessage(),
+            }
+        )
+
+
+@register_benchmark("json_formatter")
+def benchmark_json_formatter(repeat: int = 5) -> dict:
+    """Compare records per second of the text formatter, a dict based JSON formatter and JsonLinesFormatter."""
+    records = [
+        logging.LogRecord("benchmark", logging.INFO, __file__, 1, "record %d of %s", (i, "benchmark"), None)
+        for i in range(_LINES)
+    ]
+    results = {}
+    for name, formatter in (
+        ("text", logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")),
+        ("dict_json", _DictJsonFormatter()),
+        ("json_lines", JsonLinesFormatter()),
+    ):
+        result = time_call(_format_records, formatter, records, repeat=repeat)
+        result["records_per_second"] = _LINES / result["best"]
+        results[name] = result
+    return results
+
+
+def _handle_records(handler, records) -> None:
+    """Pass every record to a handler."""
+    for record in records:
+        handler.handle(record)
+
+
+@register_benchmark("flight_recorder")
+def benchmark_flight_recorder(repeat: int = 5) -> dict:
+    """Compare writing DEBUG records to a file against keeping them in a flight recorder."""
+    records = [
+        logging.LogRecord("benchmark", logging.DEBUG, __file__, 1, "record %d of %s", (i, "benchmark"), None)
+        for i in range(_LINES)
+    ]
+    results = {}
+    with tempfile.TemporaryDirectory() as log_dir:
+        log_file = os.path.join(log_dir, "app.log")
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+        recorder = FlightRecorderHandler([file_handler], capacity=_LINES)
+        try:
+            for name, handler in (("file_handler", file_handler), ("flight_recorder", recorder)):
+                file_handler.flush()
+                size = os.path.getsize(log_file)
+                result = time_call(_handle_records, handler, records, repeat=repeat)
+                file_handler.flush()
+                result["records_per_second"] = _LINES / result["best"]
+                result["bytes_written"] = os.path.getsize(log_file) - size
+                results[name] = result
+        finally:
+            file_handler.close()
+    return results
+
+
+def _log_lines(log) -> None:
+    """Log lines through one logging method."""
+    for i in range(_LINES):
+        log("line %d", i)
+
+
+@register_benchmark("log_context")
+def benchmark_log_context(repeat: int = 5) -> dict:
+    """Measure logging calls with a bound logging context, at a disabled and an enabled level."""
+    install_context_factory()
+    logger = logging.Logger("benchmark", logging.INFO)
+    logger.addHandler(logging.NullHandler())
+    results = {}
+    for name, fields in (("without_context", {}), ("with_context", {"session_id": "s1", "runner": "benchmark"})):
+        with log_context(**fields):
+            results[f"{name}_disabled"] = time_call(_log_lines, logger.debug, repeat=repeat)
+            results[f"{name}_enabled"] = time_call(_log_lines, logger.info, repeat=repeat)
+    return results
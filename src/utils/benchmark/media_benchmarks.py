@@ -0,0 +1,81 @@
+import os
+import tempfile
+import time
+import wave
+
+import pygame
+
+from src.utils.benchmark.benchmark import register_benchmark, time_call
+from src.utils.media.mixer_profiles import MIXER_PROFILES
+from src.utils.media.pcm_cache import load_pcm_cache, render_pcm_cache
+
+
+def _write_silent_wav(path: str, seconds: float, frequency: int = 44100) -> None:
+    """Write a 16-bit stereo WAV file of silence."""
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(frequency)
+        wav.writeframes(b"\0" * int(seconds * frequency) * 4)
+
+
+@register_benchmark("pcm_cache")
+def benchmark_pcm_cache(repeat: int = 5) -> dict:
+    """Compare decoding a WAV file against loading its memory-mapped PCM cache."""
+    pygame.mixer.init()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # 22050 Hz source so the decode path has to resample to the mixer rate
+        sound_file = os.path.join(temp_dir, "benchmark.wav")
+        _write_silent_wav(sound_file, seconds=10, frequency=22050)
+        cache_file = render_pcm_cache(sound_file)
+        return {
+            "decode": time_call(pygame.mixer.Sound, sound_file, repeat=repeat),
+            "pcm_cache": time_call(load_pcm_cache, cache_file, repeat=repeat),
+        }
+
+
+def _measure_profile(profile: dict, repeat: int) -> dict:
+    """Measure the play call overhead and the CPU cost of the mixer for a profile.
+
+    The time until the sound reaches the speakers is not measured: SDL and the
+    audio device add their own buffering, which pygame does not expose.
+    """
+    pygame.mixer.quit()
+    pygame.mixer.init(**profile)
+    frequency, size, channels = pygame.mixer.get_init()
+    frame_bytes = abs(size) // 8 * channels
+    sound = pygame.mixer.Sound(buffer=b"\0" * frame_bytes * (frequency // 2))
+
+    play_calls = []
+    cpu_per_second = []
+    for _ in range(repeat):
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        sound.play()
+        # The mixer reports busy once the channel took the sound, before any of it is output
+        while not pygame.mixer.get_busy():
+            pass
+        play_calls.append(time.perf_counter() - wall_start)
+        while pygame.mixer.get_busy():
+            time.sleep(0.01)
+        cpu_per_second.append(
+            (time.process_time() - cpu_start) / (time.perf_counter() - wall_start)
+        )
+    return {
+        "play_call_overhead": min(play_calls),
+        # Computed from the profile, not measured: the time one mixer buffer holds
+        "buffer_duration": profile["buffer"] / frequency,
+        "cpu_per_second": min(cpu_per_second),
+    }
+
+
+@register_benchmark("mixer_profiles")
+def benchmark_mixer_profiles(repeat: int = 5) -> dict:
+    """Report the play call overhead, buffer duration and CPU cost of each mixer profile on this machine."""
+    try:
+        return {
+            name: _measure_profile(profile, repeat)
+            for name, profile in MIXER_PROFILES.items()
+        }
+    finally:
+        pygame.mixer.quit()
@@ -0,0 +1,210 @@
+import sys
+import tracemalloc
+import types
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+from src.utils.benchmark.benchmark import register_benchmark, time_call
+from src.utils.test.mock_context_manager import MockContextManager
+from src.utils.test.mock_methods import call_log
+from src.utils.test.mock_patching_strategies import MethodPatcherStrategy, invalidate_targets, resolve_target
+
+_TARGET = "_mock_benchmark_target"
+_PATCHES = 300
+_UPDATES = 20
+_CYCLES = 1000
+_STUBBED = 50
+_LOGGED_CALLS = 1000
+
+
+class _PerNameContextManager(MockContextManager):
+    """A manager starting and stopping one patcher per name instead of one batch per owner."""
+
+    def _apply_patches(self, patch_type, patch_items):
+        strategy = self.strategies[patch_type]
+        for name, value in patch_items.items():
+            patcher = strategy.execute(self.target_path, name, value)
+            self.active_mocks[name] = patcher.start()
+            self.active_patchers[name] = patcher
+
+
+class _StackingContextManager(_PerNameContextManager):
+    """The previous manager, which started every patcher again on each apply and update."""
+
+    def apply_all_patches(self):
+        self._apply_patches("method", self.method_behaviors)
+        self._apply_patches("attribute", self.attribute_values)
+        self._apply_patches("mapping", self.mapping_values)
+        self._apply_patches("class", self.class_values)
+
+    @contextmanager
+    def update_patch(self, name, new_value):
+        self.apply_all_patches()
+        old_patcher = self.active_patchers.pop(name)
+        self.active_mocks.pop(name)
+        old_patcher.stop()
+        new_patcher = self.strategies[self._get_patch_type(name)].execute(self.target_path, name, new_value)
+        self.active_mocks[name] = new_patcher.start()
+        self.active_patchers[name] = new_patcher
+        try:
+            yield self.active_mocks[name]
+        finally:
+            new_patcher.stop()
+            self.active_mocks[name] = old_patcher.start()
+            self.active_patchers[name] = old_patcher
+
+
+def _reset_target(target: types.ModuleType) -> None:
+    """Undo the patches a manager left behind on the target module."""
+    patch.stopall()
+    for attribute in [attribute for attribute in vars(target) if attribute.startswith("attribute_")]:
+        delattr(target, attribute)
+    for i in range(_PATCHES):
+        setattr(target, f"method_{i}", print)
+
+
+def _create_manager(manager_class) -> MockContextManager:
+    """Create a manager with hundreds of attribute and method patches."""
+    return manager_class(
+        _TARGET,
+        method_behaviors={f"method_{i}": i for i in range(_PATCHES // 3)},
+        attribute_values={f"attribute_{i}": str(i) for i in range(_PATCHES - _PATCHES // 3)},
+    )
+
+
+def _enter_exit(manager) -> None:
+    """Apply and stop every patch once."""
+    with manager:
+        pass
+
+
+def _update_repeatedly(manager) -> None:
+    """Update one patch after another inside a block, like a test trying several values."""
+    with manager:
+        for i in range(_UPDATES):
+            with manager.update_patch("attribute_0", i):
+                pass
+
+
+@register_benchmark("mock_context")
+def benchmark_mock_context(repeat: int = 5) -> dict:
+    """Compare the state-tracked MockContextManager against one re-applying every patch on updates."""
+    target = sys.modules[_TARGET] = types.ModuleType(_TARGET)
+    _reset_target(target)
+    results = {}
+    try:
+        for name, manager_class in (("stacking", _StackingContextManager), ("state_tracked", MockContextManager)):
+            manager = _create_manager(manager_class)
+            results[f"{name}_enter_exit"] = time_call(_enter_exit, manager, repeat=repeat)
+            results[f"{name}_updates"] = time_call(_update_repeatedly, manager, repeat=repeat)
+            # Names the stacking manager left patched after its blocks ended
+            results[f"{name}_updates"]["left_patched"] = sum(
+                getattr(target, f"method_{i}") is not print for i in range(_PATCHES)
+            ) + sum(attribute.startswith("attribute_") for attribute in vars(target))
+            _reset_target(target)
+    finally:
+        del sys.modules[_TARGET]
+    return results
+
+
+def _patch_by_path(target_path: str, name: str) -> None:
+    """Start and stop patchers that import and walk their target on every start."""
+    for _ in range(_CYCLES):
+        patcher = patch(f"{target_path}.{name}", return_value=True)
+        patcher.start()
+        patcher.stop()
+
+
+def _patch_resolved(target_path: str, name: str) -> None:
+    """Start and stop patchers of the strategies, whose target is resolved once."""
+    strategy = MethodPatcherStrategy()
+    for _ in range(_CYCLES):
+        patcher = strategy.execute(target_path, name, True)
+        patcher.start()
+        patcher.stop()
+
+
+@register_benchmark("patch_resolution")
+def benchmark_patch_resolution(repeat: int = 5) -> dict:
+    """Compare patching by dotted path against patching a cached owner object."""
+    invalidate_targets()
+    resolve_target("os", "path.exists")
+    return {
+        "by_path": time_call(_patch_by_path, "os", "path.exists", repeat=repeat),
+        "resolved": time_call(_patch_resolved, "os", "path.exists", repeat=repeat),
+    }
+
+
+def _setup_test(lightweight: bool) -> MockContextManager:
+    """Set up and tear down the patches of one test with many classes and mappings."""
+    manager = MockContextManager(
+        _TARGET,
+        mapping_values={f"mapping_{i}": {"key": i} for i in range(_STUBBED)},
+        class_values={f"Class_{i}": {f"method_{j}": j for j in range(5)} for i in range(_STUBBED)},
+        lightweight=lightweight,
+    )
+    with manager:
+        pass
+    return manager
+
+
+def _peak_bytes(lightweight: bool) -> int:
+    """Measure the memory one test setup allocates at its peak."""
+    tracemalloc.start()
+    try:
+        _setup_test(lightweight)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@register_benchmark("mock_stubs")
+def benchmark_mock_stubs(repeat: int = 5) -> dict:
+    """Compare the per-test setup cost of MagicMock patches against the lightweight stubs."""
+    sys.modules[_TARGET] = types.ModuleType(_TARGET)
+    results = {}
+    try:
+        for name, lightweight in (("magicmock", False), ("lightweight", True)):
+            results[name] = time_call(_setup_test, lightweight, repeat=repeat)
+            results[name]["peak_bytes"] = _peak_bytes(lightweight)
+    finally:
+        del sys.modules[_TARGET]
+    return results
+
+
+@register_benchmark("mock_batching")
+def benchmark_mock_batching(repeat: int = 5) -> dict:
+    """Compare starting one patcher per name against one patch.multiple per owner."""
+    _reset_target(sys.modules.setdefault(_TARGET, types.ModuleType(_TARGET)))
+    try:
+        return {
+            "per_name": time_call(_enter_exit, _create_manager(_PerNameContextManager), repeat=repeat),
+            "per_owner": time_call(_enter_exit, _create_manager(MockContextManager), repeat=repeat),
+        }
+    finally:
+        del sys.modules[_TARGET]
+
+
+def _scan_called(mock, method, *args) -> bool:
+    """The previous method_called_in_mock, scanning every recorded call on each query."""
+    return any(m[0] == method and m.args == args for m in mock.method_calls)
+
+
+def _query_each_call(check) -> None:
+    """Record calls like a load test and check each of them as it is made."""
+    mock = MagicMock()
+    for i in range(_LOGGED_CALLS):
+        mock.upload(i)
+        check(mock, "upload", i)
+
+
+@register_benchmark("call_log")
+def benchmark_call_log(repeat: int = 5) -> dict:
+    """Compare scanning method_calls on every check against the indexed call log."""
+    return {
+        "scan": time_call(_query_each_call, _scan_called, repeat=repeat),
+        "indexed": time_call(
+            _query_each_call, lambda mock, method, *args: call_log(mock).called_with_args(method, *args),
+            repeat=repeat,
+        ),
+    }
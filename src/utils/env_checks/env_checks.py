@@ -2,6 +2,9 @@ import os
 import sys
 from dotenv import load_dotenv
 
+from src.utils.env_checks.path_resolver import resolve_path
+from src.utils.env_checks.settings import invalidate_settings, to_path
+
 
 def get_running_in_pyinstaller() -> str:
     """Check if the script is running in a PyInstaller bundle.
@@ -50,25 +53,30 @@ def get_path_based_env_var(var_name: str) -> str:
         KeyError: If the environment variable is not found.
     """
     try:
-        # Get the raw value from environment
-        var = os.environ[var_name]
-        
-        # If path contains separators from the wrong OS, normalize them
-        var = var.replace('/', os.sep).replace('\\', os.sep)
-        
-        # If running in PyInstaller, prepend the _MEIPASS base directory
-        if getattr(sys, "frozen", False):
-            return os.path.join(sys._MEIPASS, var)
-        else:
-            # For regular execution, check if it's an absolute path already
-            if os.path.isabs(var):
-                return var
-            # For relative paths, return as is (caller will resolve relative to their context)
-            return var
+        return to_path(os.environ[var_name])
     except KeyError:
         raise KeyError(f"Environment variable '{var_name}' not found.")
 
 
+def get_resolved_env_path(var_name: str) -> str:
+    """Get a path environment variable as a verified, absolute path.
+
+    Relative paths are anchored at the project root, or the bundle root when
+    frozen, instead of the current working directory. The result is cached.
+
+    Args:
+        var_name (str): The name of the environment variable to retrieve.
+
+    Returns:
+        str: The canonical absolute path.
+
+    Raises:
+        KeyError: If the environment variable is not found.
+        FileNotFoundError: If nothing exists at the path.
+    """
+    return resolve_path(get_env_var(var_name))
+
+
 def load_environment_variables(env_file: str = ".env") -> None:
     """Load environment variables from a specified .env file.
 
@@ -79,4 +87,5 @@ def load_environment_variables(env_file: str = ".env") -> None:
         raise FileNotFoundError(f"{env_file} not found.")
 
     load_dotenv(env_file)
+    invalidate_settings()
     print(f"Environment variables loaded from {env_file}")
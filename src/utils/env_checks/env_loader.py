@@ -0,0 +1,168 @@
+import os
+import re
+import threading
+from typing import AbstractSet, Dict, FrozenSet, Iterable, List, Tuple
+
+from src.utils.env_checks.settings import invalidate_settings
+
+_LINE = re.compile(
+    r"""^\s*(?:export\s+)?(?P<key>[A-Za-z_][A-Za-z0-9_.]*)\s*=\s*"""
+    r"""(?:"(?P<double>(?:\\.|[^"\\])*)"|'(?P<single>[^']*)'|(?P<bare>.*?))\s*(?:\s\#.*)?$"""
+)
+_EXPANSION = re.compile(r"\$\{(?P<name>[A-Za-z_][A-Za-z0-9_]*)(?::-(?P<default>[^}]*))?\}")
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", '"': '"', "\\": "\\"}
+
+# path -> ((mtime_ns, size), parsed values)
+_parse_cache: Dict[str, Tuple[Tuple[int, int], "EnvValues"]] = {}
+# Values this loader wrote to os.environ, so reloads can tell them apart from the process env
+_applied: Dict[str, str] = {}
+_lock = threading.Lock()
+
+
+class EnvValues(dict):
+    """Parsed .env values, which also know the keys given as single quoted literals."""
+
+    def __init__(self, values=(), literals: FrozenSet[str] = frozenset()):
+        super().__init__(values)
+        self.literals = literals
+
+
+def parse_env_lines(lines: Iterable[str]) -> EnvValues:
+    """Parse the lines of a .env file.
+
+    Supports comments, `export` prefixes, single quoted literals and double
+    quoted values with escapes. Variable references are kept as written and
+    expanded when the layers are merged, except in single quoted literals.
+
+    Args:
+        lines (Iterable[str]): The lines of the file.
+
+    Returns:
+        EnvValues: The parsed values in file order, with the keys of the literals.
+    """
+    values = {}
+    literals = set()
+    for line in lines:
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        match = _LINE.match(line)
+        if not match:
+            continue
+        if match.group("double") is not None:
+            value = re.sub(r"\\(.)", lambda m: _ESCAPES.get(m.group(1), m.group(0)), match.group("double"))
+        elif match.group("single") is not None:
+            value = match.group("single")
+        else:
+            value = match.group("bare")
+        key = match.group("key")
+        values[key] = value
+        if match.group("single") is not None:
+            literals.add(key)
+        else:
+            literals.discard(key)
+    return EnvValues(values, frozenset(literals))
+
+
+def parse_env_file(path: str) -> EnvValues:
+    """Parse a .env file, reusing the last result while its mtime and size are unchanged.
+
+    Args:
+        path (str): The path to the .env file.
+
+    Returns:
+        EnvValues: The parsed values. Callers must not modify them.
+    """
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _parse_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, encoding="utf-8") as f:
+        values = parse_env_lines(f)
+    _parse_cache[path] = (key, values)
+    return values
+
+
+def get_env_layers(env_file: str = ".env", environment: str = None) -> List[str]:
+    """List the .env layers from lowest to highest precedence.
+
+    Args:
+        env_file (str): The base .env file.
+        environment (str): The environment overlay name. Defaults to the APP_ENV environment variable.
+
+    Returns:
+        List[str]: The base file, the per-environment overlay and the local override.
+    """
+    if environment is None:
+        environment = os.environ.get("APP_ENV")
+    layers = [env_file]
+    if environment:
+        layers.append(f"{env_file}.{environment}")
+    layers.append(f"{env_file}.local")
+    return layers
+
+
+def _expand(values: Dict[str, str], literals: AbstractSet[str] = frozenset()) -> Dict[str, str]:
+    """Expand ${NAME} and ${NAME:-default} references against the merged values and os.environ.
+
+    The values of the literal keys are kept as written.
+    """
+    expanded = {}
+    for key, value in values.items():
+        if "${" in value and key not in literals:
+            value = _EXPANSION.sub(
+                lambda m: expanded.get(m.group("name"), os.environ.get(m.group("name"), m.group("default") or "")),
+                value,
+            )
+        expanded[key] = value
+    return expanded
+
+
+def load_layered_environment(env_file: str = ".env", environment: str = None) -> Dict[str, str]:
+    """Merge the .env layers into os.environ.
+
+    Precedence from lowest to highest is the base file, the `<env_file>.<environment>`
+    overlay, the `<env_file>.local` override and finally the process environment.
+    Unchanged files are not parsed again, so repeated loads only stat the layers.
+
+    Args:
+        env_file (str): The base .env file, which must exist.
+        environment (str): The environment overlay name. Defaults to the APP_ENV environment variable.
+
+    Returns:
+        Dict[str, str]: The merged file values, before the process environment is applied.
+
+    Raises:
+        FileNotFoundError: If the base .env file does not exist.
+    """
+    if not os.path.exists(env_file):
+        raise FileNotFoundError(f"{env_file} not found.")
+
+    merged = {}
+    literals = set()
+    loaded = []
+    for layer in get_env_layers(env_file, environment):
+        if layer == env_file or os.path.isfile(layer):
+            values = parse_env_file(layer)
+            merged.update(values)
+            # The layer defining a key last decides if its value is a literal
+            literals.difference_update(values)
+            literals.update(values.literals)
+            loaded.append(layer)
+    merged = _expand(merged, literals)
+
+    with _lock:
+        for key, value in merged.items():
+            # Variables set by the process itself always win
+            if key in os.environ and _applied.get(key) != os.environ[key]:
+                continue
+            os.environ[key] = value
+            _applied[key] = value
+        # Drop values a previous load applied that no layer defines anymore
+        for key in [key for key in _applied if key not in merged]:
+            if os.environ.get(key) == _applied.pop(key):
+                del os.environ[key]
+
+    invalidate_settings()
+    print(f"Environment variables loaded from {', '.join(loaded)}")
+    return merged
@@ -0,0 +1,173 @@
+import atexit
+import os
+import sys
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.env_checks.settings import to_path
+
+# Configured value -> (canonical path, (st_ino, st_mtime_ns) when it was verified)
+_resolved: Dict[str, Tuple[str, Tuple[int, int]]] = {}
+_lock = threading.Lock()
+_watcher: Optional["PathWatcher"] = None
+_exit_hook_registered = False
+
+
+@lru_cache(maxsize=None)
+def get_project_root() -> str:
+    """Get the directory relative paths are anchored at.
+
+    Returns:
+        str: The PyInstaller bundle directory when frozen, the repository root otherwise.
+    """
+    if getattr(sys, "frozen", False):
+        return os.path.realpath(sys._MEIPASS)
+    # src/utils/env_checks/path_resolver.py -> repository root
+    return os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, os.pardir))
+
+
+def anchor_path(value: str) -> str:
+    """Convert a configured path to a canonical absolute path, without touching the file system.
+
+    Relative paths are anchored at the project root instead of the current working directory.
+
+    Args:
+        value (str): The configured path, e.g. an environment value.
+
+    Returns:
+        str: The canonical absolute path.
+    """
+    path = to_path(value)
+    if not os.path.isabs(path):
+        path = os.path.join(get_project_root(), path)
+    return os.path.realpath(path)
+
+
+def _signature(path: str) -> Optional[Tuple[int, int]]:
+    """Identify the current file at a path, or None if there is none."""
+    try:
+        path_stat = os.stat(path)
+    except OSError:
+        return None
+    return path_stat.st_ino, path_stat.st_mtime_ns
+
+
+def resolve_path(value: str) -> str:
+    """Resolve a configured path to a canonical absolute path that exists.
+
+    The file system is only checked the first time a value is resolved. Later
+    calls are a dictionary lookup until the path watcher or invalidate_paths
+    drops the entry.
+
+    Args:
+        value (str): The configured path, e.g. an environment value.
+
+    Returns:
+        str: The canonical absolute path.
+
+    Raises:
+        FileNotFoundError: If nothing exists at the path.
+    """
+    cached = _resolved.get(value)
+    if cached is not None:
+        return cached[0]
+    path = anchor_path(value)
+    signature = _signature(path)
+    if signature is None:
+        raise FileNotFoundError(f"Path not found: {path}")
+    with _lock:
+        _resolved[value] = (path, signature)
+    return path
+
+
+def invalidate_paths(value: str = None) -> None:
+    """Drop resolved paths, so they are checked again on their next use.
+
+    Args:
+        value (str): The configured path to drop. Drops every path if None.
+    """
+    with _lock:
+        if value is None:
+            _resolved.clear()
+        else:
+            _resolved.pop(value, None)
+
+
+def check_resolved_paths() -> List[str]:
+    """Drop every resolved path that was removed, replaced or modified since it was verified.
+
+    Returns:
+        List[str]: The configured values that were dropped.
+    """
+    with _lock:
+        entries = list(_resolved.items())
+    stale = [value for value, (path, signature) in entries if _signature(path) != signature]
+    with _lock:
+        for value in stale:
+            _resolved.pop(value, None)
+    return stale
+
+
+class PathWatcher:
+    """Background thread polling the resolved paths for changes."""
+
+    def __init__(self, interval: float = 2.0):
+        """Initialize the watcher.
+
+        Args:
+            interval (float): Seconds between two checks.
+        """
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._watch, name="path-watcher", daemon=True)
+
+    def _watch(self) -> None:
+        """Check the resolved paths until stopped."""
+        while not self._stop.wait(self.interval):
+            check_resolved_paths()
+
+    def start(self) -> None:
+        """Start polling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and wait for the thread to finish."""
+        self._stop.set()
+        self._thread.join()
+
+    def is_alive(self) -> bool:
+        """Check if the watcher is polling."""
+        return self._thread.is_alive()
+
+
+def start_path_watch(interval: float = 2.0) -> PathWatcher:
+    """Start the shared path watcher, unless it is already running.
+
+    Meant for long-running processes; short runs do not need it. The watcher is
+    stopped at interpreter exit.
+
+    Args:
+        interval (float): Seconds between two checks.
+
+    Returns:
+        PathWatcher: The running watcher.
+    """
+    global _watcher, _exit_hook_registered
+    with _lock:
+        if not _exit_hook_registered:
+            atexit.register(stop_path_watch)
+            _exit_hook_registered = True
+        if _watcher is None or not _watcher.is_alive():
+            _watcher = PathWatcher(interval)
+            _watcher.start()
+        return _watcher
+
+
+def stop_path_watch() -> None:
+    """Stop the shared path watcher, if it is running."""
+    global _watcher
+    with _lock:
+        watcher, _watcher = _watcher, None
+    if watcher is not None and watcher.is_alive():
+        watcher.stop()
@@ -0,0 +1,159 @@
+import os
+import sys
+import threading
+from dataclasses import dataclass, field, fields
+from typing import Callable, List, Mapping, Optional
+
+
+def to_path(value: str) -> str:
+    """Convert an environment value to a path for the current platform.
+
+    Normalizes path separators and, when running in a PyInstaller bundle,
+    prepends the _MEIPASS base directory.
+
+    Args:
+        value (str): The raw environment value.
+
+    Returns:
+        str: The converted path.
+    """
+    value = value.replace("/", os.sep).replace("\\", os.sep)
+    if getattr(sys, "frozen", False):
+        return os.path.join(sys._MEIPASS, value)
+    return value
+
+
+def to_bool(value: str) -> bool:
+    """Convert an environment value such as "1", "true", "yes" or "on" to a bool."""
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def env_field(env_var: str, default=None, converter: Callable[[str], object] = str):
+    """Declare a Settings field read from an environment variable.
+
+    Args:
+        env_var (str): The name of the environment variable.
+        default: The value used when the variable is not set.
+        converter (Callable): Converts the raw string value.
+    """
+    return field(default=default, metadata={"env_var": env_var, "converter": converter})
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable snapshot of the environment configuration."""
+
+    log_config_file: Optional[str] = env_field("LOG_CONFIG_FILE", converter=to_path)
+    sound_file: Optional[str] = env_field("SOUND_FILE", converter=to_path)
+    alarm_tone: Optional[str] = env_field("ALARM_TONE")
+    mixer_profile: str = env_field("MIXER_PROFILE", default="balanced")
+    log_queue_size: int = env_field("LOG_QUEUE_SIZE", default=10000, converter=int)
+    log_queue_overflow: str = env_field("LOG_QUEUE_OVERFLOW", default="block")
+    log_format: str = env_field("LOG_FORMAT", default="text")
+    # Log filters, all disabled if unset
+    log_rate_limit: Optional[float] = env_field("LOG_RATE_LIMIT", converter=float)
+    log_rate_burst: Optional[int] = env_field("LOG_RATE_BURST", converter=int)
+    log_debug_sample_rate: Optional[float] = env_field("LOG_DEBUG_SAMPLE_RATE", converter=float)
+    log_collapse_repeats: bool = env_field("LOG_COLLAPSE_REPEATS", default=False, converter=to_bool)
+    log_dropped_report_seconds: float = env_field("LOG_DROPPED_REPORT_SECONDS", default=60.0, converter=float)
+    # Keep records below WARNING in memory and write them to the log files only on errors, off if unset
+    log_flight_recorder_records: Optional[int] = env_field("LOG_FLIGHT_RECORDER_RECORDS", converter=int)
+    log_flight_recorder_bytes: Optional[int] = env_field("LOG_FLIGHT_RECORDER_BYTES", converter=int)
+    # Unix socket accepting log level changes at runtime, none if unset
+    log_control_socket: Optional[str] = env_field("LOG_CONTROL_SOCKET")
+    # Reload the log levels on SIGHUP instead of terminating, for daemons without a terminal
+    log_reload_signal: bool = env_field("LOG_RELOAD_SIGNAL", default=False, converter=to_bool)
+    # Seconds between checks of the resolved paths in long-running processes, no watcher if unset
+    path_watch_interval: Optional[float] = env_field("PATH_WATCH_INTERVAL", converter=float)
+    # Unset rotation limits keep the values of the logging configuration file
+    log_max_bytes: Optional[int] = env_field("LOG_MAX_BYTES", converter=int)
+    log_rotate_seconds: Optional[float] = env_field("LOG_ROTATE_SECONDS", converter=float)
+    log_backup_count: Optional[int] = env_field("LOG_BACKUP_COUNT", converter=int)
+    log_max_age_seconds: Optional[float] = env_field("LOG_MAX_AGE_SECONDS", converter=float)
+
+    @classmethod
+    def from_environ(cls, environ: Mapping[str, str] = None) -> "Settings":
+        """Build a snapshot from the environment.
+
+        Args:
+            environ (Mapping): The environment to read. Defaults to os.environ.
+
+        Returns:
+            Settings: The converted values, with defaults for unset variables.
+        """
+        environ = os.environ if environ is None else environ
+        values = {}
+        for settings_field in fields(cls):
+            env_var = settings_field.metadata["env_var"]
+            if env_var in environ:
+                values[settings_field.name] = settings_field.metadata["converter"](environ[env_var])
+        return cls(**values)
+
+    def require(self, name: str):
+        """Get a field that must be configured.
+
+        Args:
+            name (str): The field name.
+
+        Returns:
+            The field value.
+
+        Raises:
+            KeyError: If the environment variable behind the field is not set.
+        """
+        value = getattr(self, name)
+        if value is None:
+            env_var = next(f.metadata["env_var"] for f in fields(self) if f.name == name)
+            raise KeyError(f"Environment variable '{env_var}' not found.")
+        return value
+
+
+_settings: Optional[Settings] = None
+_listeners: List[Callable[[Settings, Settings], None]] = []
+_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+    """Get the cached settings snapshot, building it on first use."""
+    settings = _settings
+    if settings is None:
+        with _lock:
+            settings = _settings or _build_settings()
+    return settings
+
+
+def _build_settings() -> Settings:
+    """Build and cache a new snapshot. Must be called with _lock held."""
+    global _settings
+    _settings = Settings.from_environ()
+    return _settings
+
+
+def invalidate_settings() -> Settings:
+    """Rebuild the settings after the environment changed.
+
+    Listeners are notified with the old and new snapshot if any value changed.
+
+    Returns:
+        Settings: The new snapshot.
+    """
+    with _lock:
+        old_settings = _settings
+        new_settings = _build_settings()
+        listeners = list(_listeners)
+    if old_settings is not None and old_settings != new_settings:
+        for listener in listeners:
+            listener(old_settings, new_settings)
+    return new_settings
+
+
+def add_settings_listener(listener: Callable[[Settings, Settings], None]) -> None:
+    """Call a listener with (old, new) settings whenever invalidation changes them."""
+    with _lock:
+        _listeners.append(listener)
+
+
+def remove_settings_listener(listener: Callable[[Settings, Settings], None]) -> None:
+    """Stop notifying a listener about settings changes."""
+    with _lock:
+        _listeners.remove(listener)
@@ -0,0 +1,175 @@
+import atexit
+import logging
+import multiprocessing
+import queue
+import threading
+from logging.handlers import QueueHandler
+from multiprocessing.util import Finalize
+from typing import Optional
+
+# Set in worker processes, whose records are written by the aggregating process
+_forwarding_handler: Optional["ForwardingHandler"] = None
+_aggregator: Optional["LogAggregator"] = None
+_lock = threading.Lock()
+
+
+class ForwardingHandler(QueueHandler):
+    """Forwards the records of a worker process to the aggregating process, in batches.
+
+    Logging calls only put the prepared record on a local queue. A background
+    thread sends what has piled up as one batch, so neither pickling nor the
+    pipe to the other process slow down the caller.
+    """
+
+    def __init__(self, log_queue, batch_size: int = 100):
+        """
+        Initialize the handler.
+
+        Args:
+            log_queue: The multiprocessing queue of the aggregating process.
+            batch_size (int): The maximum number of records sent at once.
+        """
+        super().__init__(queue.SimpleQueue())
+        self.log_queue = log_queue
+        self.batch_size = batch_size
+        self._thread = threading.Thread(target=self._forward, name="log-forwarder", daemon=True)
+        self._thread.start()
+
+    def _forward(self) -> None:
+        """Send the queued records in batches until the handler is closed."""
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            closed = batch[-1] is None
+            if closed:
+                batch.pop()
+            if batch:
+                self.log_queue.put(batch)
+            if closed:
+                return
+
+    def close(self) -> None:
+        """Send the queued records and stop forwarding."""
+        if self._thread.is_alive():
+            self.queue.put(None)
+            self._thread.join()
+        super().close()
+
+
+class LogAggregator:
+    """Writes the records forwarded by worker processes, the only process touching the log files."""
+
+    def __init__(self, handler: logging.Handler = None, context=None):
+        """
+        Initialize the aggregator.
+
+        Args:
+            handler (logging.Handler): Handles the forwarded records. By default they go through
+                the logger of their name, and so through the handlers of this process.
+            context: The multiprocessing context the workers are started with.
+        """
+        self.handler = handler
+        self.queue = (context or multiprocessing).Queue()
+        self._thread = threading.Thread(target=self._receive, name="log-aggregator", daemon=True)
+
+    def _receive(self) -> None:
+        """Handle the forwarded batches until stopped."""
+        while True:
+            batch = self.queue.get()
+            if batch is None:
+                return
+            for record in batch:
+                if self.handler is not None:
+                    self.handler.handle(record)
+                else:
+                    logging.getLogger(record.name).handle(record)
+
+    def start(self) -> None:
+        """Start receiving records."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Handle the records forwarded so far and stop receiving."""
+        if self._thread.is_alive():
+            self.queue.put(None)
+            self._thread.join()
+
+
+def start_log_aggregator() -> LogAggregator:
+    """Start the shared log aggregator of this process, unless it is running.
+
+    It is stopped at interpreter exit. Start it after the logging setup, so it
+    stops before the queue pipeline writing its records does.
+
+    Returns:
+        LogAggregator: The running aggregator.
+    """
+    global _aggregator
+    with _lock:
+        if _aggregator is None:
+            _aggregator = LogAggregator()
+            _aggregator.start()
+            atexit.register(stop_log_aggregator)
+        return _aggregator
+
+
+def stop_log_aggregator() -> None:
+    """Stop the shared log aggregator, if it is running."""
+    global _aggregator
+    with _lock:
+        aggregator, _aggregator = _aggregator, None
+    if aggregator is not None:
+        aggregator.stop()
+
+
+def configure_worker(log_queue, level: int = logging.DEBUG, batch_size: int = 100) -> None:
+    """Forward every record of this worker process to the aggregating process.
+
+    Meant as the initializer of a process pool. Handlers inherited from the
+    parent are removed, and a later logging setup in the worker keeps away from
+    the log files.
+
+    Args:
+        log_queue: The queue of the LogAggregator.
+        level (int): The level of the root logger of the worker.
+        batch_size (int): The maximum number of records sent at once.
+    """
+    global _forwarding_handler
+    root = logging.root
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    _forwarding_handler = ForwardingHandler(log_queue, batch_size)
+    root.addHandler(_forwarding_handler)
+    root.setLevel(level)
+    # Workers exit without running atexit hooks, multiprocessing finalizers do run.
+    # Above the priority of the queue finalizers, so the last batch is still sent.
+    Finalize(None, _forwarding_handler.close, exitpriority=20)
+
+
+def is_forwarding() -> bool:
+    """Check if this process forwards its records to an aggregating process."""
+    return _forwarding_handler is not None
+
+
+def create_worker_pool(processes: int = None, context=None, **kwargs):
+    """Create a process pool whose workers forward their records to this process.
+
+    Args:
+        processes (int): The number of worker processes. Defaults to the number of CPUs.
+        context: The multiprocessing context. Defaults to the default start method.
+        **kwargs: Further arguments of multiprocessing.Pool, other than the initializer.
+
+    Returns:
+        multiprocessing.pool.Pool: The pool.
+    """
+    aggregator = start_log_aggregator()
+    return (context or multiprocessing).Pool(
+        processes,
+        initializer=configure_worker,
+        initargs=(aggregator.queue, logging.root.getEffectiveLevel()),
+        **kwargs,
+    )
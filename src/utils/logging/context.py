@@ -0,0 +1,106 @@
+import contextvars
+import logging
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable, Dict, Iterator, Mapping
+
+# Fields of the current session, runner or job, shared by every record created in this context
+_fields: contextvars.ContextVar[Mapping[str, object]] = contextvars.ContextVar("log_context", default={})
+
+_installed = False
+_lock = threading.Lock()
+
+
+def get_log_context() -> Mapping[str, object]:
+    """Get the logging context fields of the current thread or task."""
+    return _fields.get()
+
+
+def bind_log_context(**fields) -> contextvars.Token:
+    """Add fields to the logging context for the rest of the current thread or task.
+
+    Returns:
+        contextvars.Token: Token for reset_log_context.
+    """
+    return _fields.set({**_fields.get(), **fields})
+
+
+def reset_log_context(token: contextvars.Token) -> None:
+    """Restore the logging context from before a bind_log_context call."""
+    _fields.reset(token)
+
+
+@contextmanager
+def log_context(**fields) -> Iterator[Mapping[str, object]]:
+    """Add fields, e.g. session_id, runner or job_id, to every record logged inside the block.
+
+    The fields follow asyncio tasks started inside the block, and threads started
+    with ContextThread or functions wrapped with in_current_context.
+
+    Yields:
+        Mapping[str, object]: The fields of the block.
+    """
+    token = bind_log_context(**fields)
+    try:
+        yield _fields.get()
+    finally:
+        _fields.reset(token)
+
+
+def in_current_context(func: Callable) -> Callable:
+    """Wrap a function to run in a copy of the current context, e.g. as a thread target or executor task."""
+    return partial(contextvars.copy_context().run, func)
+
+
+class ContextThread(threading.Thread):
+    """Thread running in a copy of the context of the thread that created it, logging context included."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._context = contextvars.copy_context()
+
+    def run(self) -> None:
+        """Run the target inside the copied context."""
+        self._context.run(super().run)
+
+
+def install_context_factory() -> None:
+    """Attach the logging context to every record, as its "context" attribute.
+
+    The record factory only runs once a logger decided to log at the level of
+    the record, so disabled levels cost no context lookup. It runs in the
+    calling thread, before a queue hands the record to another thread.
+    Installing it more than once has no effect.
+    """
+    global _installed
+    with _lock:
+        if _installed:
+            return
+        previous = logging.getLogRecordFactory()
+
+        def factory(*args, **kwargs) -> logging.LogRecord:
+            record = previous(*args, **kwargs)
+            fields = _fields.get()
+            if fields:
+                record.context = fields
+            return record
+
+        logging.setLogRecordFactory(factory)
+        _installed = True
+
+
+def format_context(fields: Mapping[str, object]) -> str:
+    """Format context fields as " [name=value ...]", or "" without fields."""
+    if not fields:
+        return ""
+    return " [" + " ".join(f"{name}={value}" for name, value in fields.items()) + "]"
+
+
+class ContextFormatter(logging.Formatter):
+    """Text formatter appending the logging context of a record to its first line."""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Format the record line, followed by its context fields if it has any."""
+        fields: Dict[str, object] = getattr(record, "context", None)
+        return super().formatMessage(record) + format_context(fields)
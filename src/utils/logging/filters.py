@@ -0,0 +1,225 @@
+import logging
+import random
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Iterable, Optional, Tuple
+
+# Records with this attribute set pass every filter, e.g. the dropped record reports
+UNFILTERED = "unfiltered"
+
+logger = logging.getLogger(__name__)
+
+
+class CountingFilter(logging.Filter):
+    """Filter counting the records it drops, so the losses can be reported."""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._dropped = 0
+
+    def _drop(self) -> bool:
+        """Count a dropped record and return False for the filter call."""
+        with self._lock:
+            self._dropped += 1
+        return False
+
+    def take_dropped(self) -> int:
+        """Return the number of records dropped since the last call."""
+        with self._lock:
+            dropped, self._dropped = self._dropped, 0
+        return dropped
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Let unfiltered records pass, and decide on the others."""
+        if getattr(record, UNFILTERED, False):
+            return True
+        return self.accept(record)
+
+    def accept(self, record: logging.LogRecord) -> bool:
+        """Decide if a record passes."""
+        raise NotImplementedError
+
+
+class TokenBucketFilter(CountingFilter):
+    """Rate limits records per logger and message template with token buckets."""
+
+    def __init__(self, rate: float, burst: int = None, clock=time.monotonic, max_buckets: int = 10000):
+        """
+        Initialize the filter.
+
+        Args:
+            rate (float): Records per second allowed for each logger and message template.
+            burst (int): Records allowed at once after a quiet period. Defaults to the rate.
+            clock (callable): Monotonic clock in seconds.
+            max_buckets (int): The most buckets kept; the least recently used ones are dropped beyond.
+        """
+        super().__init__()
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self.max_buckets = max_buckets
+        self._clock = clock
+        # Seconds after which an untouched bucket is full again, no different from a new one
+        self._refill = self.burst / rate
+        # (logger name, message template) -> (tokens, time of the last update), least recently updated first.
+        # Redirected print output arrives as formatted lines, so every distinct line gets a bucket.
+        self._buckets: "OrderedDict[Tuple[str, str], Tuple[float, float]]" = OrderedDict()
+
+    def accept(self, record: logging.LogRecord) -> bool:
+        """Take a token from the bucket of the record, dropping it if the bucket is empty."""
+        key = (record.name, str(record.msg))
+        now = self._clock()
+        with self._lock:
+            tokens, last = self._buckets.pop(key, (self.burst, now))
+            self._expire(now)
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                self._dropped += 1
+                return False
+            self._buckets[key] = (tokens - 1, now)
+        return True
+
+    def _expire(self, now: float) -> None:
+        """Drop the buckets that are full again, and the least recently used ones beyond max_buckets."""
+        buckets = self._buckets
+        while buckets:
+            _, last = next(iter(buckets.values()))
+            if now - last < self._refill and len(buckets) < self.max_buckets:
+                return
+            buckets.popitem(last=False)
+
+    def __len__(self) -> int:
+        """The number of kept buckets."""
+        return len(self._buckets)
+
+
+class SamplingFilter(CountingFilter):
+    """Keeps a random sample of the records up to a level."""
+
+    def __init__(self, rate: float, level: int = logging.DEBUG, seed=None):
+        """
+        Initialize the filter.
+
+        Args:
+            rate (float): The share of records to keep, between 0 and 1.
+            level (int): Records up to this level are sampled, more severe ones always pass.
+            seed: Seed for the random generator. Defaults to system randomness.
+        """
+        super().__init__()
+        self.rate = rate
+        self.level = level
+        self._random = random.Random(seed).random
+
+    def accept(self, record: logging.LogRecord) -> bool:
+        """Keep a record above the level, or with the sampling probability."""
+        if record.levelno > self.level or self._random() < self.rate:
+            return True
+        return self._drop()
+
+
+class RepeatCollapsingFilter(CountingFilter):
+    """Collapses runs of identical records into the first one and a "repeated N times" record."""
+
+    def __init__(self, handler: logging.Handler):
+        """
+        Initialize the filter.
+
+        Args:
+            handler (logging.Handler): The handler the summary records are written to.
+        """
+        super().__init__()
+        self.handler = handler
+        self._last: Optional[Tuple[str, int, str]] = None
+        self._last_record: Optional[logging.LogRecord] = None
+        self._repeats = 0
+
+    def accept(self, record: logging.LogRecord) -> bool:
+        """Drop a record repeating the previous one, summarizing the repeats once the run ends."""
+        key = (record.name, record.levelno, record.getMessage())
+        with self._lock:
+            if key == self._last:
+                self._repeats += 1
+                self._dropped += 1
+                return False
+            summary = self._take_summary()
+            self._last, self._last_record = key, record
+        if summary is not None:
+            self.handler.handle(summary)
+        return True
+
+    def _take_summary(self) -> Optional[logging.LogRecord]:
+        """Build the summary of the current run of repeats and reset it. Must be called with the lock held."""
+        if not self._repeats:
+            return None
+        last = self._last_record
+        summary = logging.LogRecord(
+            last.name, last.levelno, last.pathname, last.lineno,
+            "Last message repeated %d times", (self._repeats,), None,
+        )
+        setattr(summary, UNFILTERED, True)
+        self._repeats = 0
+        return summary
+
+    def flush(self) -> None:
+        """Write the summary of a run of repeats that has not ended yet."""
+        with self._lock:
+            summary = self._take_summary()
+            self._last = None
+        if summary is not None:
+            self.handler.handle(summary)
+
+
+class DroppedRecordReporter:
+    """Background thread logging how many records the filters dropped, so nothing is lost silently."""
+
+    def __init__(self, filters: Iterable, interval: float = 60.0):
+        """
+        Initialize the reporter.
+
+        Args:
+            filters (Iterable): The filters, or anything else with a take_dropped method
+                such as a BoundedQueueHandler, to report on.
+            interval (float): Seconds between two reports.
+        """
+        self.filters = list(filters)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="dropped-record-reporter", daemon=True)
+
+    def report(self) -> Counter:
+        """Log the records dropped since the last report, if any.
+
+        Returns:
+            Counter: The dropped records per class of the dropping filter or handler.
+        """
+        dropped = Counter()
+        for log_filter in self.filters:
+            if isinstance(log_filter, RepeatCollapsingFilter):
+                log_filter.flush()
+            dropped[type(log_filter).__name__] += log_filter.take_dropped()
+        dropped = +dropped
+        if dropped:
+            logger.warning(
+                "Dropped %d log records: %s",
+                sum(dropped.values()),
+                ", ".join(f"{name}={count}" for name, count in sorted(dropped.items())),
+                extra={UNFILTERED: True},
+            )
+        return dropped
+
+    def _run(self) -> None:
+        """Report until stopped."""
+        while not self._stop.wait(self.interval):
+            self.report()
+
+    def start(self) -> None:
+        """Start reporting."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop reporting, after a last report."""
+        self._stop.set()
+        self._thread.join()
+        self.report()
@@ -0,0 +1,193 @@
+import logging
+import signal
+import sys
+import threading
+from collections import deque
+from operator import attrgetter
+from typing import Iterable, List, Mapping, Optional, Tuple
+
+# Record attributes kept in the buffer, enough for the usual format strings
+_KEPT_ATTRIBUTES = (
+    "name", "levelno", "levelname", "pathname", "filename", "module", "lineno",
+    "funcName", "created", "msecs", "thread", "threadName", "process",
+)
+_get_kept = attrgetter(*_KEPT_ATTRIBUTES)
+
+# Rough size of a buffered entry besides its message, for the byte limit
+_ENTRY_OVERHEAD = 200
+
+_exception_formatter = logging.Formatter()
+
+
+class FlightRecorderHandler(logging.Handler):
+    """Keeps the recent detail records in memory and writes them out only when something fails.
+
+    Records below the threshold are buffered in a ring of compact tuples instead
+    of being written. An ERROR record, an unhandled exception or a signal dumps
+    the buffer to the target handlers, so the context of a failure is kept
+    without paying the I/O for every DEBUG record.
+    """
+
+    def __init__(
+        self,
+        targets: Iterable[logging.Handler],
+        capacity: int = 10000,
+        max_bytes: int = 0,
+        threshold: int = logging.WARNING,
+        flush_level: int = logging.ERROR,
+    ):
+        """
+        Initialize the handler.
+
+        Args:
+            targets (Iterable[logging.Handler]): The handlers the buffer is dumped to.
+            capacity (int): The number of records to keep. Unlimited if 0.
+            max_bytes (int): The approximate memory the kept records may take. Unlimited if 0.
+            threshold (int): Records below this level are buffered, the others are left to the targets.
+            flush_level (int): Records at or above this level dump the buffer.
+        """
+        super().__init__()
+        self.targets: List[logging.Handler] = list(targets)
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.threshold = threshold
+        self.flush_level = flush_level
+        self._buffer: deque = deque(maxlen=capacity or None)
+        self._size = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer a detail record, or dump the buffer on a failure."""
+        if record.levelno >= self.flush_level:
+            self.dump()
+            return
+        if record.levelno >= self.threshold:
+            return
+        try:
+            entry = self._compact(record)
+        except Exception:
+            self.handleError(record)
+            return
+        if self.max_bytes:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._size -= len(self._buffer[0][1]) + _ENTRY_OVERHEAD
+            self._size += len(entry[1]) + _ENTRY_OVERHEAD
+            self._buffer.append(entry)
+            while self._size > self.max_bytes and len(self._buffer) > 1:
+                self._size -= len(self._buffer.popleft()[1]) + _ENTRY_OVERHEAD
+        else:
+            self._buffer.append(entry)
+
+    @staticmethod
+    def _compact(record: logging.LogRecord) -> Tuple[tuple, str, Optional[str], Optional[Mapping]]:
+        """Reduce a record to its kept attributes, its message, its formatted exception and its context."""
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = _exception_formatter.formatException(record.exc_info)
+        return _get_kept(record), record.getMessage(), exc_text, getattr(record, "context", None)
+
+    @staticmethod
+    def _restore(entry: Tuple[tuple, str, Optional[str], Optional[Mapping]]) -> logging.LogRecord:
+        """Rebuild a record from a buffered entry."""
+        attributes, message, exc_text, context = entry
+        record = logging.makeLogRecord(dict(zip(_KEPT_ATTRIBUTES, attributes)))
+        record.msg = message
+        record.exc_text = exc_text
+        if context:
+            record.context = context
+        return record
+
+    def dump(self) -> int:
+        """Write the buffered records to the targets and clear the buffer.
+
+        Returns:
+            int: The number of records written.
+        """
+        with self.lock:
+            entries = list(self._buffer)
+            self._buffer.clear()
+            self._size = 0
+        for entry in entries:
+            record = self._restore(entry)
+            for target in self.targets:
+                # Handler.handle skips the level check of the target
+                target.handle(record)
+        for target in self.targets:
+            target.flush()
+        return len(entries)
+
+    def __len__(self) -> int:
+        """The number of buffered records."""
+        return len(self._buffer)
+
+
+def install_dump_hooks(recorder: FlightRecorderHandler, signals: Iterable[int] = None) -> None:
+    """Dump a flight recorder on unhandled exceptions and on signals.
+
+    The previous exception hooks still run after the dump. Signals dump from a
+    separate thread, since the interrupted code may hold the handler locks.
+
+    Args:
+        recorder (FlightRecorderHandler): The recorder to dump.
+        signals (Iterable[int]): The signals to dump on. Defaults to SIGUSR1 where available.
+    """
+    previous_excepthook = sys.excepthook
+    previous_thread_excepthook = threading.excepthook
+
+    def excepthook(*args):
+        recorder.dump()
+        previous_excepthook(*args)
+
+    def thread_excepthook(args):
+        recorder.dump()
+        previous_thread_excepthook(args)
+
+    sys.excepthook = excepthook
+    threading.excepthook = thread_excepthook
+
+    if signals is None:
+        signals = [signal.SIGUSR1] if hasattr(signal, "SIGUSR1") else []
+    for signum in signals:
+        try:
+            signal.signal(
+                signum, lambda *_: threading.Thread(target=recorder.dump, name="flight-recorder-dump").start()
+            )
+        except ValueError:
+            # Signal handlers can only be set from the main thread
+            logging.getLogger(__name__).warning("Cannot dump the flight recorder on signal %s", signum)
+
+
+def install_flight_recorder(
+    logger: logging.Logger = None,
+    capacity: int = 10000,
+    max_bytes: int = 0,
+    threshold: int = logging.WARNING,
+    signals: Iterable[int] = None,
+) -> FlightRecorderHandler:
+    """Put a flight recorder in front of the file handlers of a logger.
+
+    The file handlers are raised to the threshold, so they keep writing the
+    warnings and errors as they happen, and receive the buffered detail records
+    only when the recorder is dumped.
+
+    Args:
+        logger (logging.Logger): The logger whose file handlers are recorded. Defaults to the root logger.
+        capacity (int): The number of records to keep. Unlimited if 0.
+        max_bytes (int): The approximate memory the kept records may take. Unlimited if 0.
+        threshold (int): Records below this level are only written when the recorder is dumped.
+        signals (Iterable[int]): The signals to dump on. Defaults to SIGUSR1 where available.
+
+    Returns:
+        FlightRecorderHandler: The installed recorder.
+    """
+    logger = logger or logging.root
+    targets = [
+        handler for handler in logger.handlers
+        if isinstance(handler, logging.FileHandler) and handler.level < threshold
+    ]
+    for handler in targets:
+        handler.setLevel(threshold)
+    recorder = FlightRecorderHandler(targets, capacity, max_bytes, threshold)
+    # First in line, so the context is written before the error record itself
+    logger.handlers.insert(0, recorder)
+    install_dump_hooks(recorder, signals)
+    return recorder
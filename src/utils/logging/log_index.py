@@ -0,0 +1,248 @@
+import gzip
+import logging
+import mmap
+import os
+import struct
+import time
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Optional
+
+from src.utils.logging.rotation import find_segments
+
+# Records start with "%Y-%m-%d %H:%M:%S", which sorts like the time it stands for
+STAMP_LENGTH = 19
+_LEVEL_SEPARATOR = b" - "
+_EARLIEST = "0000-01-01 00:00:00"
+_LATEST = "9999-12-31 23:59:59"
+
+INDEX_SUFFIX = ".tindex"
+DEFAULT_STRIDE = 64 * 1024
+_MAGIC = b"LOGTIX01"
+# Magic, inode of the indexed file, bytes indexed so far
+_HEADER = struct.Struct("<8sQQ")
+# Timestamp of a record and its offset in the file
+_ENTRY = struct.Struct("<19s5xQ")
+
+
+def _is_record_start(line: bytes) -> bool:
+    """Check if a line starts a record rather than continuing one, e.g. a traceback."""
+    return (
+        len(line) > STAMP_LENGTH
+        and line[4:5] == b"-"
+        and line[13:14] == b":"
+        and line[:4].isdigit()
+        and line[STAMP_LENGTH:STAMP_LENGTH + 3] == _LEVEL_SEPARATOR
+    )
+
+
+def _level_of(line: bytes) -> int:
+    """Get the level of a record line, 0 if it is not a known level name."""
+    start = STAMP_LENGTH + len(_LEVEL_SEPARATOR)
+    end = line.find(_LEVEL_SEPARATOR, start)
+    level = logging.getLevelName(line[start:end].decode("ascii", "replace"))
+    return level if isinstance(level, int) else 0
+
+
+def normalize_stamp(value: str, fill: str = _EARLIEST) -> bytes:
+    """Complete a possibly partial time such as "2024-05-01" or "2024-05-01T12:30" to a full timestamp.
+
+    Args:
+        value (str): The time, from the year down to the second.
+        fill (str): Provides the missing trailing fields.
+
+    Returns:
+        bytes: The timestamp in the format of the log records.
+    """
+    value = value.strip().replace("T", " ")
+    return (value + fill[len(value):]).encode("ascii")
+
+
+def _to_epoch(stamp: bytes) -> float:
+    """Convert a timestamp to a Unix time in local time, rolling over days past the end of a month."""
+    text = stamp.decode("ascii")
+    fields = (text[0:4], text[5:7], text[8:10], text[11:13], text[14:16], text[17:19])
+    return time.mktime(tuple(int(field) for field in fields) + (0, 0, -1))
+
+
+class _Stamps:
+    """Read-only sequence of the timestamps of a memory-mapped index, for bisect."""
+
+    def __init__(self, index: mmap.mmap):
+        self._index = index
+        self._count = (len(index) - _HEADER.size) // _ENTRY.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position: int) -> bytes:
+        return _ENTRY.unpack_from(self._index, _HEADER.size + position * _ENTRY.size)[0]
+
+    def offset(self, position: int) -> int:
+        """Get the file offset of an entry."""
+        return _ENTRY.unpack_from(self._index, _HEADER.size + position * _ENTRY.size)[1]
+
+
+class TimeIndex:
+    """Sparse index from record timestamps to file offsets, kept next to a log file.
+
+    About one record every stride bytes is indexed. Updates only read what was
+    appended since the last one, and a replaced or truncated log file is
+    indexed again from scratch.
+    """
+
+    def __init__(self, path: str, stride: int = DEFAULT_STRIDE):
+        """
+        Initialize the index.
+
+        Args:
+            path (str): The log file.
+            stride (int): The distance in bytes between two indexed records.
+        """
+        self.path = path
+        self.index_path = path + INDEX_SUFFIX
+        self.stride = stride
+
+    def _read_state(self, inode: int, size: int, head: bytes):
+        """Get the bytes indexed so far and the last indexed offset, or None if the index is stale.
+
+        Inodes are reused, so the first indexed record must also match the head of the file.
+        """
+        try:
+            with open(self.index_path, "rb") as f:
+                magic, indexed_inode, indexed = _HEADER.unpack(f.read(_HEADER.size))
+                f.seek(0, os.SEEK_END)
+                entries = (f.tell() - _HEADER.size) // _ENTRY.size
+                first, last = head, -self.stride
+                if entries:
+                    f.seek(_HEADER.size)
+                    first = _ENTRY.unpack(f.read(_ENTRY.size))[0]
+                    f.seek(_HEADER.size + (entries - 1) * _ENTRY.size)
+                    last = _ENTRY.unpack(f.read(_ENTRY.size))[1]
+        except (OSError, struct.error):
+            return None
+        if magic != _MAGIC or indexed_inode != inode or indexed > size or first != head:
+            return None
+        return indexed, last
+
+    def update(self) -> None:
+        """Index the records appended to the log file since the last update."""
+        try:
+            with open(self.path, "rb") as f:
+                file_stat = os.fstat(f.fileno())
+                head = f.read(STAMP_LENGTH)
+        except FileNotFoundError:
+            return
+        state = self._read_state(file_stat.st_ino, file_stat.st_size, head)
+        if state is None:
+            with open(self.index_path, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, file_stat.st_ino, 0))
+            state = (0, -self.stride)
+        indexed, last = state
+        if file_stat.st_size == indexed:
+            return
+        entries = []
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+            # Only complete lines are indexed, the last one may still be written
+            complete = log.rfind(b"\n", indexed) + 1
+            position = max(indexed, last + self.stride)
+            while 0 < complete and position < complete:
+                if position and log[position - 1] != 0x0A:
+                    position = log.find(b"\n", position, complete) + 1
+                    if not position:
+                        break
+                line = log[position:log.find(b"\n", position, complete) + 1]
+                if _is_record_start(line):
+                    entries.append(_ENTRY.pack(line[:STAMP_LENGTH], position))
+                    position += self.stride
+                else:
+                    position += len(line)
+        with open(self.index_path, "r+b") as f:
+            f.seek(0, os.SEEK_END)
+            f.write(b"".join(entries))
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, file_stat.st_ino, max(indexed, complete)))
+
+    def find_offset(self, start: bytes) -> int:
+        """Get the offset of the last indexed record before a timestamp, where a scan for it can start."""
+        try:
+            f = open(self.index_path, "rb")
+        except FileNotFoundError:
+            return 0
+        with f:
+            if os.fstat(f.fileno()).st_size <= _HEADER.size:
+                return 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as index:
+                stamps = _Stamps(index)
+                position = bisect_left(stamps, start) - 1
+                return stamps.offset(position) if position >= 0 else 0
+
+
+def _select(lines: Iterable[bytes], start: bytes, end: bytes, level: int) -> Iterator[str]:
+    """Select the records of a time range and level from log lines, stopping past the range."""
+    record: Optional[List[bytes]] = None
+    for line in lines:
+        if _is_record_start(line):
+            if record is not None:
+                yield b"".join(record).decode("utf-8", "replace")
+            stamp = line[:STAMP_LENGTH]
+            if stamp > end:
+                return
+            record = [line] if stamp >= start and (not level or _level_of(line) >= level) else None
+        elif record is not None:
+            # Continuation lines such as tracebacks belong to the record before them
+            record.append(line)
+    if record is not None:
+        yield b"".join(record).decode("utf-8", "replace")
+
+
+def _query_file(path: str, start: bytes, end: bytes, level: int) -> Iterator[str]:
+    """Query one plain log file through its index and a memory map."""
+    index = TimeIndex(path)
+    index.update()
+    offset = index.find_offset(start)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+            log.seek(offset)
+            yield from _select(iter(log.readline, b""), start, end, level)
+
+
+def _query_compressed(path: str, start: bytes, end: bytes, level: int) -> Iterator[str]:
+    """Query one gzipped segment, which cannot be mapped and is read from its beginning."""
+    with gzip.open(path, "rb") as f:
+        yield from _select(f, start, end, level)
+
+
+def query_logs(base_filename: str, start: str = None, end: str = None, level: int = 0) -> Iterator[str]:
+    """Find the records of a time range and level in a log file and its rotated segments.
+
+    The segment index of the rotation skips segments outside the range. Plain
+    files are memory-mapped and searched through their time index, compressed
+    segments are decompressed as a stream.
+
+    Args:
+        base_filename (str): The active log file, e.g. resources/logs/app.log.
+        start (str): The start of the range, e.g. "2024-05-01 12:00". Unbounded if None.
+        end (str): The end of the range, inclusive down to its precision. Unbounded if None.
+        level (int): The minimum level of the records.
+
+    Returns:
+        Iterator[str]: The matching records with their continuation lines, oldest first.
+    """
+    start_stamp = normalize_stamp(start) if start else _EARLIEST.encode("ascii")
+    end_stamp = normalize_stamp(end, _LATEST) if end else _LATEST.encode("ascii")
+    paths = find_segments(
+        base_filename,
+        _to_epoch(start_stamp) if start else None,
+        _to_epoch(end_stamp) if end else None,
+    )
+    if os.path.isfile(base_filename):
+        paths.append(base_filename)
+    for path in paths:
+        query = _query_compressed if path.endswith(".gz") else _query_file
+        try:
+            yield from query(path, start_stamp, end_stamp, level)
+        except FileNotFoundError:
+            # Removed by the retention limits after the segments were listed
+            continue
@@ -1,30 +1,85 @@
+from typing import Callable, List, Optional
+
+
 class LoggerStream:
-    """A stream that redirects writes to a logger."""
+    """A stream that redirects writes to a logger, one record per line."""
 
-    def __init__(self, level):
+    def __init__(
+        self,
+        level: Callable[[str], None],
+        max_buffer_size: int = 64 * 1024,
+        is_enabled: Optional[Callable[[], bool]] = None,
+    ):
         """
         Initialize the stream with a logging level.
 
         Args:
             level (callable): A logging method (e.g., logger.info, logger.error).
+            max_buffer_size (int): Characters of an unfinished line to hold before it is logged anyway.
+            is_enabled (callable): Tells if the logging level is enabled. Writes are
+                discarded without any buffering while it returns False.
         """
         self.level = level
-        self.buffer = ""
+        self.max_buffer_size = max_buffer_size
+        self.is_enabled = is_enabled
+        # Pieces of the unfinished line, joined only once the line is complete
+        self._chunks: List[str] = []
+        self._size = 0
 
-    def write(self, message: str) -> None:
+    @property
+    def buffer(self) -> str:
+        """The unfinished line."""
+        return "".join(self._chunks)
+
+    def write(self, message: str) -> int:
         """
-        Write a message to the logger. Ensure the message is logged continuously on the same line.
+        Write a message to the logger.
+
+        Partial writes are buffered until a newline completes the line, and every
+        line of a multi-line write is logged as its own record.
 
         Args:
             message (str): The message to log.
+
+        Returns:
+            int: The number of characters written.
         """
-        self.buffer += message  # Accumulate the message
-        if message.endswith("\n"):  # If a newline is encountered, log the entire buffer
-            self.level(self.buffer.strip())
-            self.buffer = ""  # Reset the buffer
+        if self.is_enabled is not None and not self.is_enabled():
+            return len(message)
+        if "\n" not in message:
+            if message:
+                self._chunks.append(message)
+                self._size += len(message)
+                if self._size >= self.max_buffer_size:
+                    self._emit([self._take_buffer()])
+            return len(message)
+
+        lines = message.split("\n")
+        tail = lines.pop()
+        if self._chunks:
+            self._chunks.append(lines[0])
+            lines[0] = self._take_buffer()
+        if tail:
+            self._chunks.append(tail)
+            self._size = len(tail)
+            if self._size >= self.max_buffer_size:
+                lines.append(self._take_buffer())
+        self._emit(lines)
+        return len(message)
+
+    def _take_buffer(self) -> str:
+        """Return the unfinished line and clear it."""
+        line = "".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
+        return line
+
+    def _emit(self, lines: List[str]) -> None:
+        """Log complete lines, one record each."""
+        for line in lines:
+            self.level(line.strip())
 
     def flush(self) -> None:
         """Flush buffered messages, if any."""
-        if self.buffer:
-            self.level(self.buffer.strip())
-        self.buffer = ""  # Clear the buffer after flushing
+        if self._chunks:
+            self.level(self._take_buffer().strip())
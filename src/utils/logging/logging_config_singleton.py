@@ -1,13 +1,42 @@
+import atexit
 import builtins  # Import builtins to override print
 import logging
 import logging.config
 import os
 import sys
-from typing import List
+from functools import partial
+from typing import Dict, List, Optional
 
+from src.utils.logging.aggregation import is_forwarding
+from src.utils.logging.context import install_context_factory
+from src.utils.logging.filters import (
+    DroppedRecordReporter,
+    RepeatCollapsingFilter,
+    SamplingFilter,
+    TokenBucketFilter,
+)
+from src.utils.logging.flight_recorder import install_flight_recorder
+from src.utils.logging.json_formatter import JsonLinesFormatter
 from src.utils.logging.logger_stream import LoggerStream
+from src.utils.logging.queue_pipeline import BoundedQueueHandler, install_queue_pipeline
+from src.utils.logging.reconfigure import install_reload_signal, start_control_server
+from src.utils.logging.rotation import RotatingCompressingFileHandler
 from src.utils.abstract.abstract_singleton import AbstractSingleton
 
+LOG_FORMATS = ("text", "json")
+
+# Kept before redirect_print_to_logger replaces it, for prints to an explicit file
+_original_print = builtins.print
+
+
+def _log_print(message: str) -> None:
+    """Log a printed line at INFO level."""
+    logging.info(message)
+
+
+# Buffers prints with end="" until a newline completes the line
+_print_stream = LoggerStream(_log_print)
+
 
 class LoggingConfigSingleton(AbstractSingleton):
     _instance = None
@@ -23,8 +52,39 @@ class LoggingConfigSingleton(AbstractSingleton):
         config_path: str,
         log_dir: str = None,
         log_files: List[str] = None,
+        max_queue_size: int = 10000,
+        overflow: str = "block",
+        rotation: Dict[str, object] = None,
+        log_format: str = "text",
+        filters: Dict[str, object] = None,
+        flight_recorder: Dict[str, int] = None,
+        control_socket: str = None,
+        reload_signal: bool = False,
     ):
-        """Initialize logger setup."""
+        """Initialize logger setup.
+
+        Args:
+            config_path (str): The logging configuration file.
+            log_dir (str): The directory of the log files.
+            log_files (List[str]): The log files to create if they do not exist.
+            max_queue_size (int): The maximum number of records waiting for the logging thread.
+            overflow (str): What to do with records when the queue is full, see OVERFLOW_POLICIES.
+            rotation (Dict[str, object]): Attributes of the rotating file handlers (max_bytes, interval,
+                backup_count, max_age) overriding the values of the configuration file.
+            log_format (str): "text" keeps the formatters of the configuration file, "json" writes
+                the log files as JSON lines.
+            filters (Dict[str, object]): Log filters in front of the queue: "rate_limit" records per second
+                and "rate_burst" per logger and message template, "debug_sample_rate" share of DEBUG records
+                to keep, "collapse_repeats" and "report_interval" seconds between reports of dropped records.
+            flight_recorder (Dict[str, int]): Keep the records below WARNING in memory, up to "capacity"
+                records and "max_bytes", and write them to the log files only on errors. Off if None.
+            control_socket (str): Path of a Unix socket accepting log level changes at runtime. Off if None.
+            reload_signal (bool): Reload the levels of the configuration file on SIGHUP. Off by default,
+                since it replaces the default action of SIGHUP, ending the process when its terminal closes.
+
+        Raises:
+            ValueError: If the log format is unknown.
+        """
         if hasattr(self, "_initialized") and self._initialized:
             return  # Avoid reinitialization
         self._initialized = True  # Mark as initialized
@@ -32,11 +92,32 @@ class LoggingConfigSingleton(AbstractSingleton):
         # Use os.path.join for default log directory
         self.log_dir = log_dir if log_dir is not None else os.path.join("resources", "logs")
         self.log_files = log_files or ["app.log", "error.log"]
+        self.max_queue_size = max_queue_size
+        self.overflow = overflow
+        self.rotation = rotation or {}
+        if log_format not in LOG_FORMATS:
+            raise ValueError(f"Unknown log format '{log_format}'. Choose one of: {', '.join(LOG_FORMATS)}.")
+        self.log_format = log_format
+        self.filters = filters or {}
+        self.flight_recorder = flight_recorder
+        self.control_socket = control_socket
+        self.reload_signal = reload_signal
 
     @staticmethod
-    def _custom_print(*args, **kwargs):
-        message = " ".join(map(str, args))
-        logging.info(message)
+    def _custom_print(*args, sep=" ", end="\n", file=None, flush=False):
+        """Log a print call at INFO level, or print it as usual when it targets a file.
+
+        Nothing is converted or buffered while INFO is disabled. The root logger
+        caches that decision until logging is reconfigured.
+        """
+        if file is not None:
+            _original_print(*args, sep=sep, end=end, file=file, flush=flush)
+            return
+        if not logging.root.isEnabledFor(logging.INFO):
+            return
+        _print_stream.write((" " if sep is None else sep).join(map(str, args)) + ("\n" if end is None else end))
+        if flush:
+            _print_stream.flush()
 
     @staticmethod
     def _initialize_log_files(log_dir, log_files) -> None:
@@ -57,6 +138,50 @@ class LoggingConfigSingleton(AbstractSingleton):
                 f"Failed to load logging configuration from '{config_path}': {e}"
             )
 
+    @staticmethod
+    def _override_rotation(rotation: Dict[str, object]) -> None:
+        """Override the limits of the rotating file handlers of the root logger."""
+        for handler in logging.root.handlers:
+            if isinstance(handler, RotatingCompressingFileHandler):
+                for name, value in rotation.items():
+                    setattr(handler, name, value)
+
+    @staticmethod
+    def _use_json_format() -> None:
+        """Write the log files of the root logger as JSON lines."""
+        for handler in logging.root.handlers:
+            if isinstance(handler, logging.FileHandler):
+                handler.setFormatter(JsonLinesFormatter())
+
+    def _install_filters(self, handler: BoundedQueueHandler) -> Optional[DroppedRecordReporter]:
+        """Add the configured filters to the queue handler and report what they and the queue drop."""
+        filters = []
+        if self.filters.get("debug_sample_rate") is not None:
+            filters.append(SamplingFilter(self.filters["debug_sample_rate"]))
+        if self.filters.get("collapse_repeats"):
+            filters.append(RepeatCollapsingFilter(handler))
+        if self.filters.get("rate_limit"):
+            filters.append(TokenBucketFilter(self.filters["rate_limit"], self.filters.get("rate_burst")))
+        for log_filter in filters:
+            handler.addFilter(log_filter)
+        if not filters and handler.overflow == "block":
+            return None
+        reporter = DroppedRecordReporter(filters + [handler], self.filters.get("report_interval", 60.0))
+        reporter.start()
+        # Registered after the queue pipeline, so the last report is written before it stops
+        atexit.register(reporter.stop)
+        return reporter
+
+    def _enable_reconfiguration(self) -> None:
+        """Reload the log levels on SIGHUP, and accept level changes on the control socket, if configured."""
+        if self.reload_signal:
+            install_reload_signal(self.config_path)
+        if self.control_socket:
+            try:
+                start_control_server(self.control_socket, self.config_path)
+            except OSError as e:
+                logging.warning("Log control socket %s not started: %s", self.control_socket, e)
+
     @staticmethod
     def redirect_print_to_logger(custom_printer=_custom_print) -> None:
         """Redirect print statements to the logger."""
@@ -66,12 +191,27 @@ class LoggingConfigSingleton(AbstractSingleton):
     def _redirect_stdout_stderr_to_logger() -> None:
         """Redirect stdout and stderr to the logger using the enhanced LoggerStream."""
         logger = logging.getLogger()
-        sys.stdout = LoggerStream(logger.debug)
-        sys.stderr = LoggerStream(logger.error)
+        sys.stdout = LoggerStream(logger.debug, is_enabled=partial(logger.isEnabledFor, logging.DEBUG))
+        sys.stderr = LoggerStream(logger.error, is_enabled=partial(logger.isEnabledFor, logging.ERROR))
 
     def _setup(self) -> None:
         """Perform the full logger setup."""
+        install_context_factory()
+        if is_forwarding():
+            # A pool worker: the aggregating process alone writes the log files
+            self.redirect_print_to_logger()
+            self._redirect_stdout_stderr_to_logger()
+            return
         self._initialize_log_files(self.log_dir, self.log_files)
         self.load_logging_config(self.config_path)
+        self._override_rotation(self.rotation)
+        if self.log_format == "json":
+            self._use_json_format()
+        if self.flight_recorder is not None:
+            install_flight_recorder(logging.root, **self.flight_recorder)
+        # Callers only enqueue records, one background thread formats and writes them
+        pipeline = install_queue_pipeline(logging.root, self.max_queue_size, self.overflow)
+        self._install_filters(pipeline.queue_handler)
+        self._enable_reconfiguration()
         self.redirect_print_to_logger()
         self._redirect_stdout_stderr_to_logger()
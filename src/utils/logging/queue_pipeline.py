@@ -0,0 +1,166 @@
+import atexit
+import copy
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+_exception_formatter = logging.Formatter()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler for a bounded queue, with a policy for when the queue is full."""
+
+    def __init__(self, record_queue: queue.Queue, overflow: str = "block"):
+        """
+        Initialize the handler.
+
+        Args:
+            record_queue (queue.Queue): The queue the listener reads from.
+            overflow (str): "block" waits for room, "drop_newest" discards the new
+                record and "drop_oldest" discards the oldest queued record instead.
+
+        Raises:
+            ValueError: If the overflow policy is unknown.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy '{overflow}'. Choose one of: {', '.join(OVERFLOW_POLICIES)}."
+            )
+        super().__init__(record_queue)
+        self.overflow = overflow
+        self.dropped = 0
+        self._reported = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepare a copy of a record for the listener thread.
+
+        Unlike QueueHandler.prepare, the traceback is not folded into the message:
+        the message is merged with its arguments, the traceback is formatted into
+        exc_text and the stack is kept, so the formatters behind the queue still
+        render them as their own fields.
+        """
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        # Tracebacks hold frames, which must not outlive the call or cross processes
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record, applying the overflow policy if the queue is full."""
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                if self.overflow == "drop_newest":
+                    self.dropped += 1
+                    return
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                # The listener emptied the queue meanwhile, try again
+                pass
+
+    def take_dropped(self) -> int:
+        """Return the number of records dropped since the last call."""
+        dropped = self.dropped
+        new_drops, self._reported = dropped - self._reported, dropped
+        return new_drops
+
+
+class _DrainingQueueListener(QueueListener):
+    """QueueListener whose stop waits for room instead of failing on a full queue."""
+
+    def enqueue_sentinel(self) -> None:
+        """Enqueue the sentinel behind every queued record."""
+        self.queue.put(self._sentinel)
+
+
+class QueuePipeline:
+    """Moves the handlers of a logger behind a queue served by one background thread."""
+
+    def __init__(self, logger: logging.Logger, max_queue_size: int = 10000, overflow: str = "block"):
+        """
+        Initialize the pipeline.
+
+        Args:
+            logger (logging.Logger): The logger whose handlers are moved to the background thread.
+            max_queue_size (int): The maximum number of queued records.
+            overflow (str): The overflow policy, one of OVERFLOW_POLICIES.
+        """
+        self.logger = logger
+        self.handlers: List[logging.Handler] = list(logger.handlers)
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.queue_handler = BoundedQueueHandler(self.queue, overflow)
+        self.listener = _DrainingQueueListener(self.queue, *self.handlers, respect_handler_level=True)
+
+    def start(self) -> None:
+        """Swap the handlers of the logger for the queue handler and start the listener."""
+        for handler in self.handlers:
+            self.logger.removeHandler(handler)
+        self.logger.addHandler(self.queue_handler)
+        self.listener.start()
+
+    def stop(self) -> None:
+        """Write every queued record, stop the listener and give the handlers back to the logger."""
+        self.logger.removeHandler(self.queue_handler)
+        self.listener.stop()
+        for handler in self.handlers:
+            self.logger.addHandler(handler)
+            handler.flush()
+
+
+_pipeline: Optional[QueuePipeline] = None
+_exit_hook_registered = False
+_lock = threading.Lock()
+
+
+def install_queue_pipeline(
+    logger: logging.Logger = None, max_queue_size: int = 10000, overflow: str = "block"
+) -> QueuePipeline:
+    """Install a queue pipeline in front of a logger, replacing a previously installed one.
+
+    The pipeline is stopped at interpreter exit, so queued records are written
+    before the logging module closes the handlers.
+
+    Args:
+        logger (logging.Logger): The logger to install the pipeline on. Defaults to the root logger.
+        max_queue_size (int): The maximum number of queued records.
+        overflow (str): The overflow policy, one of OVERFLOW_POLICIES.
+
+    Returns:
+        QueuePipeline: The running pipeline.
+    """
+    global _pipeline, _exit_hook_registered
+    with _lock:
+        if _pipeline is not None:
+            _pipeline.stop()
+            _pipeline = None
+        if not _exit_hook_registered:
+            atexit.register(stop_queue_pipeline)
+            _exit_hook_registered = True
+        _pipeline = QueuePipeline(logger or logging.root, max_queue_size, overflow)
+        _pipeline.start()
+        return _pipeline
+
+
+def stop_queue_pipeline() -> None:
+    """Stop the installed queue pipeline, if any, writing every queued record."""
+    global _pipeline
+    with _lock:
+        pipeline, _pipeline = _pipeline, None
+    if pipeline is not None:
+        pipeline.stop()
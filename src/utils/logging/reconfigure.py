@@ -0,0 +1,242 @@
+import atexit
+import configparser
+import logging
+import os
+import signal
+import socketserver
+import threading
+from typing import Dict, Mapping, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_server: Optional["ControlServer"] = None
+_lock = threading.Lock()
+
+# Unix sockets are missing on some platforms, e.g. Windows; there the control server is unavailable
+_UnixStreamServer = getattr(socketserver, "UnixStreamServer", socketserver.TCPServer)
+
+
+def _to_level(level: Union[int, str]) -> int:
+    """Convert a level number or name to a level number.
+
+    Raises:
+        ValueError: If the level is unknown.
+    """
+    if isinstance(level, int):
+        return level
+    if level.strip().isdigit():
+        return int(level)
+    number = logging.getLevelName(level.strip().upper())
+    if not isinstance(number, int):
+        raise ValueError(f"Unknown log level '{level}'.")
+    return number
+
+
+def set_levels(levels: Mapping[str, Union[int, str]]) -> None:
+    """Change the levels of several loggers at once.
+
+    Every level is checked before any is applied, and the level caches of all
+    loggers are cleared once, so no logger sees a mix of old and new levels.
+
+    Args:
+        levels (Mapping[str, Union[int, str]]): Levels by logger name, "root" for the root logger.
+
+    Raises:
+        ValueError: If a level is unknown.
+    """
+    resolved = {name: _to_level(level) for name, level in levels.items()}
+    # The lock of the logging module, held by getLogger and the cache clearing as well
+    with logging._lock:
+        for name, level in resolved.items():
+            target = logging.root if name in ("", "root") else logging.Logger.manager.getLogger(name)
+            target.level = level
+        logging.Logger.manager._clear_cache()
+
+
+def get_levels() -> Dict[str, str]:
+    """Get the levels set on the root logger and on every other logger that has one."""
+    levels = {"root": logging.getLevelName(logging.root.level)}
+    for name, existing in sorted(logging.Logger.manager.loggerDict.items()):
+        if isinstance(existing, logging.Logger) and existing.level != logging.NOTSET:
+            levels[name] = logging.getLevelName(existing.level)
+    return levels
+
+
+def read_config_levels(config_path: str) -> Dict[str, str]:
+    """Read the logger levels of a logging configuration file.
+
+    Args:
+        config_path (str): The file in the format of logging.config.fileConfig.
+
+    Returns:
+        Dict[str, str]: Levels by logger name, "root" for the root logger.
+    """
+    parser = configparser.ConfigParser(interpolation=None, inline_comment_prefixes=("#",))
+    if not parser.read(config_path):
+        raise FileNotFoundError(f"Logging configuration not found: {config_path}")
+    levels = {}
+    for key in parser.get("loggers", "keys").split(","):
+        section = parser[f"logger_{key.strip()}"]
+        if "level" in section:
+            levels[section.get("qualname", "root")] = section["level"]
+    return levels
+
+
+def reload_levels(config_path: str) -> Dict[str, str]:
+    """Apply the logger levels of a logging configuration file.
+
+    Only levels are reloaded: the handlers belong to the queue pipeline, the
+    filters and the flight recorder, which a new fileConfig would tear down.
+
+    Args:
+        config_path (str): The file in the format of logging.config.fileConfig.
+
+    Returns:
+        Dict[str, str]: The applied levels.
+    """
+    levels = read_config_levels(config_path)
+    set_levels(levels)
+    logger.warning("Reloaded log levels from %s: %s", config_path, levels)
+    return levels
+
+
+def install_reload_signal(config_path: str, signum: int = None) -> None:
+    """Reload the logger levels of a configuration file on a signal.
+
+    The reload runs in its own thread, since the interrupted code may hold the
+    lock of the logging module.
+
+    Args:
+        config_path (str): The logging configuration file.
+        signum (int): The signal. Defaults to SIGHUP where available.
+    """
+    if signum is None:
+        signum = getattr(signal, "SIGHUP", None)
+        if signum is None:
+            return
+
+    def reload(*_):
+        threading.Thread(target=_reload_logged, args=(config_path,), name="log-level-reload").start()
+
+    try:
+        signal.signal(signum, reload)
+    except ValueError:
+        # Signal handlers can only be set from the main thread
+        logger.warning("Cannot reload the log levels on signal %s", signum)
+
+
+def _reload_logged(config_path: str) -> None:
+    """Reload the logger levels, logging instead of raising failures."""
+    try:
+        reload_levels(config_path)
+    except Exception:
+        logger.exception("Failed to reload the log levels from %s", config_path)
+
+
+class _ControlHandler(socketserver.StreamRequestHandler):
+    """Answers one command per line.
+
+    Commands:
+        level NAME=LEVEL [NAME=LEVEL ...]: Set logger levels at once, "root" for the root logger.
+        reload: Apply the levels of the logging configuration file.
+        levels: List the levels that are set.
+    """
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            command, _, arguments = line.decode("utf-8").strip().partition(" ")
+            try:
+                reply = self.server.execute(command, arguments.split())
+            except Exception as e:
+                reply = f"error: {e}"
+            self.wfile.write(reply.encode("utf-8") + b"\n")
+
+
+class ControlServer(socketserver.ThreadingMixIn, _UnixStreamServer):
+    """Local socket for changing the log levels of a running process."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str, config_path: str):
+        """
+        Initialize the server.
+
+        Args:
+            path (str): The path of the Unix socket, replaced if it exists.
+            config_path (str): The logging configuration file for the reload command.
+
+        Raises:
+            OSError: If the platform has no Unix sockets.
+        """
+        if _UnixStreamServer is socketserver.TCPServer:
+            raise OSError("Unix sockets are not available on this platform.")
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        super().__init__(path, _ControlHandler)
+        # Only the owner may change the levels
+        os.chmod(path, 0o600)
+        self.path = path
+        self.config_path = config_path
+        self._thread = threading.Thread(target=self.serve_forever, name="log-control", daemon=True)
+
+    def execute(self, command: str, arguments) -> str:
+        """Run a command and return the reply."""
+        if command == "level":
+            levels = dict(argument.split("=", 1) for argument in arguments)
+            if not levels:
+                raise ValueError("Expected NAME=LEVEL arguments.")
+            set_levels(levels)
+            logger.warning("Set log levels: %s", levels)
+            return "ok"
+        if command == "reload":
+            return "ok " + " ".join(f"{name}={level}" for name, level in reload_levels(self.config_path).items())
+        if command == "levels":
+            return "ok " + " ".join(f"{name}={level}" for name, level in get_levels().items())
+        raise ValueError(f"Unknown command '{command}'. Choose one of: level, reload, levels.")
+
+    def start(self) -> None:
+        """Start serving in a background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and remove the socket."""
+        self.shutdown()
+        self.server_close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def start_control_server(path: str, config_path: str) -> ControlServer:
+    """Start the shared control server, replacing a running one.
+
+    It is stopped at interpreter exit.
+
+    Args:
+        path (str): The path of the Unix socket.
+        config_path (str): The logging configuration file for the reload command.
+
+    Returns:
+        ControlServer: The running server.
+    """
+    global _server
+    with _lock:
+        if _server is not None:
+            _server.stop()
+        else:
+            atexit.register(stop_control_server)
+        _server = ControlServer(path, config_path)
+        _server.start()
+        return _server
+
+
+def stop_control_server() -> None:
+    """Stop the shared control server, if it is running."""
+    global _server
+    with _lock:
+        server, _server = _server, None
+    if server is not None:
+        server.stop()
@@ -0,0 +1,223 @@
+import gzip
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from logging.handlers import BaseRotatingHandler
+from typing import List, Optional
+
+# Suffix of the JSON index listing the rotated segments of a log file
+INDEX_SUFFIX = ".index.json"
+
+
+def get_index_path(base_filename: str) -> str:
+    """Get the path of the segment index of a log file."""
+    return base_filename + INDEX_SUFFIX
+
+
+def load_segment_index(base_filename: str) -> List[dict]:
+    """Load the rotated segments of a log file.
+
+    Args:
+        base_filename (str): The path of the active log file.
+
+    Returns:
+        List[dict]: Segments with their "file" name and the "start" and "end" timestamps
+            of the records they hold, oldest first. Empty if nothing was rotated yet.
+    """
+    try:
+        with open(get_index_path(base_filename)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def find_segments(base_filename: str, start: float = None, end: float = None) -> List[str]:
+    """Find the rotated segments that may hold records of a time range.
+
+    Args:
+        base_filename (str): The path of the active log file.
+        start (float): The start of the range as a Unix timestamp. Unbounded if None.
+        end (float): The end of the range as a Unix timestamp. Unbounded if None.
+
+    Returns:
+        List[str]: Paths of the overlapping segments, oldest first.
+    """
+    log_dir = os.path.dirname(base_filename)
+    return [
+        os.path.join(log_dir, segment["file"])
+        for segment in load_segment_index(base_filename)
+        if (start is None or segment["end"] >= start) and (end is None or segment["start"] <= end)
+    ]
+
+
+class RotatingCompressingFileHandler(BaseRotatingHandler):
+    """File handler rotating by size and by time, compressing rotated segments in the background.
+
+    Rotated files are named after the time their first record was written, gzipped
+    by a worker thread and listed with their time range in an index next to the
+    log file. Retention limits are applied after each compression.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = "a",
+        max_bytes: int = 0,
+        interval: float = 0,
+        backup_count: int = 0,
+        max_age: float = 0,
+        compress: bool = True,
+        encoding: Optional[str] = None,
+        delay: bool = False,
+    ):
+        """
+        Initialize the handler.
+
+        Args:
+            filename (str): The active log file.
+            mode (str): The mode the log file is opened with.
+            max_bytes (int): Rotate before the file grows beyond this size. Disabled if 0.
+            interval (float): Rotate once the active file is this many seconds old. Disabled if 0.
+            backup_count (int): How many rotated segments to keep. Unlimited if 0.
+            max_age (float): Delete segments whose last record is older than this many seconds. Disabled if 0.
+            compress (bool): Gzip rotated segments.
+            encoding (str): The encoding of the log file.
+            delay (bool): Open the log file on the first record only.
+        """
+        super().__init__(filename, mode, encoding=encoding, delay=delay)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.backup_count = backup_count
+        self.max_age = max_age
+        self.compress = compress
+        self.segment_start = self._get_segment_start()
+        self._jobs: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._index_lock = threading.Lock()
+
+    def _get_segment_start(self) -> float:
+        """Get the time the active segment was started, surviving restarts.
+
+        Without a creation time on the platform, the last modification of an
+        existing log file stands in for it.
+        """
+        try:
+            file_stat = os.stat(self.baseFilename)
+        except OSError:
+            return time.time()
+        if file_stat.st_size == 0:
+            return time.time()
+        return getattr(file_stat, "st_birthtime", file_stat.st_mtime)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Check if the record would exceed the size limit or the active file is too old."""
+        if self.interval and record.created >= self.segment_start + self.interval:
+            return True
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            if self.stream.tell() + len(self.format(record)) + len(self.terminator) >= self.max_bytes:
+                return self.stream.tell() > 0
+        return False
+
+    def _rotated_name(self, end: float) -> str:
+        """Name the active segment after the time it started.
+
+        Segments start when the previous one ended, so the start time down to the
+        microsecond is unique. Should a file of that name exist anyway, e.g. after
+        the clock was set back, the end time is appended.
+        """
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.segment_start))
+        name = f"{self.baseFilename}.{stamp}.{int(self.segment_start * 1e6) % 1000000:06d}"
+        if os.path.isfile(name) or os.path.isfile(name + ".gz"):
+            name = f"{name}-{int(end * 1e9)}"
+        return name
+
+    def doRollover(self) -> None:
+        """Close the active segment, hand it to the worker thread and start a new one."""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        end = time.time()
+        try:
+            has_records = os.stat(self.baseFilename).st_size > 0
+        except OSError:
+            has_records = False
+        if has_records:
+            rotated = self._rotated_name(end)
+            os.rename(self.baseFilename, rotated)
+            self._submit((rotated, self.segment_start, end))
+        self.segment_start = end
+        if not self.delay:
+            self.stream = self._open()
+
+    def _submit(self, job) -> None:
+        """Queue a rotated segment, starting the worker thread on first use."""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._work, name=f"log-rotation-{os.path.basename(self.baseFilename)}", daemon=True
+            )
+            self._worker.start()
+        self._jobs.put(job)
+
+    def _work(self) -> None:
+        """Compress, index and prune rotated segments until closed."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            try:
+                self._finish_segment(*job)
+            except Exception:
+                # Keep the uncompressed segment rather than losing the worker
+                logging.getLogger(__name__).exception("Failed to rotate log segment %s", job[0])
+
+    def _finish_segment(self, rotated: str, start: float, end: float) -> None:
+        """Compress one rotated segment, add it to the index and apply the retention limits."""
+        if self.compress:
+            with open(rotated, "rb") as source, gzip.open(rotated + ".gz", "wb") as target:
+                shutil.copyfileobj(source, target)
+            os.remove(rotated)
+            rotated += ".gz"
+        with self._index_lock:
+            segments = load_segment_index(self.baseFilename)
+            segments.append({"file": os.path.basename(rotated), "start": start, "end": end})
+            segments = self._apply_retention(segments, time.time())
+            index_path = get_index_path(self.baseFilename)
+            with open(index_path + ".tmp", "w") as f:
+                json.dump(segments, f)
+            os.replace(index_path + ".tmp", index_path)
+
+    def _apply_retention(self, segments: List[dict], now: float) -> List[dict]:
+        """Delete the segments beyond the retention limits at a point in time and return the rest."""
+        expired = []
+        if self.max_age:
+            cutoff = now - self.max_age
+            expired = [segment for segment in segments if segment["end"] < cutoff]
+            segments = [segment for segment in segments if segment["end"] >= cutoff]
+        if self.backup_count and len(segments) > self.backup_count:
+            expired += segments[:-self.backup_count]
+            segments = segments[-self.backup_count:]
+        log_dir = os.path.dirname(self.baseFilename)
+        for segment in expired:
+            try:
+                os.remove(os.path.join(log_dir, segment["file"]))
+            except FileNotFoundError:
+                pass
+        return segments
+
+    def wait_for_rotations(self) -> None:
+        """Block until every rotated segment is compressed and indexed."""
+        if self._worker is not None and self._worker.is_alive():
+            self._jobs.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def close(self) -> None:
+        """Finish pending rotations and close the log file."""
+        self.wait_for_rotations()
+        super().close()
@@ -1,44 +1,126 @@
+import os
 import pygame
 import time
 
 from src.utils.abstract.abstract_singleton import AbstractSingleton
+from src.utils.media.mixer_profiles import get_mixer_profile
+from src.utils.media.pcm_cache import get_pcm_cache_path, load_pcm_cache
+from src.utils.media.sound_manifest import resolve_sound_file
+from src.utils.media.synth import synthesize_tone
 
 
 class PygameMixerSoundSingleton(AbstractSingleton):
+    # Files larger than this are streamed through pygame.mixer.music instead
+    # of being decoded into memory as a whole.
+    STREAMING_THRESHOLD_BYTES = 1024 * 1024
 
     def __init__(self):
         self._sound = None
+        self._streaming = False
         if not self.test_initialization():
             raise Exception("More than one singleton attempted to be created")
         self.setup()
 
     def _setup(self) -> None:
-        """Initialize the pygame mixer and check for successful initialization."""
-        pygame.mixer.init()
+        """Initialize the pygame mixer with the configured mixer profile and check for successful initialization."""
+        pygame.mixer.init(**get_mixer_profile())
         if not pygame.mixer.get_init():
             raise RuntimeError(
                 "Mixer not initialized. "
                 "Ensure that your audio subsystem is set up correctly."
             )
 
+    def _should_stream(self, sound_file: str) -> bool:
+        """Check if a sound file is large enough to be streamed.
+
+        Args:
+            sound_file (str): The path to the sound file.
+
+        Returns:
+            bool: True if the file exceeds the streaming threshold, False otherwise.
+        """
+        try:
+            return os.path.getsize(sound_file) > self.STREAMING_THRESHOLD_BYTES
+        except OSError:
+            # Let pygame report missing or unreadable files when loading
+            return False
+
+    @staticmethod
+    def _load_pcm_cache(sound_file: str):
+        """Load the pre-rendered PCM file of a sound file, if there is a usable one.
+
+        Args:
+            sound_file (str): The path to the sound file.
+
+        Returns:
+            pygame.mixer.Sound: The sound, or None if there is no PCM file for the mixer format.
+        """
+        cache_file = get_pcm_cache_path(sound_file)
+        if not os.path.isfile(cache_file):
+            return None
+        try:
+            return load_pcm_cache(cache_file)
+        except ValueError:
+            # Rendered for another mixer format, fall back to decoding
+            return None
+
     def load_sound(self, sound_file: str) -> None:
         """Load a sound file.
 
+        Files above STREAMING_THRESHOLD_BYTES are streamed from disk so that
+        resident memory stays flat regardless of the track length. Otherwise a
+        pre-rendered PCM file next to the sound file is memory-mapped instead of
+        decoding the sound file. Sound files transcoded or deduplicated by the build
+        are looked up in the sound manifest first.
+
         Args:
             sound_file (str): The path to the sound file to load.
 
         Raises:
             RuntimeError: If there is an error loading the sound.
         """
-        self._sound = pygame.mixer.Sound(sound_file)
+        sound_file = resolve_sound_file(sound_file)
+        if self._should_stream(sound_file):
+            pygame.mixer.music.load(sound_file)
+            self._sound = None
+            self._streaming = True
+            return
+        self._sound = self._load_pcm_cache(sound_file) or pygame.mixer.Sound(sound_file)
+        self._streaming = False
+
+    def load_tone(self, kind: str = "beep", **tone_parameters) -> None:
+        """Load a synthesized alarm tone instead of a sound file.
+
+        Args:
+            kind (str): The tone kind, see synth.TONE_KINDS.
+            **tone_parameters: Further synthesize_tone arguments (frequency, duration, volume, fade).
+
+        Raises:
+            ValueError: If the mixer does not use signed 16-bit samples or the tone kind is unknown.
+        """
+        frequency, size, channels = pygame.mixer.get_init()
+        if size != -16:
+            raise ValueError(f"Synthesized tones need a signed 16-bit mixer, got size {size}.")
+        samples = synthesize_tone(kind, sample_rate=frequency, channels=channels, **tone_parameters)
+        self._sound = pygame.sndarray.make_sound(samples)
+        self._streaming = False
+
+    def _is_busy(self) -> bool:
+        """Check if the mixer is still playing the loaded sound."""
+        if self._streaming:
+            return pygame.mixer.music.get_busy()
+        return pygame.mixer.get_busy()
 
     def play_sound(self, until_time: int = None):
-        self._sound.play()
+        if self._streaming:
+            pygame.mixer.music.play()
+        else:
+            self._sound.play()
         if until_time:
             time.sleep(until_time)
             print(f"slept for seconds: {until_time}")
             return
-        while pygame.mixer.get_busy():
+        while self._is_busy():
             time.sleep(0.1)
 
     def is_sound_playing(self) -> bool:
@@ -47,6 +129,8 @@ class PygameMixerSoundSingleton(AbstractSingleton):
         Returns:
             bool: True if music is playing, False otherwise.
         """
+        if self._streaming:
+            return bool(pygame.mixer.music.get_busy())
         if not self._sound:
             return False
         return self._sound.get_num_channels() > 0
@@ -0,0 +1,32 @@
+from src.utils.env_checks.settings import get_settings
+
+# Keyword arguments for pygame.mixer.init. Output latency is roughly
+# buffer / frequency, so smaller buffers trade CPU wake-ups for latency.
+MIXER_PROFILES = {
+    "low-latency": {"frequency": 48000, "size": -16, "channels": 2, "buffer": 256},
+    "balanced": {"frequency": 44100, "size": -16, "channels": 2, "buffer": 512},
+    "low-cpu": {"frequency": 22050, "size": -16, "channels": 1, "buffer": 4096},
+}
+
+
+def get_mixer_profile(profile_name: str = None) -> dict:
+    """Get the pygame.mixer.init settings of a mixer profile.
+
+    Args:
+        profile_name (str): The profile name. Defaults to the MIXER_PROFILE setting.
+
+    Returns:
+        dict: The frequency, size, channels and buffer settings of the profile.
+
+    Raises:
+        ValueError: If the profile does not exist.
+    """
+    if profile_name is None:
+        profile_name = get_settings().mixer_profile
+    try:
+        return dict(MIXER_PROFILES[profile_name])
+    except KeyError:
+        raise ValueError(
+            f"Unknown mixer profile '{profile_name}'. "
+            f"Choose one of: {', '.join(MIXER_PROFILES)}."
+        )
@@ -0,0 +1,138 @@
+import argparse
+import mmap
+import os
+import struct
+
+import pygame
+
+from src.utils.media.mixer_profiles import get_mixer_profile
+
+PCM_EXTENSION = ".pcm"
+
+# Extensions of the sound files pygame decodes; other files, e.g. a README or the sound manifest, are not rendered
+SOUND_EXTENSIONS = (".wav", ".ogg", ".mp3", ".flac", ".opus")
+
+# magic, frequency, size (signed bits), channels, data length in bytes
+_HEADER = struct.Struct("<4sIhHQ")
+_MAGIC = b"PCM1"
+
+
+def get_pcm_cache_path(sound_file: str) -> str:
+    """Get the path of the pre-rendered PCM file for a sound file.
+
+    Args:
+        sound_file (str): The path to the source sound file.
+
+    Returns:
+        str: The sound file path with its extension replaced by PCM_EXTENSION.
+    """
+    return os.path.splitext(sound_file)[0] + PCM_EXTENSION
+
+
+def _get_mixer_format() -> tuple:
+    """Get the (frequency, size, channels) the mixer was initialized with.
+
+    Raises:
+        RuntimeError: If the mixer is not initialized.
+    """
+    mixer_format = pygame.mixer.get_init()
+    if not mixer_format:
+        raise RuntimeError("Mixer not initialized. Call pygame.mixer.init() first.")
+    return mixer_format
+
+
+def render_pcm_cache(sound_file: str, cache_file: str = None) -> str:
+    """Decode a sound file to raw PCM in the current mixer format.
+
+    Args:
+        sound_file (str): The path to the sound file to decode.
+        cache_file (str): The output path. Defaults to get_pcm_cache_path(sound_file).
+
+    Returns:
+        str: The path of the written PCM file.
+
+    Raises:
+        RuntimeError: If the mixer is not initialized.
+    """
+    frequency, size, channels = _get_mixer_format()
+    cache_file = cache_file or get_pcm_cache_path(sound_file)
+    raw = pygame.mixer.Sound(sound_file).get_raw()
+    with open(cache_file, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, frequency, size, channels, len(raw)))
+        f.write(raw)
+    return cache_file
+
+
+def load_pcm_cache(cache_file: str) -> pygame.mixer.Sound:
+    """Build a Sound from a memory-mapped pre-rendered PCM file.
+
+    Args:
+        cache_file (str): The path to the PCM file.
+
+    Returns:
+        pygame.mixer.Sound: The sound, created without decoding or resampling.
+
+    Raises:
+        ValueError: If the file is not a PCM cache or was rendered for a different mixer format.
+    """
+    mixer_format = _get_mixer_format()
+    with open(cache_file, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        if len(mapped) < _HEADER.size:
+            raise ValueError(f"'{cache_file}' is not a PCM cache file.")
+        magic, frequency, size, channels, length = _HEADER.unpack_from(mapped)
+        if magic != _MAGIC or len(mapped) != _HEADER.size + length:
+            raise ValueError(f"'{cache_file}' is not a PCM cache file.")
+        if (frequency, size, channels) != tuple(mixer_format):
+            raise ValueError(
+                f"'{cache_file}' was rendered for {(frequency, size, channels)}, "
+                f"mixer is {tuple(mixer_format)}."
+            )
+        with memoryview(mapped)[_HEADER.size:] as data:
+            # pygame copies the buffer, so the mapping can be closed afterwards
+            return pygame.mixer.Sound(buffer=data)
+
+
+def render_pcm_directory(source_dir: str, output_dir: str = None) -> list:
+    """Pre-render every sound file in a directory.
+
+    Only files with one of the SOUND_EXTENSIONS are rendered.
+
+    Args:
+        source_dir (str): The directory containing the sound files.
+        output_dir (str): Where to write the PCM files. Defaults to source_dir.
+
+    Returns:
+        list: The paths of the written PCM files.
+    """
+    output_dir = output_dir or source_dir
+    os.makedirs(output_dir, exist_ok=True)
+    rendered = []
+    for file_name in sorted(os.listdir(source_dir)):
+        sound_file = os.path.join(source_dir, file_name)
+        if not os.path.isfile(sound_file) or not file_name.lower().endswith(SOUND_EXTENSIONS):
+            continue
+        cache_file = os.path.join(output_dir, os.path.basename(get_pcm_cache_path(sound_file)))
+        rendered.append(render_pcm_cache(sound_file, cache_file))
+    return rendered
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Pre-render sound files to raw PCM in the mixer format."
+    )
+    parser.add_argument("source_dir", help="Directory containing the sound files.")
+    parser.add_argument(
+        "--output-dir", default=None, help="Output directory (defaults to source_dir)."
+    )
+    parser.add_argument(
+        "--mixer-profile",
+        default=None,
+        help="Mixer profile to render for (defaults to the MIXER_PROFILE environment variable).",
+    )
+    args = parser.parse_args()
+
+    pygame.mixer.init(**get_mixer_profile(args.mixer_profile))
+    for path in render_pcm_directory(args.source_dir, args.output_dir):
+        print(f"Rendered {path}")
@@ -0,0 +1,42 @@
+import json
+import os
+from functools import lru_cache
+
+# Written next to the bundled sounds by infra/build_and_upload.py when the
+# build transcodes or deduplicates them.
+SOUND_MANIFEST = "sounds_manifest.json"
+
+
+@lru_cache(maxsize=None)
+def load_sound_manifest(sound_dir: str) -> dict:
+    """Load the sound manifest of a directory.
+
+    Bundled directories never change while running, so the result is cached.
+
+    Args:
+        sound_dir (str): The directory containing the sounds.
+
+    Returns:
+        dict: Original file names mapped to bundled file names, empty if there is no manifest.
+    """
+    manifest_path = os.path.join(sound_dir, SOUND_MANIFEST)
+    if not os.path.isfile(manifest_path):
+        return {}
+    with open(manifest_path) as f:
+        return json.load(f)
+
+
+def resolve_sound_file(sound_file: str) -> str:
+    """Map a configured sound file to the file the build bundled for it.
+
+    Args:
+        sound_file (str): The configured path, e.g. from SOUND_FILE.
+
+    Returns:
+        str: The bundled file path, or sound_file if the manifest does not list it.
+    """
+    sound_dir, file_name = os.path.split(sound_file)
+    bundled_name = load_sound_manifest(sound_dir).get(file_name)
+    if bundled_name is None:
+        return sound_file
+    return os.path.join(sound_dir, bundled_name)
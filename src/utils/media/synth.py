@@ -0,0 +1,82 @@
+import random
+from functools import lru_cache
+
+import numpy as np
+
+TONE_KINDS = ("beep", "chime", "sweep")
+
+# Pentatonic pitches so random alarms always sound pleasant
+_RANDOM_FREQUENCIES = (523.25, 587.33, 659.25, 783.99, 880.0, 1046.5)
+
+
+def _waveform(kind: str, frequency: float, duration: float, t: np.ndarray) -> np.ndarray:
+    """Build the raw waveform of a tone kind in the range [-1, 1]."""
+    if kind == "beep":
+        return np.sin(2 * np.pi * frequency * t)
+    if kind == "chime":
+        # Inharmonic partials with an exponential decay, like a struck bell
+        partials = (
+            np.sin(2 * np.pi * frequency * t)
+            + 0.5 * np.sin(2 * np.pi * 2.76 * frequency * t)
+            + 0.25 * np.sin(2 * np.pi * 5.4 * frequency * t)
+        )
+        return partials / 1.75 * np.exp(-4.0 * t / duration)
+    if kind == "sweep":
+        # Linear chirp rising one octave over the duration
+        return np.sin(2 * np.pi * (frequency * t + frequency * t * t / (2 * duration)))
+    raise ValueError(f"Unknown tone kind '{kind}'. Choose one of: {', '.join(TONE_KINDS)}.")
+
+
+@lru_cache(maxsize=32)
+def synthesize_tone(
+    kind: str = "beep",
+    frequency: float = 880.0,
+    duration: float = 0.5,
+    volume: float = 0.5,
+    fade: float = 0.01,
+    sample_rate: int = 44100,
+    channels: int = 2,
+) -> np.ndarray:
+    """Synthesize a 16-bit alarm tone.
+
+    Results are cached by their parameters and returned read-only, so repeated
+    alarms cost nothing after the first call.
+
+    Args:
+        kind (str): One of TONE_KINDS.
+        frequency (float): The base frequency in Hz.
+        duration (float): The length of the tone in seconds.
+        volume (float): The peak amplitude between 0 and 1.
+        fade (float): The length of the linear fade in and fade out in seconds.
+        sample_rate (int): The sample rate in Hz.
+        channels (int): The number of channels.
+
+    Returns:
+        np.ndarray: int16 samples, shaped (frames,) for mono or (frames, channels) otherwise.
+
+    Raises:
+        ValueError: If the tone kind is unknown.
+    """
+    t = np.arange(int(duration * sample_rate)) / sample_rate
+    envelope = np.clip(np.minimum(t, duration - t) / fade, 0.0, 1.0) if fade > 0 else 1.0
+    samples = (_waveform(kind, frequency, duration, t) * envelope * volume * 32767).astype(np.int16)
+    if channels > 1:
+        samples = np.ascontiguousarray(np.repeat(samples[:, np.newaxis], channels, axis=1))
+    samples.flags.writeable = False
+    return samples
+
+
+def random_tone_parameters(seed=None) -> dict:
+    """Pick tone parameters for a per-session distinct alarm.
+
+    Args:
+        seed: Seed for the random generator. Defaults to system randomness.
+
+    Returns:
+        dict: The kind and frequency keyword arguments for synthesize_tone.
+    """
+    generator = random.Random(seed)
+    return {
+        "kind": generator.choice(TONE_KINDS),
+        "frequency": generator.choice(_RANDOM_FREQUENCIES),
+    }
@@ -2,32 +2,124 @@ import os
 import sys
 import importlib
 from src.utils.abstract.abstract_runner import AbstractRunner
-from src.utils.env_checks.env_checks import load_environment_variables, get_env_var
+from src.utils.env_checks.env_loader import load_layered_environment
+from src.utils.env_checks.path_resolver import anchor_path, start_path_watch
+from src.utils.env_checks.settings import get_settings
+from src.utils.logging.context import log_context
 from src.utils.logging.logging_config_singleton import LoggingConfigSingleton
 from src.utils.abstract.abstract_singleton import AbstractSingleton
+from src.utils.module.preflight import format_problems, run_preflight
+
+# Name of the module runner's own entry in the preflight reports
+MODULE_RUNNER = "module_runner"
 
 
 class ModuleRunnerSingleton(AbstractSingleton):
+    # Passing preflight reports per runner name, kept for every later run()
+    _preflight_reports = {}
+
     def __init__(self):
         pass
 
     def _setup(self):
-        """Initialize environment variables and logging."""
+        """Initialize environment variables, run the preflight checks and set up logging."""
         if getattr(sys, "frozen", False):
             # If the script is frozen (e.g., PyInstaller executable)
             env_file_path = os.path.join(sys._MEIPASS, ".env")
-            load_environment_variables(env_file_path)
-            get_env_var("LOG_CONFIG_FILE")
+            load_layered_environment(env_file_path)
+            self.preflight()
+            self._start_path_watch()
             return
 
-        load_environment_variables(".env")
+        load_layered_environment(".env")
+        self.preflight()
+        self._start_path_watch()
         # Set up logging
+        settings = get_settings()
         logger_setup = LoggingConfigSingleton(
-            config_path=get_env_var("LOG_CONFIG_FILE"), 
-            log_dir=os.path.join("resources", "logs")
+            config_path=settings.require("log_config_file"),
+            log_dir=os.path.join("resources", "logs"),
+            max_queue_size=settings.log_queue_size,
+            overflow=settings.log_queue_overflow,
+            rotation={
+                name: value
+                for name, value in (
+                    ("max_bytes", settings.log_max_bytes),
+                    ("interval", settings.log_rotate_seconds),
+                    ("backup_count", settings.log_backup_count),
+                    ("max_age", settings.log_max_age_seconds),
+                )
+                if value is not None
+            },
+            log_format=settings.log_format,
+            filters={
+                "rate_limit": settings.log_rate_limit,
+                "rate_burst": settings.log_rate_burst,
+                "debug_sample_rate": settings.log_debug_sample_rate,
+                "collapse_repeats": settings.log_collapse_repeats,
+                "report_interval": settings.log_dropped_report_seconds,
+            },
+            flight_recorder=(
+                {
+                    "capacity": settings.log_flight_recorder_records or 0,
+                    "max_bytes": settings.log_flight_recorder_bytes or 0,
+                }
+                if settings.log_flight_recorder_records or settings.log_flight_recorder_bytes
+                else None
+            ),
+            control_socket=anchor_path(settings.log_control_socket) if settings.log_control_socket else None,
+            reload_signal=settings.log_reload_signal,
         )
         logger_setup.setup()
 
+    @staticmethod
+    def _start_path_watch():
+        """Watch the resolved paths for changes if PATH_WATCH_INTERVAL is set, for long-running use."""
+        interval = get_settings().path_watch_interval
+        if interval:
+            start_path_watch(interval)
+
+    @staticmethod
+    def _requirements():
+        """Requirements of the module runner itself."""
+        if getattr(sys, "frozen", False):
+            # The logging config is not bundled, only its setting has to exist
+            return {"env_vars": ["LOG_CONFIG_FILE"]}
+        return {"files": ["LOG_CONFIG_FILE"]}
+
+    def preflight(self):
+        """Check what the module runner itself needs, before anything else runs.
+
+        Raises:
+            RuntimeError: Listing every problem of the module runner.
+        """
+        report = run_preflight({MODULE_RUNNER: self._requirements()})[MODULE_RUNNER]
+        if report.problems:
+            raise RuntimeError(format_problems({MODULE_RUNNER: report}))
+
+    def preflight_runner(self, module_name: str, runner: AbstractRunner):
+        """Check what a runner declares it needs, all at once, before it starts.
+
+        Passing reports are kept, so repeated runs of a runner do not check again.
+
+        Args:
+            module_name (str): The module name of the runner.
+            runner (AbstractRunner): The runner instance.
+
+        Returns:
+            PreflightReport: The report of the runner.
+
+        Raises:
+            RuntimeError: Listing every problem of the runner.
+        """
+        report = self._preflight_reports.get(module_name)
+        if report is None:
+            report = run_preflight({module_name: runner.resource_requirements})[module_name]
+            if report.problems:
+                raise RuntimeError(format_problems({module_name: report}))
+            self._preflight_reports[module_name] = report
+        return report
+
     @staticmethod
     def create_runner(module_name):
         """
@@ -47,7 +139,10 @@ class ModuleRunnerSingleton(AbstractSingleton):
                 raise ValueError(
                     f"No runner class found or class does not inherit from AbstractRunner in {module_name}."
                 )
-        except ImportError:
+        except ImportError as e:
+            if e.name not in (None, "src.runners", f"src.runners.{module_name}"):
+                # The runner exists, but one of its dependencies is not installed
+                raise ValueError(f"Module '{module_name}' could not be imported: {e}")
             raise ValueError(
                 f"Module '{module_name}' not found. Please check the module name."
             )
@@ -55,4 +150,6 @@ class ModuleRunnerSingleton(AbstractSingleton):
     def run(self, module_name: str, module_args: list):
         """Main function to dynamically load and execute the runner for a module."""
         runner = self.create_runner(module_name)
-        runner.run(*module_args)
+        runner.resolved_paths = dict(self.preflight_runner(module_name, runner).paths)
+        with log_context(runner=module_name):
+            runner.run(*module_args)
@@ -0,0 +1,106 @@
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from src.utils.env_checks.env_checks import get_env_var
+from src.utils.env_checks.path_resolver import anchor_path
+from src.utils.media.sound_manifest import resolve_sound_file
+
+# Requirement kind -> (stat mode check, label used in problem messages)
+_PATH_KINDS = {
+    "files": (stat.S_ISREG, "file"),
+    "sound_files": (stat.S_ISREG, "file"),
+    "directories": (stat.S_ISDIR, "directory"),
+}
+
+# Requirement kind -> mapping of the anchored path to the path that is checked
+_PATH_MAPPINGS = {
+    # Builds may bundle a transcoded file under another name, listed in the sound manifest
+    "sound_files": resolve_sound_file,
+}
+
+
+@dataclass(frozen=True)
+class PreflightReport:
+    """Outcome of the preflight checks of one runner."""
+
+    paths: Dict[str, str] = field(default_factory=dict)
+    problems: List[str] = field(default_factory=list)
+
+
+def _stat(path: str):
+    """Stat a path, returning None if it does not exist or is not accessible."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def run_preflight(requirements: Dict[str, dict], max_workers: int = 8) -> Dict[str, PreflightReport]:
+    """Check the declared requirements of several runners in one pass.
+
+    Each requirement dict may list environment variable names under "env_vars",
+    which must be set, and under "files" and "directories", which must also hold
+    paths to existing files or directories. Names under "sound_files" are files
+    mapped through the sound manifest of their directory first. Relative paths
+    are anchored at the project root. Every path is stat'ed once, concurrently.
+
+    Args:
+        requirements (Dict[str, dict]): Requirement dicts keyed by runner name.
+        max_workers (int): The maximum number of concurrent stat calls.
+
+    Returns:
+        Dict[str, PreflightReport]: The resolved paths and all problems, keyed by runner name.
+    """
+    pending = {}
+    paths_to_stat = set()
+    for name, runner_requirements in requirements.items():
+        paths, problems, checks = {}, [], []
+        for env_var in runner_requirements.get("env_vars", []):
+            try:
+                get_env_var(env_var)
+            except KeyError as e:
+                problems.append(e.args[0])
+        for kind in _PATH_KINDS:
+            for env_var in runner_requirements.get(kind, []):
+                try:
+                    path = anchor_path(get_env_var(env_var))
+                except KeyError as e:
+                    problems.append(e.args[0])
+                    continue
+                if kind in _PATH_MAPPINGS:
+                    path = _PATH_MAPPINGS[kind](path)
+                paths[env_var] = path
+                checks.append((env_var, path, kind))
+                paths_to_stat.add(path)
+        pending[name] = (paths, problems, checks)
+
+    stats = {}
+    if paths_to_stat:
+        paths_to_stat = sorted(paths_to_stat)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(paths_to_stat))) as executor:
+            stats = dict(zip(paths_to_stat, executor.map(_stat, paths_to_stat)))
+
+    reports = {}
+    for name, (paths, problems, checks) in pending.items():
+        for env_var, path, kind in checks:
+            is_kind, label = _PATH_KINDS[kind]
+            path_stat = stats[path]
+            if path_stat is None:
+                problems.append(f"{env_var} {label} not found at path: {path}")
+            elif not is_kind(path_stat.st_mode):
+                problems.append(f"{env_var} is not a {label}: {path}")
+        reports[name] = PreflightReport(paths=paths, problems=problems)
+    return reports
+
+
+def format_problems(reports: Dict[str, PreflightReport]) -> str:
+    """Format the problems of several preflight reports as one message."""
+    lines = [
+        f"  - {name}: {problem}"
+        for name, report in reports.items()
+        for problem in report.problems
+    ]
+    return "Preflight checks failed:\n" + "\n".join(lines)
@@ -1,11 +1,14 @@
 from contextlib import contextmanager
 from unittest.mock import MagicMock
 from src.utils.test.mock_patching_strategies import (
+    AttributePatcher,
     AttributePatcherStrategy,
     MappingPatcherStrategy,
     MethodPatcherStrategy,
     ClassPatcherStrategy,
+    PatchBatch,
 )
+from src.utils.test.mock_stubs import Stub
 
 
 class MockContextManager:
@@ -20,7 +23,20 @@ class MockContextManager:
         attribute_values=None,
         mapping_values=None,
         class_values=None,
+        lightweight=False,
     ):
+        """
+        Initialize the manager.
+
+        Args:
+            target_path (str): The module or object the names are patched on.
+            method_behaviors (dict): Side effects or return values by method name.
+            attribute_values (dict): Values by attribute name.
+            mapping_values (dict): Mappings backing dictionary-like objects by name.
+            class_values (dict): Method return values by class name.
+            lightweight (bool): Patch mappings and classes with slotted stubs instead of MagicMocks,
+                which are much cheaper to create but only support the usual call assertions.
+        """
         if not isinstance(target_path, str):
             raise TypeError(f"target_path should be a string, got {type(target_path)}")
 
@@ -33,66 +49,122 @@ class MockContextManager:
         self.strategies = {
             "method": MethodPatcherStrategy(),
             "attribute": AttributePatcherStrategy(),
-            "mapping": MappingPatcherStrategy(),
-            "class": ClassPatcherStrategy(),
+            "mapping": MappingPatcherStrategy(lightweight),
+            "class": ClassPatcherStrategy(lightweight),
         }
         self.active_mocks = {}
         self.active_patchers = {}
+        # Batches of the patchers waiting to be started, by owner
+        self._pending = {}
+        # Started batches, and the batch of each name patched through one
+        self._batches = []
+        self._batched = {}
+        # Nesting depth of the with blocks (update_patch and remove_patch included) holding the patches
+        self._depth = 0
+        self._applied = False
 
     def _apply_patches(self, patch_type, patch_items):
-        """Applies patches using the specified strategy."""
+        """Applies patches using the specified strategy.
+
+        Patchers of an attribute of a resolved owner are batched with the other
+        attributes of the owner and started by _start_batches, the others right away.
+        """
         strategy = self.strategies[patch_type]
         for name, value in patch_items.items():
             patcher = strategy.execute(self.target_path, name, value)
+            if isinstance(patcher, AttributePatcher) and patcher.batchable:
+                key = id(patcher.owner)
+                if key not in self._pending:
+                    self._pending[key] = PatchBatch(patcher.owner)
+                self._pending[key].add(patcher)
+                self._batched[name] = (self._pending[key], patcher)
+                self.active_patchers[name] = patcher
+                continue
             mock_obj = patcher.start()
             self.active_mocks[name] = mock_obj
             self.active_patchers[name] = patcher
 
-    @contextmanager
-    def update_patch(self, name, new_value):
-        """Temporarily updates a patch for a specific method, attribute, or dict."""
-        self.apply_all_patches()
-        if name not in self.active_patchers:
-            raise KeyError(f"'{name}' is not patched.")
-
+    def _start_batches(self):
+        """Starts the pending batches, one patch.multiple per owner."""
+        pending, self._pending = self._pending, {}
+        names = {id(patcher): name for name, (_, patcher) in self._batched.items()}
+        for batch in pending.values():
+            values = batch.start()
+            self._batches.append(batch)
+            for patcher in batch.patchers:
+                self.active_mocks[names[id(patcher)]] = values[patcher.attribute]
+
+    def _swap_patcher(self, name, new_patcher):
+        """Replaces the active patcher of a name, returning the new mock and the replaced patcher."""
         old_patcher = self.active_patchers.pop(name)
-        self.active_mocks.pop(name)
-
+        self.active_mocks.pop(name, None)
         old_patcher.stop()
-
-        patch_type = self._get_patch_type(name)
-        strategy = self.strategies[patch_type]
-
-        new_patcher = strategy.execute(self.target_path, name, new_value)
+        if new_patcher is None:
+            return None, old_patcher
         new_mock = new_patcher.start()
-
         self.active_patchers[name] = new_patcher
         self.active_mocks[name] = new_mock
+        return new_mock, old_patcher
 
-        try:
-            yield new_mock
-        finally:
-            new_patcher.stop()
-            restored_mock = old_patcher.start()
-            self.active_patchers[name] = old_patcher
-            self.active_mocks[name] = restored_mock
-
-    @contextmanager
-    def remove_patch(self, name):
-        """Temporarily removes a patch for a method, attribute, or dict."""
-        self.apply_all_patches()
-        if name not in self.active_patchers:
+    def _check_patched(self, name):
+        """Raises a KeyError if a name is not configured, before anything is applied."""
+        if self._get_patch_type(name) is None:
             raise KeyError(f"'{name}' is not patched.")
-        old_patcher = self.active_patchers.pop(name)
-        old_patcher.stop()
-        self.active_mocks.pop(name, None)
 
-        try:
-            yield
-        finally:
-            new_mock = old_patcher.start()
-            self.active_patchers[name] = old_patcher
+    @contextmanager
+    def update_patch(self, name, new_value):
+        """Temporarily updates a patch for a specific method, attribute, or dict.
+
+        The new patch is started on top of the current one, which stays in place
+        and is back when the block ends. Outside of a with block of the manager,
+        the other patches are applied for the duration of the update.
+        """
+        self._check_patched(name)
+        with self:
+            if name not in self.active_patchers:
+                raise KeyError(f"'{name}' is not patched.")
+            strategy = self.strategies[self._get_patch_type(name)]
+            new_patcher = strategy.execute(self.target_path, name, new_value)
+            old_patcher, old_mock = self.active_patchers[name], self.active_mocks.get(name)
+            new_mock = new_patcher.start()
+            self.active_patchers[name] = new_patcher
             self.active_mocks[name] = new_mock
+            try:
+                yield new_mock
+            finally:
+                new_patcher.stop()
+                self.active_patchers[name] = old_patcher
+                self.active_mocks[name] = old_mock
+
+    @contextmanager
+    def remove_patch(self, name):
+        """Temporarily removes a patch for a method, attribute, or dict.
+
+        Outside of a with block of the manager, the other patches are applied for
+        the duration of the removal.
+        """
+        self._check_patched(name)
+        with self:
+            if name not in self.active_patchers:
+                raise KeyError(f"'{name}' is not patched.")
+            batch, batched_patcher = self._batched.get(name, (None, None))
+            if self.active_patchers[name] is not batched_patcher:
+                _, old_patcher = self._swap_patcher(name, None)
+                try:
+                    yield
+                finally:
+                    self.active_mocks[name] = old_patcher.start()
+                    self.active_patchers[name] = old_patcher
+                return
+            # The batch stays started, only the attribute gets its original back
+            old_mock = self.active_mocks.pop(name, None)
+            self.active_patchers.pop(name)
+            try:
+                with batch.suspended(batched_patcher.attribute):
+                    yield
+            finally:
+                self.active_mocks[name] = old_mock
+                self.active_patchers[name] = batched_patcher
 
     def _get_patch_type(self, name):
         """Determines the type of patch for a given name."""
@@ -110,28 +182,54 @@ class MockContextManager:
         return self.active_mocks.get(name)
 
     def __enter__(self):
-        """Enters the context, resetting all mocks."""
-        self.apply_all_patches()
+        """Enters the context, applying the patches unless an enclosing block already did."""
+        if self._depth == 0:
+            self.apply_all_patches()
+        self._depth += 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exits the context, stopping all patches."""
-        self.stop_all_mocks()
+        """Exits the context, stopping all patches when the outermost block ends."""
+        self._depth -= 1
+        if self._depth == 0:
+            self.stop_all_mocks()
+            self._applied = False
 
     def stop_all_mocks(self):
-        """Resets all mocks to their original state."""
-        for name in self.active_mocks:
-            patcher = self.active_patchers[name]
+        """Stops every active patcher, the last started first, restoring the original objects.
+
+        The mocks stay available through get_mock for assertions after the block.
+        """
+        patchers = list(self.active_patchers.values())
+        batches = self._batches
+        self.active_patchers.clear()
+        self._pending = {}
+        self._batches = []
+        self._batched = {}
+        self._applied = False
+        for patcher in reversed(patchers):
+            # Batched patchers were never started on their own, stopping them does nothing
             patcher.stop()
+        for batch in reversed(batches):
+            batch.stop()
 
     def start_all_mocks(self):
         for name, mock in self.active_mocks.items():
-            if isinstance(mock, MagicMock):
+            if isinstance(mock, (MagicMock, Stub)):
                 mock.reset_mock()
 
     def apply_all_patches(self):
-        """Applies all patches (methods, attributes, mappings)."""
-        self._apply_patches("method", self.method_behaviors)
-        self._apply_patches("attribute", self.attribute_values)
-        self._apply_patches("mapping", self.mapping_values)
-        self._apply_patches("class", self.class_values)
+        """Applies all patches (methods, attributes, mappings), once until they are stopped."""
+        if self._applied:
+            return
+        try:
+            self._apply_patches("method", self.method_behaviors)
+            self._apply_patches("attribute", self.attribute_values)
+            self._apply_patches("mapping", self.mapping_values)
+            self._apply_patches("class", self.class_values)
+            self._start_batches()
+        except BaseException:
+            # Undo the patches applied before the failing one
+            self.stop_all_mocks()
+            raise
+        self._applied = True
@@ -1,11 +1,171 @@
+import bisect
+import weakref
+from collections import defaultdict
+from typing import Dict, Hashable, List, Optional
+
+# Call logs of the mocks passed to method_called_in_mock, kept as long as their mock
+_logs: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+# Types whose equality agrees with their hash
+_PLAIN_TYPES = (str, bytes, int, float, complex, bool, type(None))
+
+
+def _is_plain(value) -> bool:
+    """Check if a value only equals what hashes alike, unlike matchers such as ANY with their own __eq__."""
+    if isinstance(value, _PLAIN_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_plain(item) for item in value)
+    return type(value).__eq__ is object.__eq__
+
+
+def _hashable(key) -> Optional[Hashable]:
+    """Return the key if it can be hashed, None otherwise."""
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class CallLog:
+    """Index over the method calls of a mock, for fast "was called with" checks.
+
+    The calls in mock.method_calls are indexed by method name and by their hashed
+    arguments, each call once: every query first indexes the calls made since the
+    previous one. Calls with unhashable arguments are kept aside and compared the
+    usual way, and so are queries with arguments defining their own equality,
+    e.g. ANY. Resetting the mock resets the log.
+    """
+
+    def __init__(self, mock):
+        """
+        Initialize the log.
+
+        Args:
+            mock: The mock or stub whose method_calls are indexed.
+        """
+        self.mock = mock
+        self._reset(None)
+
+    def _reset(self, calls) -> None:
+        """Forget the indexed calls and follow a new call list."""
+        self._calls = calls
+        self._seen = 0
+        # Positions in method_calls by name, by (name, args, kwargs) and by (name, args)
+        self._by_name: Dict[str, List[int]] = defaultdict(list)
+        self._by_call: Dict[Hashable, List[int]] = defaultdict(list)
+        self._by_args: Dict[Hashable, List[int]] = defaultdict(list)
+        self._unhashable: Dict[str, List[int]] = defaultdict(list)
+
+    def _sync(self) -> List:
+        """Index the calls made since the last query."""
+        calls = self.mock.method_calls
+        if calls is not self._calls or len(calls) < self._seen:
+            self._reset(calls)
+        for position in range(self._seen, len(calls)):
+            name, args, kwargs = calls[position]
+            self._by_name[name].append(position)
+            key = _hashable((name, args, tuple(sorted(kwargs.items()))))
+            if key is None:
+                self._unhashable[name].append(position)
+                continue
+            self._by_call[key].append(position)
+            self._by_args[key[:2]].append(position)
+        self._seen = len(calls)
+        return calls
+
+    def _find(self, name: str, args: tuple, kwargs: Optional[dict]) -> List[int]:
+        """Find the positions of the calls of a method with the arguments, kwargs ignored if None."""
+        calls = self._sync()
+        if not _is_plain(args) or (kwargs and not _is_plain(tuple(kwargs.values()))):
+            # Matchers only match through ==, so compare every call of the method
+            return [
+                position for position in self._by_name.get(name, [])
+                if calls[position][1] == args and (kwargs is None or calls[position][2] == kwargs)
+            ]
+        if kwargs is None:
+            key = _hashable((name, args))
+            index = self._by_args
+        else:
+            key = _hashable((name, args, tuple(sorted(kwargs.items()))))
+            index = self._by_call
+        positions = index.get(key, []) if key is not None else []
+        unhashable = [
+            position for position in self._unhashable.get(name, [])
+            if calls[position][1] == args and (kwargs is None or calls[position][2] == kwargs)
+        ]
+        if unhashable:
+            return sorted(positions + unhashable)
+        return positions
+
+    def called(self, name: str) -> bool:
+        """Check if a method was called."""
+        self._sync()
+        return bool(self._by_name.get(name))
+
+    def called_with(self, name: str, *args, **kwargs) -> bool:
+        """Check if a method was called with exactly these arguments."""
+        return bool(self._find(name, args, kwargs))
+
+    def called_with_args(self, name: str, *args) -> bool:
+        """Check if a method was called with these positional arguments, whatever its keyword arguments."""
+        return bool(self._find(name, args, None))
+
+    def count(self, name: str) -> int:
+        """Count the calls of a method."""
+        self._sync()
+        return len(self._by_name.get(name, []))
+
+    def count_with(self, name: str, *args, **kwargs) -> int:
+        """Count the calls of a method with exactly these arguments."""
+        return len(self._find(name, args, kwargs))
+
+    def calls(self, name: str) -> List:
+        """Get the calls of a method, in the order they were made."""
+        calls = self._sync()
+        return [calls[position] for position in self._by_name.get(name, [])]
+
+    def positions(self, name: str, *args, **kwargs) -> List[int]:
+        """Get the positions in mock.method_calls of the calls of a method with exactly these arguments."""
+        return list(self._find(name, args, kwargs))
+
+    def called_in_order(self, *expected) -> bool:
+        """Check if calls were made in this order, other calls in between allowed.
+
+        Args:
+            *expected: The calls, e.g. call.write("a"), call.flush().
+        """
+        last = -1
+        for name, args, kwargs in expected:
+            positions = self._find(name, args, kwargs)
+            index = bisect.bisect_right(positions, last)
+            if index == len(positions):
+                return False
+            last = positions[index]
+        return True
+
+
+def call_log(mock) -> CallLog:
+    """Get the call log of a mock, shared by every query on the same mock."""
+    try:
+        log = _logs.get(mock)
+        if log is None:
+            log = _logs[mock] = CallLog(mock)
+        return log
+    except TypeError:
+        # Mocks that cannot be weakly referenced get a new log
+        return CallLog(mock)
+
+
 def method_called_in_mock(mock, method, *args):
-    method_calls = [m for m in mock.method_calls if m[0] == method]
-    if len(method_calls) == 0:
+    log = mock if isinstance(mock, CallLog) else call_log(mock)
+    if not log.called(method):
         print(f"method call of {method} not found on mock")
         return False
-    for m in method_calls:
-        if m.args == args:
-            print(f"method {method} called with args")
-            return True
+    if log.called_with_args(method, *args):
+        print(f"method {method} called with args")
+        return True
     print(f"method {method} not called with args")
     return False
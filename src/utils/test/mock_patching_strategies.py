@@ -1,7 +1,189 @@
+import pkgutil
+import sys
+from contextlib import contextmanager
+from types import ModuleType
 from unittest.mock import patch, MagicMock
-from typing import Mapping
+from typing import Callable, Dict, Iterator, List, Mapping, Tuple
 
 from src.utils.abstract.abstract_strategy import AbstractStrategy
+from src.utils.test.mock_stubs import MappingStub, create_class_stub
+
+# (target path, name) -> (module the owner was found through, its spec, owner object, attribute name)
+_targets: Dict[Tuple[str, str], Tuple[ModuleType, object, object, str]] = {}
+
+
+def _find_module(target_path: str) -> ModuleType:
+    """Find the imported module a target path starts with."""
+    path = target_path
+    while path not in sys.modules:
+        path = path.rpartition(".")[0]
+    return sys.modules[path]
+
+
+def resolve_target(target_path: str, name: str) -> Tuple[object, str]:
+    """Resolve a patch target to the object owning the attribute and the attribute name.
+
+    The result is cached, so repeated patches of the same target skip the import
+    and the walk down the dotted path. A cached target is resolved again once its
+    module was reloaded or replaced in sys.modules.
+
+    Args:
+        target_path (str): The module or object path, e.g. "pygame.mixer".
+        name (str): The dotted attribute below it, e.g. "music.load".
+
+    Returns:
+        Tuple[object, str]: The owner object, e.g. pygame.mixer.music, and the attribute, e.g. "load".
+    """
+    cached = _targets.get((target_path, name))
+    if cached is not None:
+        module, spec, owner, attribute = cached
+        # importlib.reload keeps the module object but gives it a new spec
+        if sys.modules.get(module.__name__) is module and module.__spec__ is spec:
+            return owner, attribute
+    owner_path, _, attribute = f"{target_path}.{name}".rpartition(".")
+    owner = pkgutil.resolve_name(owner_path)
+    module = _find_module(target_path)
+    _targets[(target_path, name)] = (module, module.__spec__, owner, attribute)
+    return owner, attribute
+
+
+def invalidate_targets() -> None:
+    """Drop every resolved patch target."""
+    _targets.clear()
+
+
+# Parameters of patch.multiple, which cannot be patched through its keyword arguments
+_MULTIPLE_PARAMETERS = frozenset(("target", "spec", "create", "spec_set", "autospec", "new_callable"))
+
+# Stands for an attribute the owner did not have before it was patched
+_MISSING = object()
+
+
+class AttributePatcher:
+    """Patcher of one attribute of a resolved owner, which can be batched with the others of the owner.
+
+    Every start replaces the attribute with a new object from the factory, so
+    each with block of a MockContextManager gets fresh mocks.
+    """
+
+    def __init__(self, owner: object, attribute: str, factory: Callable[[], object], create: bool = True):
+        """
+        Initialize the patcher.
+
+        Args:
+            owner (object): The object owning the attribute, e.g. a module or a class.
+            attribute (str): The name of the attribute.
+            factory (Callable[[], object]): Creates the object replacing the attribute.
+            create (bool): Allow patching an attribute the owner does not have.
+        """
+        self.owner = owner
+        self.attribute = attribute
+        self.factory = factory
+        self.create = create
+        self._patcher = None
+
+    def start(self):
+        """Replace the attribute and return the replacement."""
+        self._patcher = patch.object(self.owner, self.attribute, new=self.factory(), create=self.create)
+        return self._patcher.start()
+
+    def stop(self) -> None:
+        """Restore the attribute, if this patcher replaced it."""
+        if self._patcher is not None:
+            patcher, self._patcher = self._patcher, None
+            patcher.stop()
+
+    @property
+    def batchable(self) -> bool:
+        """Whether the attribute can be passed to patch.multiple."""
+        return self.attribute not in _MULTIPLE_PARAMETERS
+
+
+class PatchBatch:
+    """Patches several attributes of one owner with a single patch.multiple, started and stopped once."""
+
+    def __init__(self, owner: object):
+        """
+        Initialize the batch.
+
+        Args:
+            owner (object): The object owning the attributes.
+        """
+        self.owner = owner
+        self.patchers: List[AttributePatcher] = []
+        self.originals: Dict[str, object] = {}
+        self._patcher = None
+
+    def add(self, patcher: AttributePatcher) -> None:
+        """Add the attribute of a patcher to the batch.
+
+        Raises:
+            AttributeError: If the patcher may not create the attribute and the owner does not have it.
+        """
+        # The batch creates missing attributes, so the check of patchers that may not is done here
+        if not patcher.create and not hasattr(self.owner, patcher.attribute):
+            raise AttributeError(f"{self.owner!r} does not have the attribute {patcher.attribute!r}")
+        self.patchers.append(patcher)
+
+    def start(self) -> Dict[str, object]:
+        """Replace every attribute at once.
+
+        Returns:
+            Dict[str, object]: The replacements by attribute.
+        """
+        values = {patcher.attribute: patcher.factory() for patcher in self.patchers}
+        self.originals = {attribute: getattr(self.owner, attribute, _MISSING) for attribute in values}
+        self._patcher = patch.multiple(self.owner, create=True, **values)
+        self._patcher.start()
+        return values
+
+    def stop(self) -> None:
+        """Restore every attribute at once."""
+        if self._patcher is not None:
+            patcher, self._patcher = self._patcher, None
+            patcher.stop()
+
+    @contextmanager
+    def suspended(self, attribute: str) -> Iterator[None]:
+        """Put back the original of one attribute for the duration of the block."""
+        current = getattr(self.owner, attribute)
+        original = self.originals[attribute]
+        if original is _MISSING:
+            delattr(self.owner, attribute)
+        else:
+            setattr(self.owner, attribute, original)
+        try:
+            yield
+        finally:
+            setattr(self.owner, attribute, current)
+
+
+def _mapping_mock(behavior: Mapping) -> MagicMock:
+    """Create a MagicMock whose item access goes to a mapping."""
+    mock_dict = MagicMock()
+    mock_dict.__getitem__.side_effect = lambda key: behavior[key]
+    mock_dict.__setitem__.side_effect = lambda key, value: behavior.__setitem__(key, value)
+    mock_dict.__contains__.side_effect = lambda key: key in behavior
+    return mock_dict
+
+
+def _class_mock(class_values: Mapping[str, object]) -> MagicMock:
+    """Create a MagicMock class whose methods, and the methods of its instance, return the configured values."""
+    mock_class = MagicMock()
+
+    for method_name, return_value in class_values.items():
+        # Set each method to return the specified value
+        mock_method = MagicMock(return_value=return_value)
+        setattr(mock_class, method_name, mock_method)
+
+    # Ensure attributes and methods are on the called instance
+    instance_mock = MagicMock()
+    for method_name, return_value in class_values.items():
+        mock_method = MagicMock(return_value=return_value)
+        setattr(instance_mock, method_name, mock_method)
+
+    mock_class.return_value = instance_mock
+    return mock_class
 
 
 class MethodPatcherStrategy(AbstractStrategy):
@@ -15,20 +197,13 @@ class MethodPatcherStrategy(AbstractStrategy):
             )
 
         target_path, name, behavior = args
-        full_path = f"{target_path}.{name}"
+        owner, attribute = resolve_target(target_path, name)
         if isinstance(behavior, Mapping):
-            mock_method = MagicMock()
-            mock_method.__getitem__.side_effect = lambda key: behavior[key]
-            mock_method.__setitem__.side_effect = (
-                lambda key, value: behavior.__setitem__(key, value)
-            )
-            mock_method.__contains__.side_effect = lambda key: key in behavior
-            patcher = patch(full_path, new=mock_method, create=True)
+            return AttributePatcher(owner, attribute, lambda: _mapping_mock(behavior))
         elif callable(behavior):
-            patcher = patch(full_path, side_effect=behavior, create=True)
+            return AttributePatcher(owner, attribute, lambda: MagicMock(side_effect=behavior))
         else:
-            patcher = patch(full_path, return_value=behavior)
-        return patcher
+            return AttributePatcher(owner, attribute, lambda: MagicMock(return_value=behavior), create=False)
 
 
 class AttributePatcherStrategy(AbstractStrategy):
@@ -41,17 +216,26 @@ class AttributePatcherStrategy(AbstractStrategy):
                 "AttributePatcherStrategy expects 3 arguments: target_path, name, and value."
             )
         target_path, name, value = args
-        full_path = f"{target_path}.{name}"
+        owner, attribute = resolve_target(target_path, name)
         # Create a MagicMock and set its return_value if it's not callable or a Mapping
         if callable(value):
-            return patch(full_path, side_effect=value, create=True)
+            return AttributePatcher(owner, attribute, lambda: MagicMock(side_effect=value))
         else:
-            return patch(full_path, new=value, create=True)
+            return AttributePatcher(owner, attribute, lambda: value)
 
 
 class MappingPatcherStrategy(AbstractStrategy):
     """Strategy for patching dictionary-like objects."""
 
+    def __init__(self, lightweight: bool = False):
+        """
+        Initialize the strategy.
+
+        Args:
+            lightweight (bool): Patch with a slotted MappingStub instead of a MagicMock.
+        """
+        self.lightweight = lightweight
+
     def execute(self, *args):
         """Patches a dictionary-like object."""
         if len(args) != 3:
@@ -60,21 +244,24 @@ class MappingPatcherStrategy(AbstractStrategy):
             )
 
         target_path, name, behavior = args
-        full_path = f"{target_path}.{name}"
-
-        mock_dict = MagicMock()
-        mock_dict.__getitem__.side_effect = lambda key: behavior[key]
-        mock_dict.__setitem__.side_effect = lambda key, value: behavior.__setitem__(
-            key, value
-        )
-        mock_dict.__contains__.side_effect = lambda key: key in behavior
-        patcher = patch(full_path, new=mock_dict, create=True)
-        return patcher
+        owner, attribute = resolve_target(target_path, name)
+        if self.lightweight:
+            return AttributePatcher(owner, attribute, lambda: MappingStub(behavior))
+        return AttributePatcher(owner, attribute, lambda: _mapping_mock(behavior))
 
 
 class ClassPatcherStrategy(AbstractStrategy):
     """Strategy for patching classes."""
 
+    def __init__(self, lightweight: bool = False):
+        """
+        Initialize the strategy.
+
+        Args:
+            lightweight (bool): Patch with a slotted class Stub instead of MagicMocks.
+        """
+        self.lightweight = lightweight
+
     def execute(self, *args):
         """Patches a class on the target."""
         if len(args) != 3:
@@ -83,23 +270,7 @@ class ClassPatcherStrategy(AbstractStrategy):
             )
 
         target_path, name, class_values = args
-        full_path = f"{target_path}.{name}"
-
-        # Create a mock class
-        mock_class = MagicMock()
-
-        for method_name, return_value in class_values.items():
-            # Set each method to return the specified value
-            mock_method = MagicMock(return_value=return_value)
-            setattr(mock_class, method_name, mock_method)
-
-        # Ensure attributes and methods are on the called instance
-        instance_mock = MagicMock()
-        for method_name, return_value in class_values.items():
-            mock_method = MagicMock(return_value=return_value)
-            setattr(instance_mock, method_name, mock_method)
-
-        mock_class.return_value = instance_mock
-
-        patcher = patch(full_path, new=mock_class, create=True)
-        return patcher
+        owner, attribute = resolve_target(target_path, name)
+        if self.lightweight:
+            return AttributePatcher(owner, attribute, lambda: create_class_stub(class_values))
+        return AttributePatcher(owner, attribute, lambda: _class_mock(class_values))
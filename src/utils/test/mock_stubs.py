@@ -0,0 +1,179 @@
+from typing import Dict, List, Mapping, Optional
+from unittest.mock import call
+
+# The type of recorded calls; built from (name, args, kwargs), since names like "count" are tuple methods on call
+_Call = type(call)
+
+
+class Stub:
+    """Callable stand-in recording its calls, a slotted and much cheaper MagicMock.
+
+    Calling the stub records the call and returns its return_value. Attributes
+    that were not configured are created on first access as further stubs
+    returning None, and their calls are also recorded in the method_calls of
+    the stub they belong to, like MagicMock does.
+    """
+
+    __slots__ = ("_name", "_calls", "_members", "_method_calls", "return_value", "__weakref__")
+
+    def __init__(
+        self,
+        name: str = "",
+        return_value=None,
+        members: Optional[Mapping[str, "Stub"]] = None,
+        method_calls: Optional[List] = None,
+    ):
+        """
+        Initialize the stub.
+
+        Args:
+            name (str): The dotted name of the stub below the root stub, "" for a root stub.
+            return_value: The value returned by calls.
+            members (Mapping[str, Stub]): The configured attributes.
+            method_calls (List): The call list of the root stub, shared by its members.
+        """
+        self._name = name
+        self._calls = []
+        self._members: Dict[str, Stub] = dict(members or {})
+        self._method_calls = [] if method_calls is None else method_calls
+        self.return_value = return_value
+
+    def __call__(self, *args, **kwargs):
+        self._calls.append(call(*args, **kwargs))
+        if self._name:
+            self._method_calls.append(_Call((self._name, args, kwargs)))
+        return self.return_value
+
+    def __getattr__(self, attribute: str) -> "Stub":
+        # Private and special names stay missing, so copy, pickle and pytest see no such hooks
+        if attribute.startswith("_"):
+            raise AttributeError(attribute)
+        member = self._members.get(attribute)
+        if member is None:
+            name = f"{self._name}.{attribute}" if self._name else attribute
+            member = self._members[attribute] = Stub(name, method_calls=self._method_calls)
+        return member
+
+    @property
+    def called(self) -> bool:
+        return bool(self._calls)
+
+    @property
+    def call_count(self) -> int:
+        return len(self._calls)
+
+    @property
+    def call_args(self):
+        return self._calls[-1] if self._calls else None
+
+    @property
+    def call_args_list(self) -> List:
+        return self._calls
+
+    @property
+    def method_calls(self) -> List:
+        return self._method_calls
+
+    def reset_mock(self) -> None:
+        """Forget the recorded calls of the stub and its members."""
+        # New lists rather than cleared ones, like MagicMock, so call logs notice the reset
+        self._reset_calls([])
+
+    def _reset_calls(self, method_calls: List) -> None:
+        """Start new call lists, the method_calls one shared with the members."""
+        self._calls = []
+        self._method_calls = method_calls
+        for member in self._members.values():
+            member._reset_calls(method_calls)
+
+    def assert_called(self) -> None:
+        if not self._calls:
+            raise AssertionError(f"Expected '{self._name or 'stub'}' to have been called.")
+
+    def assert_not_called(self) -> None:
+        if self._calls:
+            raise AssertionError(
+                f"Expected '{self._name or 'stub'}' to not have been called. Called {len(self._calls)} times."
+            )
+
+    def assert_called_once(self) -> None:
+        if len(self._calls) != 1:
+            raise AssertionError(
+                f"Expected '{self._name or 'stub'}' to have been called once. Called {len(self._calls)} times."
+            )
+
+    def assert_called_with(self, *args, **kwargs) -> None:
+        expected = call(*args, **kwargs)
+        if not self._calls:
+            raise AssertionError(f"Expected call: {expected}\nNot called")
+        if self._calls[-1] != expected:
+            raise AssertionError(f"Expected call: {expected}\nActual call: {self._calls[-1]}")
+
+    def assert_called_once_with(self, *args, **kwargs) -> None:
+        self.assert_called_once()
+        self.assert_called_with(*args, **kwargs)
+
+    def assert_any_call(self, *args, **kwargs) -> None:
+        expected = call(*args, **kwargs)
+        if expected not in self._calls:
+            raise AssertionError(f"{expected} call not found")
+
+
+class MappingStub(Stub):
+    """Stub reading and writing a mapping through item access, recording the accesses as method calls."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data, name: str = ""):
+        """
+        Initialize the stub.
+
+        Args:
+            data: The mapping the item access goes to.
+            name (str): The dotted name of the stub below the root stub, "" for a root stub.
+        """
+        super().__init__(name)
+        self._data = data
+
+    def __getitem__(self, key):
+        self._method_calls.append(_Call(("__getitem__", (key,), {})))
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._method_calls.append(_Call(("__setitem__", (key, value), {})))
+        self._data[key] = value
+
+    def __contains__(self, key) -> bool:
+        self._method_calls.append(_Call(("__contains__", (key,), {})))
+        return key in self._data
+
+
+def create_class_stub(class_values: Mapping[str, object]) -> Stub:
+    """Create a stub class whose configured methods return the configured values.
+
+    The class and the instance it returns on every call both have the methods,
+    as with the MagicMock built by the ClassPatcherStrategy.
+
+    Args:
+        class_values (Mapping[str, object]): The return values by method name.
+
+    Returns:
+        Stub: The class stub.
+    """
+    instance_calls = []
+    instance = Stub(
+        members={
+            method: Stub(method, return_value, method_calls=instance_calls)
+            for method, return_value in class_values.items()
+        },
+        method_calls=instance_calls,
+    )
+    class_calls = []
+    return Stub(
+        return_value=instance,
+        members={
+            method: Stub(method, return_value, method_calls=class_calls)
+            for method, return_value in class_values.items()
+        },
+        method_calls=class_calls,
+    )
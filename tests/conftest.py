@@ -99,6 +99,7 @@ def pygame_mixer_audio():
     method_behaviors = {
         "init": Mock(),
         "music.get_busy": False,
+        "music.load": Mock(),
         "music.play": Mock(),
         "music.pause": Mock(),
         "music.set_volume": Mock(),
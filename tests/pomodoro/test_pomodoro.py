@@ -1,12 +1,23 @@
+import json
+import os
+import tempfile
+
 import pytest
 from unittest.mock import patch, MagicMock
 from src.runners.pomodoro import PomodoroRunner
+from src.utils.env_checks.path_resolver import anchor_path, invalidate_paths
+from src.utils.env_checks.settings import Settings, invalidate_settings
 
 
 @pytest.fixture
 def mock_os():
-    with patch.dict("os.environ", {"SOUND_FILE": "test_sound_file.wav"}):
+    # The sound file does not exist, so skip the existence check of the resolver
+    with patch.dict("os.environ", {"SOUND_FILE": "test_sound_file.wav"}), patch(
+        "src.runners.pomodoro.resolve_path", side_effect=anchor_path
+    ):
+        invalidate_settings()
         yield
+    invalidate_settings()
 
 
 @pytest.fixture
@@ -34,3 +45,39 @@ def test_pomodoro_runner(mock_pygame_mixer, mock_time, mock_os, pygame_mixer_aud
         # Run the main method
         runner.main(*args)
         mock_time.assert_called_once_with(60)
+
+
+@pytest.mark.parametrize(
+    "alarm_tone, expected_kind",
+    [("chime", "chime"), ("random", None)],
+)
+def test_pomodoro_runner_alarm_tone(mock_time, alarm_tone, expected_kind):
+    with patch(
+        "src.runners.pomodoro.get_settings",
+        return_value=Settings(alarm_tone=alarm_tone),
+    ), patch(
+        "src.runners.pomodoro.PygameMixerSoundSingleton"
+    ) as mock_sound:
+        PomodoroRunner().main("-m", "0")
+        audio_player = mock_sound.return_value
+        audio_player.load_sound.assert_not_called()
+        audio_player.load_tone.assert_called_once()
+        if expected_kind:
+            audio_player.load_tone.assert_called_once_with(expected_kind)
+        audio_player.play_sound.assert_called_once()
+
+
+def test_pomodoro_runner_bundled_sound(mock_time):
+    # The build bundled only the transcoded sound, listed in the sound manifest
+    with tempfile.TemporaryDirectory() as sounds_dir:
+        sounds_dir = os.path.realpath(sounds_dir)
+        open(os.path.join(sounds_dir, "alarm_sound.ogg"), "w").close()
+        with open(os.path.join(sounds_dir, "sounds_manifest.json"), "w") as f:
+            json.dump({"alarm_sound.wav": "alarm_sound.ogg"}, f)
+        settings = Settings(sound_file=os.path.join(sounds_dir, "alarm_sound.wav"))
+        with patch("src.runners.pomodoro.get_settings", return_value=settings), patch(
+            "src.runners.pomodoro.PygameMixerSoundSingleton"
+        ) as mock_sound:
+            PomodoroRunner().main("-m", "0")
+        invalidate_paths()
+        mock_sound.return_value.load_sound.assert_called_once_with(os.path.join(sounds_dir, "alarm_sound.ogg"))
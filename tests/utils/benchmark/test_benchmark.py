@@ -0,0 +1,32 @@
+from unittest.mock import Mock
+
+import pytest
+from src.utils.benchmark.benchmark import (
+    get_benchmark,
+    list_benchmarks,
+    register_benchmark,
+    time_call,
+)
+
+
+def test_register_and_get_benchmark():
+    @register_benchmark("test_suite")
+    def suite(repeat=5):
+        return {"case": {"calls": repeat}}
+
+    assert "test_suite" in list_benchmarks()
+    assert get_benchmark("test_suite")(repeat=2) == {"case": {"calls": 2}}
+
+    with pytest.raises(ValueError, match="already registered"):
+        register_benchmark("test_suite")(suite)
+    with pytest.raises(KeyError, match="Benchmark 'missing_suite' not found"):
+        get_benchmark("missing_suite")
+
+
+def test_time_call():
+    func = Mock()
+    result = time_call(func, "arg", repeat=3, number=4, key="value")
+    assert func.call_count == 12
+    func.assert_called_with("arg", key="value")
+    assert result["best"] <= result["mean"]
+    assert result["per_call"] == result["best"] / 4
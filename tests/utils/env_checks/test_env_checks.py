@@ -1,9 +1,14 @@
+import os
+from unittest.mock import patch
+
 import pytest
 from src.utils.env_checks.env_checks import (
     get_running_in_pyinstaller,
     get_env_var,
+    get_resolved_env_path,
     load_environment_variables,
 )
+from src.utils.env_checks.path_resolver import get_project_root
 
 
 def test_get_running_in_pyinstaller(mock_sys):
@@ -32,3 +37,12 @@ def test_load_environment_variables_file_exists(mock_os):
         pytest.raises(FileNotFoundError, match="fake_env_file not found"),
     ):
         load_environment_variables("fake_env_file")
+
+
+def test_get_resolved_env_path():
+    with patch("os.environ", {"LOG_CONFIG_FILE": "resources/logging_config.ini"}), patch(
+        "sys.frozen", False, create=True
+    ):
+        assert get_resolved_env_path("LOG_CONFIG_FILE") == os.path.join(
+            get_project_root(), "resources", "logging_config.ini"
+        )
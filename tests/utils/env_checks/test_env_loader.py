@@ -0,0 +1,113 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from src.utils.env_checks import env_loader
+from src.utils.env_checks.env_loader import (
+    get_env_layers,
+    load_layered_environment,
+    parse_env_file,
+    parse_env_lines,
+)
+from src.utils.env_checks.settings import get_settings, invalidate_settings
+
+
+@pytest.fixture
+def env_dir():
+    """A temporary directory for .env layers, with an isolated environment and loader state."""
+    with tempfile.TemporaryDirectory() as temp_dir, patch("os.environ", {"KEEP": "process"}), patch.dict(
+        env_loader._applied, clear=True
+    ):
+        yield temp_dir
+    invalidate_settings()
+
+
+def write_env(env_dir, name, content):
+    path = os.path.join(env_dir, name)
+    with open(path, "w") as f:
+        f.write(content)
+    return path
+
+
+def test_parse_env_lines():
+    values = parse_env_lines(
+        [
+            "# comment\n",
+            "\n",
+            "PLAIN=value # trailing comment\n",
+            "export EXPORTED = exported\n",
+            'DOUBLE="line\\nbreak # kept"\n',
+            "SINGLE='${NOT_EXPANDED}'\n",
+            "HASH=a#b\n",
+            "EMPTY=\n",
+            "not a variable\n",
+        ]
+    )
+    assert values == {
+        "PLAIN": "value",
+        "EXPORTED": "exported",
+        "DOUBLE": "line\nbreak # kept",
+        "SINGLE": "${NOT_EXPANDED}",
+        "HASH": "a#b",
+        "EMPTY": "",
+    }
+    assert values.literals == {"SINGLE"}
+
+
+def test_parse_env_file_is_cached_by_mtime_and_size(env_dir):
+    path = write_env(env_dir, ".env", "A=1\n")
+    values = parse_env_file(path)
+    assert parse_env_file(path) is values
+
+    write_env(env_dir, ".env", "A=22\n")
+    assert parse_env_file(path) == {"A": "22"}
+
+
+def test_get_env_layers():
+    with patch("os.environ", {"APP_ENV": "prod"}):
+        assert get_env_layers(".env") == [".env", ".env.prod", ".env.local"]
+    assert get_env_layers(".env", environment="") == [".env", ".env.local"]
+
+
+def test_load_layered_environment_precedence(env_dir):
+    base = write_env(env_dir, ".env", "BASE=base\nOVERLAY=base\nLOCAL=base\nKEEP=base\nALARM_TONE=beep\n")
+    write_env(env_dir, ".env.test", "OVERLAY=test\nLOCAL=test\nREF=${BASE}-${MISSING:-default}\n")
+    write_env(env_dir, ".env.local", "LOCAL=local\n")
+
+    load_layered_environment(base, environment="test")
+
+    assert os.environ["BASE"] == "base"
+    assert os.environ["OVERLAY"] == "test"
+    assert os.environ["LOCAL"] == "local"
+    assert os.environ["REF"] == "base-default"
+    # The process environment wins over every file
+    assert os.environ["KEEP"] == "process"
+    # Settings are rebuilt from the loaded environment
+    assert get_settings().alarm_tone == "beep"
+
+
+def test_load_layered_environment_keeps_literals(env_dir):
+    base = write_env(env_dir, ".env", "HOME=/home/user\nSINGLE='${HOME}'\nOVERRIDDEN='${HOME}'\n")
+    write_env(env_dir, ".env.local", "OVERRIDDEN=${HOME}/local\nREF=${SINGLE}\n")
+
+    load_layered_environment(base)
+
+    assert os.environ["SINGLE"] == "${HOME}"
+    assert os.environ["OVERRIDDEN"] == "/home/user/local"
+    assert os.environ["REF"] == "${HOME}"
+
+
+def test_load_layered_environment_reload(env_dir):
+    base = write_env(env_dir, ".env", "A=1\nB=1\n")
+    load_layered_environment(base)
+
+    write_env(env_dir, ".env", "A=22\n")
+    load_layered_environment(base)
+    assert os.environ["A"] == "22"
+    assert "B" not in os.environ
+
+
+def test_load_layered_environment_missing_base(env_dir):
+    with pytest.raises(FileNotFoundError):
+        load_layered_environment(os.path.join(env_dir, ".env"))
@@ -0,0 +1,76 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from src.utils.env_checks import path_resolver
+from src.utils.env_checks.path_resolver import (
+    anchor_path,
+    check_resolved_paths,
+    get_project_root,
+    invalidate_paths,
+    resolve_path,
+    start_path_watch,
+    stop_path_watch,
+)
+
+
+@pytest.fixture
+def sound_file():
+    """A temporary file and an empty resolver cache."""
+    invalidate_paths()
+    with tempfile.TemporaryDirectory() as temp_dir, patch("sys.frozen", False, create=True):
+        path = os.path.join(temp_dir, "alarm.wav")
+        with open(path, "w") as f:
+            f.write("RIFF")
+        yield os.path.realpath(path)
+    invalidate_paths()
+
+
+def test_get_project_root():
+    assert os.path.isfile(os.path.join(get_project_root(), "pyproject.toml"))
+
+
+def test_anchor_path_uses_project_root():
+    with patch("sys.frozen", False, create=True):
+        assert anchor_path("resources\\logging_config.ini") == os.path.join(
+            get_project_root(), "resources", "logging_config.ini"
+        )
+        assert anchor_path("/sounds/../alarm.wav") == os.path.realpath("/alarm.wav")
+
+
+def test_resolve_path_is_cached(sound_file):
+    assert resolve_path(sound_file) == sound_file
+    with patch("src.utils.env_checks.path_resolver._signature") as mock_signature:
+        assert resolve_path(sound_file) == sound_file
+        mock_signature.assert_not_called()
+
+
+def test_resolve_path_missing_file(sound_file):
+    with pytest.raises(FileNotFoundError, match="Path not found"):
+        resolve_path(sound_file + ".missing")
+
+
+def test_check_resolved_paths_drops_changed_paths(sound_file):
+    resolve_path(sound_file)
+    assert check_resolved_paths() == []
+    os.remove(sound_file)
+    assert check_resolved_paths() == [sound_file]
+    with pytest.raises(FileNotFoundError):
+        resolve_path(sound_file)
+
+
+def test_invalidate_paths(sound_file):
+    resolve_path(sound_file)
+    invalidate_paths(sound_file)
+    assert sound_file not in path_resolver._resolved
+
+
+def test_path_watch():
+    watcher = start_path_watch(interval=0.01)
+    try:
+        assert watcher.is_alive()
+        assert start_path_watch() is watcher
+    finally:
+        stop_path_watch()
+    assert not watcher.is_alive()
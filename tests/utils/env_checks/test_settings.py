@@ -0,0 +1,76 @@
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+from src.utils.env_checks.settings import (
+    Settings,
+    add_settings_listener,
+    get_settings,
+    invalidate_settings,
+    remove_settings_listener,
+    to_path,
+)
+
+
+@pytest.fixture
+def environ():
+    """Replace the process environment and rebuild the settings around the test."""
+    values = {"LOG_CONFIG_FILE": "resources/logging_config.ini", "ALARM_TONE": "chime"}
+    with patch("os.environ", values):
+        invalidate_settings()
+        yield values
+    invalidate_settings()
+
+
+def test_from_environ_defaults():
+    settings = Settings.from_environ({})
+    assert settings.log_config_file is None
+    assert settings.mixer_profile == "balanced"
+
+
+def test_from_environ_converts_paths():
+    with patch("sys.frozen", False, create=True):
+        settings = Settings.from_environ({"SOUND_FILE": "resources\\sounds/alarm.wav"})
+    assert settings.sound_file == os.path.join("resources", "sounds", "alarm.wav")
+
+
+def test_to_path_in_pyinstaller(mock_sys):
+    with mock_sys:
+        assert to_path("resources/sounds") == os.path.join("pyinstaller/path", "resources", "sounds")
+
+
+def test_settings_are_immutable():
+    with pytest.raises(AttributeError):
+        Settings().alarm_tone = "beep"
+
+
+def test_require():
+    settings = Settings(sound_file="alarm.wav")
+    assert settings.require("sound_file") == "alarm.wav"
+    with pytest.raises(KeyError, match="Environment variable 'LOG_CONFIG_FILE' not found"):
+        settings.require("log_config_file")
+
+
+def test_get_settings_is_cached(environ):
+    settings = get_settings()
+    assert settings.alarm_tone == "chime"
+    environ["ALARM_TONE"] = "beep"
+    assert get_settings() is settings
+
+
+def test_invalidate_settings_notifies_listeners(environ):
+    old_settings = get_settings()
+    listener = Mock()
+    add_settings_listener(listener)
+    try:
+        # Unchanged values do not notify
+        invalidate_settings()
+        listener.assert_not_called()
+
+        environ["ALARM_TONE"] = "beep"
+        new_settings = invalidate_settings()
+        assert get_settings() is new_settings
+        assert new_settings.alarm_tone == "beep"
+        listener.assert_called_once_with(old_settings, new_settings)
+    finally:
+        remove_settings_listener(listener)
@@ -0,0 +1,68 @@
+import logging
+import multiprocessing
+import queue
+import sys
+from unittest.mock import patch
+
+from src.utils.logging import aggregation
+from src.utils.logging.aggregation import ForwardingHandler, LogAggregator, configure_worker
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _log_in_worker(task):
+    logging.root.warning("task %d from a worker", task)
+    return task
+
+
+def test_forwarding_handler_batches():
+    log_queue = queue.Queue()
+    handler = ForwardingHandler(log_queue, batch_size=100)
+    for i in range(250):
+        handler.handle(logging.LogRecord("app", logging.INFO, __file__, 1, "record %d", (i,), None))
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        handler.handle(logging.LogRecord("app", logging.ERROR, __file__, 1, "failure", None, sys.exc_info()))
+    handler.close()
+    batches = []
+    while not log_queue.empty():
+        batches.append(log_queue.get())
+    assert all(len(batch) <= 100 for batch in batches)
+    records = [record for batch in batches for record in batch]
+    assert [record.msg for record in records[:3]] == ["record 0", "record 1", "record 2"]
+    assert len(records) == 251
+    # Prepared for pickling: the message is rendered and the traceback kept as text
+    assert records[-1].exc_info is None
+    assert "ValueError: boom" in records[-1].msg
+
+
+def test_pool_workers_forward_to_aggregator():
+    context = multiprocessing.get_context("fork")
+    target = _ListHandler()
+    aggregator = LogAggregator(target, context)
+    aggregator.start()
+    with patch.object(aggregation, "_forwarding_handler", None):
+        pool = context.Pool(2, initializer=configure_worker, initargs=(aggregator.queue,))
+        try:
+            assert sorted(pool.map(_log_in_worker, range(20))) == list(range(20))
+        finally:
+            pool.close()
+            pool.join()
+    aggregator.stop()
+    assert sorted(record.getMessage() for record in target.records) == sorted(
+        f"task {task} from a worker" for task in range(20)
+    )
+
+
+def test_is_forwarding():
+    assert not aggregation.is_forwarding()
+    with patch.object(aggregation, "_forwarding_handler", object()):
+        assert aggregation.is_forwarding()
@@ -0,0 +1,104 @@
+import asyncio
+import json
+import logging
+import threading
+from unittest.mock import patch
+
+from src.utils.logging import context
+from src.utils.logging.context import (
+    ContextFormatter,
+    ContextThread,
+    bind_log_context,
+    get_log_context,
+    in_current_context,
+    install_context_factory,
+    log_context,
+    reset_log_context,
+)
+from src.utils.logging.json_formatter import JsonLinesFormatter
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _logger():
+    install_context_factory()
+    logger = logging.Logger("context", logging.INFO)
+    handler = _ListHandler()
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def test_records_carry_context():
+    logger, handler = _logger()
+    with log_context(session_id="s1", runner="pomodoro"):
+        with log_context(job_id=7):
+            logger.info("inside")
+        logger.info("outer")
+    logger.info("outside")
+    assert [getattr(record, "context", None) for record in handler.records] == [
+        {"session_id": "s1", "runner": "pomodoro", "job_id": 7},
+        {"session_id": "s1", "runner": "pomodoro"},
+        None,
+    ]
+
+
+def test_disabled_level_skips_context_lookup():
+    logger, handler = _logger()
+    with log_context(session_id="s1"), patch.object(context, "_fields") as mock_fields:
+        logger.debug("disabled")
+        mock_fields.get.assert_not_called()
+    assert handler.records == []
+
+
+def test_bind_and_reset():
+    token = bind_log_context(job_id=1)
+    assert get_log_context() == {"job_id": 1}
+    reset_log_context(token)
+    assert get_log_context() == {}
+
+
+def test_context_follows_threads_and_tasks():
+    seen = {}
+
+    def remember(key):
+        seen[key] = dict(get_log_context())
+
+    async def in_task():
+        remember("task")
+
+    with log_context(session_id="s1"):
+        thread = ContextThread(target=remember, args=("context_thread",))
+        thread.start()
+        thread.join()
+        wrapped = threading.Thread(target=in_current_context(lambda: remember("wrapped")))
+        plain = threading.Thread(target=remember, args=("plain",))
+        wrapped.start()
+        plain.start()
+        wrapped.join()
+        plain.join()
+        asyncio.run(in_task())
+    assert seen == {
+        "context_thread": {"session_id": "s1"},
+        "wrapped": {"session_id": "s1"},
+        "plain": {},
+        "task": {"session_id": "s1"},
+    }
+
+
+def test_formatters_write_context():
+    logger, handler = _logger()
+    with log_context(session_id="s1", runner="pomodoro"):
+        logger.info("value %d", 1)
+    logger.info("plain")
+    text = ContextFormatter("%(levelname)s - %(message)s")
+    assert text.format(handler.records[0]) == "INFO - value 1 [session_id=s1 runner=pomodoro]"
+    assert text.format(handler.records[1]) == "INFO - plain"
+    line = JsonLinesFormatter("message").format(handler.records[0])
+    assert json.loads(line) == {"message": "value 1", "context": {"session_id": "s1", "runner": "pomodoro"}}
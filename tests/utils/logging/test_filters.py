@@ -0,0 +1,103 @@
+import logging
+from unittest.mock import Mock, patch
+
+from src.utils.logging.filters import (
+    UNFILTERED,
+    DroppedRecordReporter,
+    RepeatCollapsingFilter,
+    SamplingFilter,
+    TokenBucketFilter,
+)
+
+
+def _record(message="value %d", args=(1,), level=logging.INFO, name="app"):
+    return logging.LogRecord(name, level, __file__, 10, message, args, None)
+
+
+def test_token_bucket_limits_per_template():
+    now = [0.0]
+    log_filter = TokenBucketFilter(rate=2, burst=2, clock=lambda: now[0])
+    assert [log_filter.filter(_record(args=(i,))) for i in range(3)] == [True, True, False]
+    # Another template has its own bucket
+    assert log_filter.filter(_record("other"))
+    now[0] = 0.5
+    assert log_filter.filter(_record())
+    assert not log_filter.filter(_record())
+    assert log_filter.take_dropped() == 2
+    assert log_filter.take_dropped() == 0
+
+
+def test_token_buckets_are_bounded():
+    now = [0.0]
+    log_filter = TokenBucketFilter(rate=2, burst=2, clock=lambda: now[0], max_buckets=100)
+    for i in range(1000):
+        log_filter.filter(_record(f"printed line {i}"))
+    assert len(log_filter) == 100
+    # Buckets untouched for burst / rate seconds are full again and dropped
+    now[0] = 1.0
+    assert log_filter.filter(_record("printed line 999"))
+    assert len(log_filter) == 1
+
+
+def test_sampling_keeps_share_of_debug_records():
+    log_filter = SamplingFilter(rate=0.25, seed=1)
+    kept = sum(log_filter.filter(_record(level=logging.DEBUG)) for _ in range(1000))
+    assert 200 < kept < 300
+    assert log_filter.take_dropped() == 1000 - kept
+    assert all(log_filter.filter(_record(level=logging.INFO)) for _ in range(100))
+
+
+def test_unfiltered_records_pass():
+    log_filter = SamplingFilter(rate=0)
+    record = _record(level=logging.DEBUG)
+    setattr(record, UNFILTERED, True)
+    assert log_filter.filter(record)
+    assert log_filter.take_dropped() == 0
+
+
+def test_repeat_collapsing():
+    handler = Mock(spec=logging.Handler)
+    log_filter = RepeatCollapsingFilter(handler)
+    results = [log_filter.filter(_record()) for _ in range(4)]
+    assert results == [True, False, False, False]
+    handler.handle.assert_not_called()
+    assert log_filter.filter(_record(args=(2,)))
+    summary = handler.handle.call_args.args[0]
+    assert summary.getMessage() == "Last message repeated 3 times"
+    assert getattr(summary, UNFILTERED)
+    assert log_filter.take_dropped() == 3
+
+
+def test_repeat_collapsing_flush():
+    handler = Mock(spec=logging.Handler)
+    log_filter = RepeatCollapsingFilter(handler)
+    log_filter.filter(_record())
+    log_filter.filter(_record())
+    log_filter.flush()
+    assert handler.handle.call_args.args[0].getMessage() == "Last message repeated 1 times"
+    # The run ended, so the same message passes again
+    assert log_filter.filter(_record())
+
+
+def test_reporter_logs_dropped_counts():
+    log_filter = TokenBucketFilter(rate=1, clock=lambda: 0.0)
+    queue_handler = Mock(take_dropped=Mock(return_value=5))
+    for _ in range(3):
+        log_filter.filter(_record())
+    reporter = DroppedRecordReporter([log_filter, queue_handler])
+    with patch("src.utils.logging.filters.logger") as mock_logger:
+        dropped = reporter.report()
+    assert dropped == {"TokenBucketFilter": 2, "Mock": 5}
+    args = mock_logger.warning.call_args
+    assert args.args[1:] == (7, "Mock=5, TokenBucketFilter=2")
+    assert args.kwargs["extra"] == {UNFILTERED: True}
+
+
+def test_reporter_stop_reports_once_more():
+    log_filter = SamplingFilter(rate=0)
+    reporter = DroppedRecordReporter([log_filter], interval=3600)
+    reporter.start()
+    log_filter.filter(_record(level=logging.DEBUG))
+    with patch("src.utils.logging.filters.logger") as mock_logger:
+        reporter.stop()
+    mock_logger.warning.assert_called_once()
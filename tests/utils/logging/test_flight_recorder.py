@@ -0,0 +1,94 @@
+import logging
+import os
+import sys
+import tempfile
+import threading
+from unittest.mock import Mock, patch
+
+from src.utils.logging.flight_recorder import FlightRecorderHandler, install_dump_hooks, install_flight_recorder
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _record(message, level=logging.DEBUG, exc_info=None):
+    return logging.LogRecord("app", level, __file__, 10, message, None, exc_info)
+
+
+def test_buffers_until_error():
+    target = _ListHandler(logging.WARNING)
+    recorder = FlightRecorderHandler([target], capacity=2)
+    for i in range(3):
+        recorder.handle(_record(f"detail {i}"))
+    recorder.handle(_record("warning", logging.WARNING))
+    assert target.records == []
+    assert len(recorder) == 2
+    recorder.handle(_record("failure", logging.ERROR))
+    assert [r.getMessage() for r in target.records] == ["detail 1", "detail 2"]
+    assert target.records[0].levelname == "DEBUG"
+    assert len(recorder) == 0
+
+
+def test_byte_limit():
+    recorder = FlightRecorderHandler([], capacity=0, max_bytes=2 * (200 + 10))
+    for i in range(5):
+        recorder.handle(_record(f"detail {i:03d}"))
+    assert len(recorder) == 2
+
+
+def test_dump_keeps_exception_text():
+    target = _ListHandler()
+    recorder = FlightRecorderHandler([target])
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        recorder.handle(_record("handled", exc_info=sys.exc_info()))
+    assert recorder.dump() == 1
+    formatted = logging.Formatter("%(asctime)s %(message)s").format(target.records[0])
+    assert "ValueError: boom" in formatted
+
+
+def test_dump_hooks():
+    recorder = Mock(spec=FlightRecorderHandler)
+    previous = Mock()
+    with patch("sys.excepthook", previous), patch("threading.excepthook", Mock()), \
+            patch("signal.signal") as mock_signal:
+        install_dump_hooks(recorder, signals=[10])
+        sys.excepthook(ValueError, ValueError("boom"), None)
+        recorder.dump.assert_called_once()
+        previous.assert_called_once()
+        signal_handler = mock_signal.call_args.args[1]
+    signal_handler(10, None)
+    for thread in threading.enumerate():
+        if thread.name == "flight-recorder-dump":
+            thread.join()
+    assert recorder.dump.call_count == 2
+
+
+def test_install_flight_recorder():
+    logger = logging.Logger("recorded", logging.DEBUG)
+    with tempfile.TemporaryDirectory() as log_dir:
+        file_handler = logging.FileHandler(os.path.join(log_dir, "app.log"), delay=True)
+        error_handler = logging.FileHandler(os.path.join(log_dir, "error.log"), delay=True)
+        error_handler.setLevel(logging.ERROR)
+        logger.addHandler(file_handler)
+        logger.addHandler(error_handler)
+        with patch("src.utils.logging.flight_recorder.install_dump_hooks"):
+            recorder = install_flight_recorder(logger, capacity=100)
+        assert logger.handlers[0] is recorder
+        assert recorder.targets == [file_handler]
+        assert file_handler.level == logging.WARNING
+
+        logger.debug("detail")
+        logger.warning("warning")
+        logger.error("failure")
+        file_handler.close()
+        error_handler.close()
+        with open(os.path.join(log_dir, "app.log")) as f:
+            assert f.read().splitlines() == ["warning", "detail", "failure"]
@@ -0,0 +1,89 @@
+import io
+import json
+import logging
+import sys
+import time
+from unittest.mock import patch
+
+from src.utils.logging.json_formatter import JsonLinesFormatter
+from src.utils.logging.queue_pipeline import install_queue_pipeline, stop_queue_pipeline
+
+
+def _record(message="value %d", args=(1,), exc_info=None, **extra):
+    record = logging.LogRecord("app", logging.INFO, __file__, 10, message, args, exc_info)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_format():
+    formatter = JsonLinesFormatter(static_fields={"host": "box"})
+    record = _record()
+    line = formatter.format(record)
+    assert "\n" not in line
+    assert json.loads(line) == {
+        "host": "box",
+        "asctime": formatter.formatTime(record),
+        "levelname": "INFO",
+        "name": "app",
+        "message": "value 1",
+    }
+
+
+def test_format_fields_from_config():
+    formatter = JsonLinesFormatter("levelname, lineno", None, "%")
+    assert json.loads(formatter.format(_record())) == {"levelname": "INFO", "lineno": 10}
+
+
+def test_format_extra_fields():
+    formatter = JsonLinesFormatter("message")
+    line = formatter.format(_record(request_id="abc", payload={"size": 3}, obj=object))
+    assert json.loads(line) == {
+        "message": "value 1",
+        "request_id": "abc",
+        "payload": {"size": 3},
+        "obj": str(object),
+    }
+
+
+def test_format_exception():
+    formatter = JsonLinesFormatter("message")
+    try:
+        raise ValueError("broken\nline")
+    except ValueError:
+        record = _record(exc_info=sys.exc_info())
+    line = formatter.format(record)
+    assert "\n" not in line
+    assert json.loads(line)["exc_info"].endswith("ValueError: broken\nline")
+
+
+def test_format_time_is_cached_per_second():
+    formatter = JsonLinesFormatter(datefmt="%H:%M:%S")
+    first, second = _record(), _record()
+    second.created, second.msecs = first.created, 999
+    with patch("time.strftime", wraps=time.strftime) as mock_strftime:
+        stamp = formatter.formatTime(first)
+        assert formatter.formatTime(second) == stamp[:-3] + "999"
+        mock_strftime.assert_called_once()
+
+
+def test_format_exception_behind_queue_pipeline():
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonLinesFormatter(fmt="levelname,message"))
+    logger = logging.Logger("tests.json_pipeline", logging.DEBUG)
+    logger.addHandler(handler)
+    install_queue_pipeline(logger)
+    try:
+        try:
+            raise ValueError("bad value")
+        except ValueError:
+            logger.exception("boom %s", "x")
+        logger.info("here", stack_info=True)
+    finally:
+        stop_queue_pipeline()
+    exception_line, stack_line = (json.loads(line) for line in stream.getvalue().splitlines())
+    assert exception_line["message"] == "boom x"
+    assert "Traceback" in exception_line["exc_info"]
+    assert "ValueError: bad value" in exception_line["exc_info"]
+    assert stack_line["message"] == "here"
+    assert "Stack (most recent call last)" in stack_line["stack_info"]
@@ -0,0 +1,97 @@
+import gzip
+import json
+import os
+import tempfile
+import time
+
+from src.utils.logging.log_index import TimeIndex, normalize_stamp, query_logs
+from src.utils.logging.rotation import get_index_path
+
+
+def _lines(first_minute, count, level="INFO"):
+    lines = []
+    for minute in range(first_minute, first_minute + count):
+        lines.append(f"2024-05-01 12:{minute:02d}:00 - {level} - record {minute}\n")
+    return "".join(lines)
+
+
+def _epoch(stamp):
+    return time.mktime(time.strptime(stamp, "%Y-%m-%d %H:%M:%S"))
+
+
+def test_normalize_stamp():
+    assert normalize_stamp("2024-05-01") == b"2024-05-01 00:00:00"
+    assert normalize_stamp("2024-05-01T12:30", "9999-12-31 23:59:59") == b"2024-05-01 12:30:59"
+
+
+def test_index_is_sparse_and_incremental():
+    with tempfile.TemporaryDirectory() as log_dir:
+        path = os.path.join(log_dir, "app.log")
+        with open(path, "w") as f:
+            f.write(_lines(0, 20))
+        index = TimeIndex(path, stride=200)
+        index.update()
+        first_size = os.path.getsize(index.index_path)
+        # About one entry per 200 bytes of up to 39 byte lines
+        assert index.find_offset(b"2024-05-01 12:00:00") == 0
+        assert 0 < index.find_offset(b"2024-05-01 12:10:00") < len(_lines(0, 10))
+
+        with open(path, "a") as f:
+            f.write(_lines(20, 20) + "2024-05-01 12:40:00 - INFO - unfinished")
+        index.update()
+        assert os.path.getsize(index.index_path) > first_size
+        assert index.find_offset(b"2024-05-01 12:35:00") > len(_lines(0, 20))
+
+
+def test_index_rebuilt_for_replaced_file():
+    with tempfile.TemporaryDirectory() as log_dir:
+        path = os.path.join(log_dir, "app.log")
+        with open(path, "w") as f:
+            f.write(_lines(0, 40))
+        index = TimeIndex(path, stride=30)
+        index.update()
+        os.remove(path)
+        with open(path, "w") as f:
+            f.write(_lines(50, 2))
+        index.update()
+        assert index.find_offset(b"2024-05-01 12:59:00") == len(_lines(50, 1))
+
+
+def test_query_time_range_level_and_continuations():
+    with tempfile.TemporaryDirectory() as log_dir:
+        path = os.path.join(log_dir, "app.log")
+        with open(path, "w") as f:
+            f.write(_lines(0, 30))
+            f.write("2024-05-01 12:30:00 - ERROR - failure\nTraceback (most recent call last):\n  boom\n")
+            f.write(_lines(31, 20))
+        records = list(query_logs(path, "2024-05-01 12:28", "2024-05-01 12:31"))
+        assert [record.split(" - ")[2].strip() for record in records] == [
+            "record 28", "record 29", "failure\nTraceback (most recent call last):\n  boom", "record 31"
+        ]
+        assert list(query_logs(path, level=40)) == [
+            "2024-05-01 12:30:00 - ERROR - failure\nTraceback (most recent call last):\n  boom\n"
+        ]
+
+
+def test_query_across_rotated_segments():
+    with tempfile.TemporaryDirectory() as log_dir:
+        path = os.path.join(log_dir, "app.log")
+        with gzip.open(path + ".1.gz", "wt") as f:
+            f.write(_lines(0, 10))
+        with open(path + ".2", "w") as f:
+            f.write(_lines(10, 10))
+        with open(path, "w") as f:
+            f.write(_lines(20, 10))
+        segments = [
+            {"file": "app.log.1.gz", "start": _epoch("2024-05-01 12:00:00"), "end": _epoch("2024-05-01 12:09:30")},
+            {"file": "app.log.2", "start": _epoch("2024-05-01 12:09:30"), "end": _epoch("2024-05-01 12:19:30")},
+        ]
+        with open(get_index_path(path), "w") as f:
+            json.dump(segments, f)
+
+        records = list(query_logs(path, "2024-05-01 12:08", "2024-05-01 12:21"))
+        assert [record.split(" - ")[2].strip() for record in records] == [
+            f"record {minute}" for minute in range(8, 22)
+        ]
+        # The compressed segment is skipped outside its time range
+        assert len(list(query_logs(path, "2024-05-01 12:15"))) == 15
@@ -0,0 +1,61 @@
+from unittest.mock import Mock, call
+
+from src.utils.logging.logger_stream import LoggerStream
+
+
+def test_write_logs_one_record_per_line():
+    level = Mock()
+    stream = LoggerStream(level)
+    assert stream.write("a\nb\nc") == 5
+    assert level.call_args_list == [call("a"), call("b")]
+    assert stream.buffer == "c"
+    stream.write("d\n")
+    level.assert_called_with("cd")
+    assert stream.buffer == ""
+
+
+def test_write_buffers_partial_writes():
+    level = Mock()
+    stream = LoggerStream(level)
+    for character in "partial":
+        stream.write(character)
+    level.assert_not_called()
+    stream.write("\n")
+    level.assert_called_once_with("partial")
+
+
+def test_write_caps_the_buffer():
+    level = Mock()
+    stream = LoggerStream(level, max_buffer_size=4)
+    stream.write("ab")
+    stream.write("cd")
+    level.assert_called_once_with("abcd")
+    assert stream.buffer == ""
+
+
+def test_write_caps_the_tail_of_a_multi_line_write():
+    level = Mock()
+    stream = LoggerStream(level, max_buffer_size=4)
+    stream.write("a\n" + "x" * 100)
+    assert level.call_args_list == [call("a"), call("x" * 100)]
+    assert stream.buffer == ""
+
+
+def test_flush():
+    level = Mock()
+    stream = LoggerStream(level)
+    stream.flush()
+    level.assert_not_called()
+    stream.write("  unfinished ")
+    stream.flush()
+    level.assert_called_once_with("unfinished")
+    assert stream.buffer == ""
+
+
+def test_write_skips_disabled_level():
+    level = Mock()
+    stream = LoggerStream(level, is_enabled=lambda: False)
+    assert stream.write("discarded\npartial") == 17
+    stream.flush()
+    level.assert_not_called()
+    assert stream.buffer == ""
@@ -1,7 +1,15 @@
+import io
+import logging
+import queue
 import sys
+from unittest.mock import Mock, patch
 
 import pytest
 from src.utils.logging.logging_config_singleton import LoggingConfigSingleton
+from src.utils.logging.filters import RepeatCollapsingFilter, SamplingFilter, TokenBucketFilter
+from src.utils.logging.json_formatter import JsonLinesFormatter
+from src.utils.logging.queue_pipeline import BoundedQueueHandler
+from src.utils.logging.rotation import RotatingCompressingFileHandler
 
 
 @pytest.fixture
@@ -37,3 +45,74 @@ def test_logging_setup(get_singleton, mock_os, mock_builtins, mock_logging):
 def test_logging_failed_config_load(get_singleton, mock_builtins, mock_logging):
     with mock_logging.remove_patch("config.fileConfig"), pytest.raises(RuntimeError):
         get_singleton.setup()
+
+
+def test_custom_print_logs_at_info():
+    with patch("logging.info") as mock_info, patch.object(logging.root, "isEnabledFor", return_value=True):
+        LoggingConfigSingleton._custom_print("a", 1, sep="-")
+        mock_info.assert_called_once_with("a-1")
+        LoggingConfigSingleton._custom_print("partial", end="")
+        LoggingConfigSingleton._custom_print(" line")
+        mock_info.assert_called_with("partial line")
+
+
+def test_custom_print_skips_disabled_level():
+    with patch("logging.info") as mock_info, patch.object(logging.root, "isEnabledFor", return_value=False):
+        LoggingConfigSingleton._custom_print(Mock(__str__=Mock(side_effect=AssertionError)))
+        mock_info.assert_not_called()
+
+
+def test_custom_print_passes_file_writes_through():
+    output = io.StringIO()
+    with patch("logging.info") as mock_info:
+        LoggingConfigSingleton._custom_print("a", "b", sep=",", end="!", file=output)
+        mock_info.assert_not_called()
+    assert output.getvalue() == "a,b!"
+
+
+def test_override_rotation():
+    handler = Mock(spec=RotatingCompressingFileHandler)
+    other_handler = Mock(spec=logging.Handler)
+    with patch.object(logging.root, "handlers", [handler, other_handler]):
+        LoggingConfigSingleton._override_rotation({"max_bytes": 1024, "backup_count": 3})
+    assert handler.max_bytes == 1024
+    assert handler.backup_count == 3
+    assert not hasattr(other_handler, "max_bytes")
+
+
+def test_use_json_format():
+    file_handler = Mock(spec=logging.FileHandler)
+    stream_handler = Mock(spec=logging.StreamHandler)
+    with patch.object(logging.root, "handlers", [file_handler, stream_handler]):
+        LoggingConfigSingleton._use_json_format()
+    assert isinstance(file_handler.setFormatter.call_args.args[0], JsonLinesFormatter)
+    stream_handler.setFormatter.assert_not_called()
+
+
+def test_install_filters(get_singleton):
+    handler = BoundedQueueHandler(queue.Queue(), overflow="drop_newest")
+    filters = {"rate_limit": 10, "debug_sample_rate": 0.5, "collapse_repeats": True, "report_interval": 3600}
+    with patch.object(get_singleton, "filters", filters), patch("atexit.register") as mock_register, \
+            patch.object(handler, "addFilter") as mock_add:
+        reporter = get_singleton._install_filters(handler)
+    filters = [call.args[0] for call in mock_add.call_args_list]
+    assert [type(f) for f in filters] == [SamplingFilter, RepeatCollapsingFilter, TokenBucketFilter]
+    assert reporter.filters == filters + [handler]
+    mock_register.assert_called_once_with(reporter.stop)
+    reporter.stop()
+
+
+def test_install_no_filters_on_blocking_queue(get_singleton):
+    handler = BoundedQueueHandler(queue.Queue(), overflow="block")
+    with patch.object(get_singleton, "filters", {}), patch.object(handler, "addFilter") as mock_add:
+        assert get_singleton._install_filters(handler) is None
+    mock_add.assert_not_called()
+
+
+@pytest.mark.parametrize("reload_signal", [False, True])
+def test_reload_signal_is_opt_in(get_singleton, reload_signal):
+    with patch.object(get_singleton, "reload_signal", reload_signal), \
+            patch.object(get_singleton, "control_socket", None), \
+            patch("src.utils.logging.logging_config_singleton.install_reload_signal") as mock_install:
+        get_singleton._enable_reconfiguration()
+    assert mock_install.called == reload_signal
@@ -0,0 +1,86 @@
+import logging
+import queue
+import threading
+
+import pytest
+from src.utils.logging.queue_pipeline import (
+    BoundedQueueHandler,
+    install_queue_pipeline,
+    stop_queue_pipeline,
+)
+
+
+class _RecordingHandler(logging.Handler):
+    """Handler remembering the messages and the thread that emitted them."""
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+        self.threads.add(threading.current_thread())
+
+
+@pytest.fixture
+def logger():
+    """A private logger with a recording handler."""
+    logger = logging.Logger("tests.queue_pipeline", logging.DEBUG)
+    handler = _RecordingHandler()
+    logger.addHandler(handler)
+    yield logger, handler
+    stop_queue_pipeline()
+    logger.removeHandler(handler)
+
+
+def _record(message):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def test_pipeline_writes_on_the_listener_thread(logger):
+    logger, handler = logger
+    pipeline = install_queue_pipeline(logger)
+    assert logger.handlers == [pipeline.queue_handler]
+    for i in range(100):
+        logger.info("message %d", i)
+    stop_queue_pipeline()
+    assert handler.messages == [f"message {i}" for i in range(100)]
+    assert threading.current_thread() not in handler.threads
+    assert logger.handlers == [handler]
+
+
+def test_pipeline_respects_handler_levels(logger):
+    logger, handler = logger
+    handler.setLevel(logging.ERROR)
+    install_queue_pipeline(logger)
+    logger.info("skipped")
+    logger.error("written")
+    stop_queue_pipeline()
+    assert handler.messages == ["written"]
+
+
+def test_install_replaces_the_pipeline(logger):
+    logger, handler = logger
+    first = install_queue_pipeline(logger)
+    second = install_queue_pipeline(logger)
+    assert not first.listener._thread
+    assert second.handlers == [handler]
+
+
+@pytest.mark.parametrize(
+    "overflow, expected",
+    [("drop_newest", ["first", "second"]), ("drop_oldest", ["second", "third"])],
+)
+def test_overflow_policies(overflow, expected):
+    record_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(record_queue, overflow)
+    for message in ("first", "second", "third"):
+        handler.handle(_record(message))
+    assert [record_queue.get_nowait().msg for _ in range(2)] == expected
+    assert handler.dropped == 1
+
+
+def test_unknown_overflow_policy():
+    with pytest.raises(ValueError, match="Unknown overflow policy 'spill'"):
+        BoundedQueueHandler(queue.Queue(), "spill")
@@ -0,0 +1,103 @@
+import logging
+import os
+import socket
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from src.utils.logging.reconfigure import (
+    ControlServer,
+    get_levels,
+    install_reload_signal,
+    read_config_levels,
+    set_levels,
+)
+
+_CONFIG = """[loggers]
+keys=root,worker
+
+[logger_root]
+level=WARNING  # Quiet by default
+handlers=
+
+[logger_worker]
+level=DEBUG
+qualname=reconfigure.worker
+handlers=
+
+[formatter_standard]
+format=%(asctime)s - %(message)s
+"""
+
+
+@pytest.fixture
+def loggers():
+    names = ("reconfigure.app", "reconfigure.worker")
+    saved = logging.root.level
+    yield [logging.Logger.manager.getLogger(name) for name in names]
+    logging.root.setLevel(saved)
+    for name in names:
+        logging.Logger.manager.getLogger(name).setLevel(logging.NOTSET)
+
+
+def test_set_levels_clears_cached_decisions(loggers):
+    app, _ = loggers
+    set_levels({"root": "INFO"})
+    assert not app.isEnabledFor(logging.DEBUG)
+    set_levels({"reconfigure.app": "debug", "root": 30})
+    assert app.isEnabledFor(logging.DEBUG)
+    assert logging.root.level == logging.WARNING
+
+
+def test_set_levels_applies_nothing_on_unknown_level(loggers):
+    app, worker = loggers
+    with pytest.raises(ValueError, match="LOUD"):
+        set_levels({"reconfigure.app": "DEBUG", "reconfigure.worker": "LOUD"})
+    assert app.level == logging.NOTSET
+
+
+def test_read_config_levels():
+    with tempfile.TemporaryDirectory() as config_dir:
+        config_path = os.path.join(config_dir, "logging_config.ini")
+        with open(config_path, "w") as f:
+            f.write(_CONFIG)
+        assert read_config_levels(config_path) == {"root": "WARNING", "reconfigure.worker": "DEBUG"}
+
+
+def test_reload_signal_runs_in_thread():
+    with patch("signal.signal") as mock_signal, patch("threading.Thread") as mock_thread:
+        install_reload_signal("logging_config.ini", signum=1)
+        mock_signal.call_args.args[1](1, None)
+    assert mock_thread.call_args.kwargs["args"] == ("logging_config.ini",)
+    mock_thread.return_value.start.assert_called_once()
+
+
+def test_control_server(loggers):
+    app, worker = loggers
+    with tempfile.TemporaryDirectory() as run_dir:
+        config_path = os.path.join(run_dir, "logging_config.ini")
+        with open(config_path, "w") as f:
+            f.write(_CONFIG)
+        server = ControlServer(os.path.join(run_dir, "control.sock"), config_path)
+        server.start()
+        try:
+            with socket.socket(socket.AF_UNIX) as client:
+                client.connect(server.path)
+                replies = client.makefile("rwb")
+
+                def send(command):
+                    replies.write(command.encode() + b"\n")
+                    replies.flush()
+                    return replies.readline().decode().strip()
+
+                assert send("level reconfigure.app=ERROR root=INFO") == "ok"
+                assert app.getEffectiveLevel() == logging.ERROR
+                assert send("level reconfigure.app=LOUD").startswith("error: Unknown log level")
+                assert send("reload").startswith("ok root=WARNING")
+                assert worker.level == logging.DEBUG
+                assert "reconfigure.app=ERROR" in send("levels")
+                assert send("restart").startswith("error: Unknown command")
+                replies.close()
+        finally:
+            server.stop()
+    assert get_levels()["root"] == "WARNING"
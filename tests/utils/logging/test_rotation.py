@@ -0,0 +1,99 @@
+import gzip
+import logging
+import os
+import tempfile
+import time
+
+import pytest
+from src.utils.logging.rotation import (
+    RotatingCompressingFileHandler,
+    find_segments,
+    load_segment_index,
+)
+
+
+@pytest.fixture
+def log_file():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield os.path.join(temp_dir, "app.log")
+
+
+def _record(message, created=None):
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+    if created is not None:
+        record.created = created
+    return record
+
+
+def test_rotates_by_size_and_compresses(log_file):
+    handler = RotatingCompressingFileHandler(log_file, max_bytes=30)
+    for i in range(6):
+        handler.handle(_record(f"message number {i}"))
+    handler.close()
+
+    segments = load_segment_index(log_file)
+    assert len(segments) == 5
+    assert all(segment["file"].endswith(".gz") for segment in segments)
+    assert all(segment["start"] <= segment["end"] for segment in segments)
+    with gzip.open(os.path.join(os.path.dirname(log_file), segments[0]["file"]), "rt") as f:
+        assert f.read() == "message number 0\n"
+    with open(log_file) as f:
+        assert f.read() == "message number 5\n"
+
+
+def test_rotates_by_time(log_file):
+    handler = RotatingCompressingFileHandler(log_file, interval=60, compress=False)
+    handler.handle(_record("first"))
+    handler.handle(_record("second", created=time.time() + 61))
+    handler.close()
+    segments = load_segment_index(log_file)
+    assert len(segments) == 1
+    with open(os.path.join(os.path.dirname(log_file), segments[0]["file"])) as f:
+        assert f.read() == "first\n"
+
+
+def test_retention(log_file):
+    handler = RotatingCompressingFileHandler(log_file, max_bytes=10, backup_count=2)
+    for i in range(5):
+        handler.handle(_record(f"message {i}"))
+    handler.close()
+    segments = load_segment_index(log_file)
+    assert len(segments) == 2
+    log_dir = os.path.dirname(log_file)
+    assert sorted(os.listdir(log_dir)) == sorted(
+        ["app.log", "app.log.index.json"] + [segment["file"] for segment in segments]
+    )
+
+
+def test_retention_by_age(log_file):
+    handler = RotatingCompressingFileHandler(log_file, max_age=60)
+    log_dir = os.path.dirname(log_file)
+    segments = [
+        {"file": "app.log.old.gz", "start": 800.0, "end": 900.0},
+        {"file": "app.log.new.gz", "start": 900.0, "end": 1000.0},
+    ]
+    for segment in segments:
+        open(os.path.join(log_dir, segment["file"]), "w").close()
+    assert handler._apply_retention(segments, now=1050.0) == segments[1:]
+    assert not os.path.isfile(os.path.join(log_dir, "app.log.old.gz"))
+    assert os.path.isfile(os.path.join(log_dir, "app.log.new.gz"))
+    handler.close()
+
+
+def test_find_segments(log_file):
+    handler = RotatingCompressingFileHandler(log_file)
+    for start in (100.0, 200.0, 300.0):
+        rotated = f"{log_file}.{int(start)}"
+        with open(rotated, "w") as f:
+            f.write("record\n")
+        handler._finish_segment(rotated, start, start + 50)
+    handler.close()
+    log_dir = os.path.dirname(log_file)
+    assert find_segments(log_file, start=220, end=320) == [
+        os.path.join(log_dir, "app.log.200.gz"),
+        os.path.join(log_dir, "app.log.300.gz"),
+    ]
+    assert find_segments(log_file, start=260, end=320) == [os.path.join(log_dir, "app.log.300.gz")]
+    assert find_segments(log_file, end=120) == [os.path.join(log_dir, "app.log.100.gz")]
+    assert len(find_segments(log_file)) == 3
+    assert find_segments(os.path.join(log_dir, "missing.log")) == []
@@ -1,4 +1,7 @@
+from unittest.mock import Mock, patch
+
 import pytest
+from src.utils.env_checks.settings import Settings
 from src.utils.media.audio import PygameMixerSoundSingleton
 
 
@@ -11,7 +14,8 @@ def test_load_sound(mock_singleton_setup, mixer, pygame_mixer_audio):
     with pygame_mixer_audio:
         mixer.load_sound("Fake_sound.wav")
         pygame_mixer_audio.get_mock("Sound").assert_called_once()
-    with pygame_mixer_audio.remove_patch("Sound"):
+    # Without the patch the real Sound class looks for the file
+    with pygame_mixer_audio.remove_patch("Sound"), pytest.raises(FileNotFoundError):
         mixer.load_sound("Fake_sound.wav")
     with pygame_mixer_audio.remove_patch("init"):
         mixer.load_sound("Fake_sound.wav")
@@ -35,3 +39,69 @@ def test_is_sound_playing(mock_singleton_setup, mixer, pygame_mixer_audio):
         assert not mixer.is_sound_playing()
         mixer.load_sound("Fake_sound.wav")
         assert mixer.is_sound_playing()
+
+
+def test_load_sound_streams_large_files(mock_singleton_setup, mixer, pygame_mixer_audio):
+    """Test that files above the threshold are streamed through mixer.music."""
+    with pygame_mixer_audio, patch("os.path.getsize", return_value=16), patch.object(
+        PygameMixerSoundSingleton, "STREAMING_THRESHOLD_BYTES", 8
+    ):
+        mixer.load_sound("Long_track.ogg")
+        pygame_mixer_audio.get_mock("music.load").assert_called_once_with(
+            "Long_track.ogg"
+        )
+        pygame_mixer_audio.get_mock("Sound").assert_not_called()
+        assert not mixer.is_sound_playing()
+
+        mixer.play_sound()
+        pygame_mixer_audio.get_mock("music.play").assert_called_once()
+
+    # Small files are decoded into memory again
+    with pygame_mixer_audio:
+        mixer.load_sound("Fake_sound.wav")
+        assert mixer.is_sound_playing()
+
+
+def test_load_sound_prefers_pcm_cache(mock_singleton_setup, mixer, pygame_mixer_audio):
+    """Test that a usable pre-rendered PCM file replaces decoding."""
+    cached_sound = Mock()
+    with pygame_mixer_audio, patch("os.path.isfile", return_value=True), patch(
+        "src.utils.media.audio.load_pcm_cache", return_value=cached_sound
+    ) as mock_load_pcm_cache:
+        mixer.load_sound("Fake_sound.wav")
+        mock_load_pcm_cache.assert_called_once_with("Fake_sound.pcm")
+        pygame_mixer_audio.get_mock("Sound").assert_not_called()
+        assert mixer._sound is cached_sound
+
+        # PCM files rendered for another mixer format are ignored
+        mock_load_pcm_cache.side_effect = ValueError("was rendered for")
+        mixer.load_sound("Fake_sound.wav")
+        pygame_mixer_audio.get_mock("Sound").assert_called_once_with("Fake_sound.wav")
+
+
+def test_setup_uses_mixer_profile(mock_singleton_setup, mixer, pygame_mixer_audio):
+    """Test that the mixer is initialized with the configured profile."""
+    with pygame_mixer_audio, patch(
+        "src.utils.media.mixer_profiles.get_settings",
+        return_value=Settings(mixer_profile="low-cpu"),
+    ):
+        mixer._setup()
+        pygame_mixer_audio.get_mock("init").assert_called_once_with(
+            frequency=22050, size=-16, channels=1, buffer=4096
+        )
+
+
+def test_load_tone(mock_singleton_setup, mixer, pygame_mixer_audio):
+    """Test that synthesized tones are handed to pygame through sndarray."""
+    with pygame_mixer_audio, patch(
+        "pygame.mixer.get_init", return_value=(8000, -16, 1)
+    ), patch("pygame.sndarray.make_sound") as mock_make_sound:
+        mixer.load_tone("beep", duration=0.1)
+        samples = mock_make_sound.call_args.args[0]
+        assert samples.shape == (800,)
+        assert mixer._sound is mock_make_sound.return_value
+
+    with patch("pygame.mixer.get_init", return_value=(8000, 8, 1)), pytest.raises(
+        ValueError, match="signed 16-bit mixer"
+    ):
+        mixer.load_tone("beep")
@@ -0,0 +1,29 @@
+from unittest.mock import patch
+
+import pytest
+from src.utils.env_checks.settings import Settings
+from src.utils.media.mixer_profiles import MIXER_PROFILES, get_mixer_profile
+
+
+def test_get_mixer_profile_default():
+    with patch("src.utils.media.mixer_profiles.get_settings", return_value=Settings()):
+        assert get_mixer_profile() == MIXER_PROFILES["balanced"]
+
+
+def test_get_mixer_profile_from_settings():
+    with patch(
+        "src.utils.media.mixer_profiles.get_settings",
+        return_value=Settings(mixer_profile="low-latency"),
+    ):
+        assert get_mixer_profile() == MIXER_PROFILES["low-latency"]
+
+
+def test_get_mixer_profile_returns_copy():
+    profile = get_mixer_profile("low-cpu")
+    profile["buffer"] = 1
+    assert MIXER_PROFILES["low-cpu"]["buffer"] != 1
+
+
+def test_get_mixer_profile_unknown():
+    with pytest.raises(ValueError, match="Unknown mixer profile 'studio'"):
+        get_mixer_profile("studio")
@@ -0,0 +1,92 @@
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+from src.utils.media.pcm_cache import (
+    get_pcm_cache_path,
+    load_pcm_cache,
+    render_pcm_cache,
+    render_pcm_directory,
+)
+
+RAW_PCM = bytes(range(16)) * 8
+
+
+@pytest.fixture
+def mock_mixer():
+    """Mock the mixer format and the Sound class used for decoding."""
+    with patch("pygame.mixer.get_init", return_value=(22050, -16, 1)) as mock_get_init, patch(
+        "pygame.mixer.Sound"
+    ) as mock_sound:
+        mock_sound.return_value.get_raw.return_value = RAW_PCM
+        mock_sound.get_init = mock_get_init
+        yield mock_sound
+
+
+@pytest.fixture
+def sound_dir():
+    """A temporary directory holding a placeholder sound file."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with open(os.path.join(temp_dir, "beep.wav"), "wb") as f:
+            f.write(b"RIFF")
+        yield temp_dir
+
+
+@pytest.fixture
+def sound_file(sound_dir):
+    return os.path.join(sound_dir, "beep.wav")
+
+
+def test_get_pcm_cache_path():
+    assert get_pcm_cache_path("resources/sounds/alarm.wav") == "resources/sounds/alarm.pcm"
+
+
+def test_render_and_load_pcm_cache(mock_mixer, sound_file):
+    cache_file = render_pcm_cache(sound_file)
+    assert cache_file == get_pcm_cache_path(sound_file)
+    mock_mixer.assert_called_once_with(sound_file)
+
+    buffers = []
+    mock_mixer.side_effect = lambda buffer: buffers.append(bytes(buffer)) or MagicMock()
+    load_pcm_cache(cache_file)
+    assert buffers == [RAW_PCM]
+
+
+def test_load_pcm_cache_format_mismatch(mock_mixer, sound_file):
+    cache_file = render_pcm_cache(sound_file)
+    mock_mixer.get_init.return_value = (44100, -16, 2)
+    with pytest.raises(ValueError, match="was rendered for"):
+        load_pcm_cache(cache_file)
+
+
+def test_load_pcm_cache_invalid_file(mock_mixer, sound_dir):
+    cache_file = os.path.join(sound_dir, "invalid.pcm")
+    with open(cache_file, "wb") as f:
+        f.write(b"not a pcm file at all")
+    with pytest.raises(ValueError, match="is not a PCM cache file"):
+        load_pcm_cache(cache_file)
+
+
+def test_render_pcm_directory(mock_mixer, sound_dir):
+    output_dir = os.path.join(sound_dir, "rendered")
+    os.mkdir(output_dir)
+    rendered = render_pcm_directory(sound_dir, output_dir)
+    assert rendered == [os.path.join(output_dir, "beep.pcm")]
+    # Existing PCM files are not rendered again
+    assert render_pcm_directory(output_dir) == []
+
+
+def test_render_pcm_directory_skips_other_files(mock_mixer, sound_dir):
+    for file_name in (".gitkeep", "README.md", "sounds_manifest.json"):
+        with open(os.path.join(sound_dir, file_name), "w") as f:
+            f.write("{}")
+    rendered = render_pcm_directory(sound_dir)
+    assert rendered == [os.path.join(sound_dir, "beep.pcm")]
+    mock_mixer.assert_called_once_with(os.path.join(sound_dir, "beep.wav"))
+
+
+def test_render_pcm_cache_without_mixer(mock_mixer, sound_file):
+    mock_mixer.get_init.return_value = None
+    with pytest.raises(RuntimeError, match="Mixer not initialized"):
+        render_pcm_cache(sound_file)
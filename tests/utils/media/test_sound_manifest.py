@@ -0,0 +1,41 @@
+import json
+import os
+import tempfile
+
+import pytest
+from src.utils.media.sound_manifest import (
+    SOUND_MANIFEST,
+    load_sound_manifest,
+    resolve_sound_file,
+)
+
+
+@pytest.fixture
+def sound_dir():
+    """A temporary sounds directory with a manifest from a transcoding build."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with open(os.path.join(temp_dir, SOUND_MANIFEST), "w") as f:
+            json.dump({"alarm.wav": "alarm.ogg", "alarm_copy.wav": "alarm.ogg"}, f)
+        yield temp_dir
+        load_sound_manifest.cache_clear()
+
+
+def test_resolve_sound_file(sound_dir):
+    assert resolve_sound_file(os.path.join(sound_dir, "alarm.wav")) == os.path.join(sound_dir, "alarm.ogg")
+    # Deduplicated files point at the same bundled file
+    assert resolve_sound_file(os.path.join(sound_dir, "alarm_copy.wav")) == os.path.join(sound_dir, "alarm.ogg")
+    # Files missing from the manifest are used as configured
+    assert resolve_sound_file(os.path.join(sound_dir, "other.wav")) == os.path.join(sound_dir, "other.wav")
+
+
+def test_load_sound_manifest_is_cached(sound_dir):
+    manifest = load_sound_manifest(sound_dir)
+    os.remove(os.path.join(sound_dir, SOUND_MANIFEST))
+    assert load_sound_manifest(sound_dir) is manifest
+
+
+def test_resolve_sound_file_without_manifest():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sound_file = os.path.join(temp_dir, "alarm.wav")
+        assert resolve_sound_file(sound_file) == sound_file
+    load_sound_manifest.cache_clear()
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from src.utils.media.synth import (
+    TONE_KINDS,
+    random_tone_parameters,
+    synthesize_tone,
+)
+
+
+@pytest.mark.parametrize("kind", TONE_KINDS)
+def test_synthesize_tone(kind):
+    samples = synthesize_tone(kind, duration=0.1, sample_rate=8000, channels=2)
+    assert samples.dtype == np.int16
+    assert samples.shape == (800, 2)
+    assert not samples.flags.writeable
+    # Fade envelope starts and ends in silence
+    assert samples[0, 0] == 0
+    assert abs(int(samples[-1, 0])) < 256
+    assert np.abs(samples).max() <= 0.5 * 32767
+
+
+def test_synthesize_tone_mono():
+    samples = synthesize_tone("beep", duration=0.1, sample_rate=8000, channels=1)
+    assert samples.shape == (800,)
+
+
+def test_synthesize_tone_is_cached():
+    first = synthesize_tone("chime", frequency=440.0, duration=0.05)
+    assert synthesize_tone("chime", frequency=440.0, duration=0.05) is first
+    assert synthesize_tone("chime", frequency=660.0, duration=0.05) is not first
+
+
+def test_synthesize_tone_unknown_kind():
+    with pytest.raises(ValueError, match="Unknown tone kind 'siren'"):
+        synthesize_tone("siren")
+
+
+def test_random_tone_parameters():
+    parameters = random_tone_parameters(seed=42)
+    assert parameters == random_tone_parameters(seed=42)
+    assert parameters["kind"] in TONE_KINDS
+    assert synthesize_tone(**parameters, duration=0.01).size
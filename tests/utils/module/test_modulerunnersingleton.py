@@ -4,6 +4,15 @@ import pytest
 from src.utils.module.module_runner_singleton import (
     ModuleRunnerSingleton,
 )  # Correct class import
+from src.utils.env_checks.settings import Settings
+from src.utils.module.preflight import PreflightReport
+
+
+@pytest.fixture(autouse=True)
+def preflight_reports():
+    """Start every test without kept preflight reports."""
+    with patch.object(ModuleRunnerSingleton, "_preflight_reports", {}):
+        yield
 
 
 def test_create_runner_fail_class_not_inheriting_AbstractRunner():
@@ -34,3 +43,52 @@ def test_run():
     ) as mock_create_runner:
         module_runner.run("pomodoro", ["-m", "0"])
         mock_create_runner.assert_called_once()
+
+
+def test_preflight_failure_is_raised_on_run():
+    module_runner = ModuleRunnerSingleton()
+    report = PreflightReport(problems=["SOUND_FILE file not found at path: /missing.wav"])
+    with patch(
+        "src.utils.module.module_runner_singleton.run_preflight", return_value={"pomodoro": report}
+    ), patch.object(module_runner, "create_runner", return_value=MagicMock()) as mock_create_runner:
+        with pytest.raises(RuntimeError, match="pomodoro: SOUND_FILE file not found"):
+            module_runner.run("pomodoro", ["-m", "0"])
+        mock_create_runner.return_value.run.assert_not_called()
+    assert "pomodoro" not in module_runner._preflight_reports
+
+
+def test_create_runner_missing_dependency():
+    error = ModuleNotFoundError("No module named 'pygame'", name="pygame")
+    with patch("importlib.import_module", side_effect=error), pytest.raises(
+        ValueError, match="Module 'pomodoro' could not be imported: No module named 'pygame'"
+    ):
+        ModuleRunnerSingleton.create_runner("pomodoro")
+
+
+def test_preflight_passes_resolved_paths():
+    module_runner = ModuleRunnerSingleton()
+    module_runner._preflight_reports["pomodoro"] = PreflightReport(paths={"SOUND_FILE": "/sounds/alarm.wav"})
+    with patch.object(module_runner, "create_runner", return_value=MagicMock()) as mock_create_runner:
+        module_runner.run("pomodoro", ["-m", "0"])
+        assert mock_create_runner.return_value.resolved_paths == {"SOUND_FILE": "/sounds/alarm.wav"}
+
+
+def test_preflight_raises_module_runner_problems():
+    module_runner = ModuleRunnerSingleton()
+    with patch(
+        "src.utils.module.module_runner_singleton.run_preflight",
+        return_value={"module_runner": PreflightReport(problems=["Environment variable 'LOG_CONFIG_FILE' not found."])},
+    ), pytest.raises(RuntimeError, match="module_runner: Environment variable 'LOG_CONFIG_FILE'"):
+        module_runner.preflight()
+
+
+@pytest.mark.parametrize("interval, started", [(None, False), (0.5, True)])
+def test_path_watch_is_opt_in(interval, started):
+    with patch(
+        "src.utils.module.module_runner_singleton.get_settings",
+        return_value=Settings(path_watch_interval=interval),
+    ), patch("src.utils.module.module_runner_singleton.start_path_watch") as mock_start:
+        ModuleRunnerSingleton._start_path_watch()
+    assert mock_start.called == started
+    if started:
+        mock_start.assert_called_once_with(0.5)
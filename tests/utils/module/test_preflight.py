@@ -0,0 +1,97 @@
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from src.runners.pomodoro import PomodoroRunner
+from src.utils.env_checks.path_resolver import get_project_root
+from src.utils.env_checks.settings import Settings
+from src.utils.media.sound_manifest import load_sound_manifest
+from src.utils.module.preflight import PreflightReport, format_problems, run_preflight
+
+
+@pytest.fixture
+def environ():
+    """An isolated environment pointing at a temporary file and directory."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sound_file = os.path.join(temp_dir, "alarm.wav")
+        open(sound_file, "w").close()
+        values = {
+            "SOUND_FILE": sound_file,
+            "SOUND_DIR": temp_dir,
+            "MISSING_FILE": os.path.join(temp_dir, "missing.wav"),
+            "PLAIN": "value",
+        }
+        with patch("os.environ", values), patch("sys.frozen", False, create=True):
+            yield values
+
+
+def test_run_preflight(environ):
+    reports = run_preflight(
+        {
+            "pomodoro": {"files": ["SOUND_FILE"], "directories": ["SOUND_DIR"], "env_vars": ["PLAIN"]},
+            "other": {"files": ["SOUND_FILE"]},
+        }
+    )
+    assert reports["pomodoro"] == PreflightReport(
+        paths={"SOUND_FILE": environ["SOUND_FILE"], "SOUND_DIR": environ["SOUND_DIR"]}
+    )
+    assert reports["other"].problems == []
+
+
+def test_run_preflight_reports_every_problem(environ):
+    reports = run_preflight(
+        {
+            "pomodoro": {
+                "env_vars": ["UNSET"],
+                "files": ["MISSING_FILE", "SOUND_DIR", "UNSET_FILE"],
+                "directories": ["SOUND_FILE"],
+            }
+        }
+    )
+    assert reports["pomodoro"].problems == [
+        "Environment variable 'UNSET' not found.",
+        "Environment variable 'UNSET_FILE' not found.",
+        f"MISSING_FILE file not found at path: {environ['MISSING_FILE']}",
+        f"SOUND_DIR is not a file: {environ['SOUND_DIR']}",
+        f"SOUND_FILE is not a directory: {environ['SOUND_FILE']}",
+    ]
+
+
+def test_run_preflight_stats_each_path_once(environ):
+    with patch("src.utils.module.preflight._stat", wraps=os.stat) as mock_stat:
+        run_preflight({"a": {"files": ["SOUND_FILE"]}, "b": {"files": ["SOUND_FILE"]}})
+        mock_stat.assert_called_once_with(environ["SOUND_FILE"])
+
+
+def test_format_problems():
+    reports = {"pomodoro": PreflightReport(problems=["first", "second"]), "other": PreflightReport()}
+    assert format_problems(reports) == "Preflight checks failed:\n  - pomodoro: first\n  - pomodoro: second"
+
+
+@pytest.fixture
+def ogg_bundle():
+    """A frozen bundle holding only the transcoded alarm sound and the sound manifest."""
+    with tempfile.TemporaryDirectory() as bundle_dir:
+        bundle_dir = os.path.realpath(bundle_dir)
+        sounds_dir = os.path.join(bundle_dir, "resources", "sounds")
+        os.makedirs(sounds_dir)
+        open(os.path.join(sounds_dir, "alarm_sound.ogg"), "w").close()
+        with open(os.path.join(sounds_dir, "sounds_manifest.json"), "w") as f:
+            json.dump({"alarm_sound.wav": "alarm_sound.ogg"}, f)
+        get_project_root.cache_clear()
+        load_sound_manifest.cache_clear()
+        with patch("os.environ", {"SOUND_FILE": "resources/sounds/alarm_sound.wav"}), patch(
+            "sys.frozen", True, create=True
+        ), patch("sys._MEIPASS", bundle_dir, create=True):
+            yield sounds_dir
+        get_project_root.cache_clear()
+        load_sound_manifest.cache_clear()
+
+
+def test_run_preflight_maps_bundled_sound_files(ogg_bundle):
+    with patch("src.runners.pomodoro.get_settings", return_value=Settings()):
+        requirements = PomodoroRunner().resource_requirements
+    report = run_preflight({"pomodoro": requirements})["pomodoro"]
+    assert report == PreflightReport(paths={"SOUND_FILE": os.path.join(ogg_bundle, "alarm_sound.ogg")})
@@ -1,3 +1,7 @@
+import os
+import sys
+from unittest.mock import patch
+
 import pytest
 
 from src.utils.test.mock_context_manager import MockContextManager
@@ -71,3 +75,135 @@ def test_remove_patch(mock_context):
         with pytest.raises(KeyError, match="is not patched."):
             with context.remove_patch("not_patched_method"):
                 pass
+
+
+def _manager(mock_context):
+    return MockContextManager(
+        mock_context["target_path"],
+        mock_context["method_behaviors"],
+        mock_context["attribute_values"],
+        mock_context["mapping_values"],
+    )
+
+
+def test_apply_is_idempotent(mock_context):
+    """Test that nested blocks and repeated applies start every patcher once."""
+    module = sys.modules[mock_context["target_path"]]
+    context = _manager(mock_context)
+    with patch.object(MockContextManager, "_apply_patches", wraps=context._apply_patches) as mock_apply:
+        with context:
+            context.apply_all_patches()
+            with context:
+                assert module.attr_name == 42
+            assert module.attr_name == 42
+        assert mock_apply.call_count == 4
+    assert not hasattr(module, "attr_name")
+    assert not context.active_patchers
+
+
+def test_update_patch_outside_block_stops_everything(mock_context):
+    """Test that an update used on its own applies the other patches only for its duration."""
+    module = sys.modules[mock_context["target_path"]]
+    context = _manager(mock_context)
+    with context.update_patch("attr_name", 7):
+        assert module.attr_name == 7
+        assert module.method_name(2) == 4
+        with context.update_patch("attr_name", 8):
+            assert module.attr_name == 8
+        assert module.attr_name == 7
+    assert not hasattr(module, "attr_name")
+    assert not hasattr(module, "method_name")
+
+
+def test_failed_apply_is_undone(mock_context):
+    """Test that the patches applied before a failing one are stopped."""
+    module = sys.modules[mock_context["target_path"]]
+    context = _manager(mock_context)
+    context.class_values = {"Missing.Class": {}}
+    with pytest.raises(AttributeError):
+        with context:
+            pass
+    assert not hasattr(module, "attr_name")
+    assert not context.active_patchers
+
+
+def test_lightweight_mode(mock_context):
+    """Test that the lightweight mode applies and resets stubs."""
+    module = sys.modules[mock_context["target_path"]]
+    context = MockContextManager(
+        mock_context["target_path"],
+        mapping_values=mock_context["mapping_values"],
+        class_values={"TestClass": {"method": 1}},
+        lightweight=True,
+    )
+    with context:
+        assert module.map_name["key"] == "value"
+        assert module.TestClass().method() == 1
+        context.get_mock("TestClass").assert_called_once()
+        context.start_all_mocks()
+        context.get_mock("TestClass").assert_not_called()
+    assert not hasattr(module, "TestClass")
+
+
+def test_patches_are_batched_per_owner():
+    """Test that the patches of one owner are started with a single patch.multiple."""
+    context = MockContextManager(
+        "os",
+        method_behaviors={"path.exists": True, "path.join": lambda *parts: "/".join(parts), "makedirs": None},
+        mapping_values={"environ": {"HOME": "/home"}},
+    )
+    with patch.object(patch, "multiple", wraps=patch.multiple) as mock_multiple:
+        with context:
+            assert os.path.exists("missing")
+            assert os.path.join("a", "b") == "a/b"
+            assert os.environ["HOME"] == "/home"
+            os.makedirs("missing")
+            context.get_mock("makedirs").assert_called_once_with("missing")
+    assert mock_multiple.call_count == 2
+    assert os.path.exists(os.getcwd())
+
+
+def test_update_batched_patch(mock_context):
+    """Test that an update goes on top of a batched patch and leaves its mock in place."""
+    module = sys.modules[mock_context["target_path"]]
+    with _manager(mock_context) as context:
+        original_mock = context.get_mock("method_name")
+        with context.update_patch("method_name", lambda x: x * 3) as new_mock:
+            assert module.method_name(2) == 6
+            assert context.get_mock("method_name") is new_mock
+        assert module.method_name is original_mock
+        assert context.get_mock("method_name") is original_mock
+
+
+def test_remove_batched_patch():
+    """Test that removing a batched patch puts back the original only for the duration of the block."""
+    context = MockContextManager("os", method_behaviors={"getcwd": "/mocked", "created_function": lambda: 1})
+    original_getcwd = os.getcwd
+    with context:
+        with context.remove_patch("getcwd"):
+            assert os.getcwd is original_getcwd
+            assert "getcwd" not in context.active_patchers
+        with context.remove_patch("created_function"):
+            assert not hasattr(os, "created_function")
+        assert os.getcwd() == "/mocked"
+        assert os.created_function() == 1
+    assert os.getcwd is original_getcwd
+    assert not hasattr(os, "created_function")
+
+
+def test_unbatchable_name(mock_context):
+    """Test that names taken by the parameters of patch.multiple are patched on their own."""
+    module = sys.modules[mock_context["target_path"]]
+    with MockContextManager(mock_context["target_path"], attribute_values={"spec": 1, "other": 2}):
+        assert module.spec == 1
+        assert module.other == 2
+    assert not hasattr(module, "spec")
+
+
+def test_batched_patch_of_missing_method(mock_context):
+    """Test that a method patched with a return value has to exist."""
+    context = MockContextManager(mock_context["target_path"], method_behaviors={"missing_method": 1})
+    with pytest.raises(AttributeError, match="does not have the attribute 'missing_method'"):
+        with context:
+            pass
+    assert not context.active_patchers
@@ -0,0 +1,83 @@
+from unittest.mock import ANY, MagicMock, call
+
+import pytest
+
+from src.utils.test.mock_methods import CallLog, call_log, method_called_in_mock
+from src.utils.test.mock_stubs import Stub
+
+
+@pytest.fixture(params=[MagicMock, Stub])
+def recorded_mock(request):
+    """Fixture providing a mock and a stub with a few recorded calls."""
+    mock = request.param()
+    mock.write("a")
+    mock.write("b", end="")
+    mock.flush()
+    mock.write(["unhashable"])
+    mock.write("a")
+    return mock
+
+
+def test_called_with(recorded_mock):
+    """Test the exact and the positional argument checks."""
+    log = CallLog(recorded_mock)
+    assert log.called("write")
+    assert not log.called("close")
+    assert log.called_with("write", "a")
+    assert log.called_with("write", "b", end="")
+    assert not log.called_with("write", "b")
+    assert log.called_with_args("write", "b")
+    assert log.called_with("write", ["unhashable"])
+
+
+def test_matchers(recorded_mock):
+    """Test that arguments matching through their own equality, like ANY, are found."""
+    recorded_mock.write("abc", 1)
+    log = CallLog(recorded_mock)
+    assert method_called_in_mock(recorded_mock, "write", ANY, 1)
+    assert log.called_with("write", ANY, end="")
+    assert log.called_with("write", "b", end=ANY)
+    assert log.count_with("write", ANY) == 3
+    assert log.positions("write", ANY, 1) == [5]
+    assert not log.called_with("write", ANY, 2)
+    assert log.called_in_order(call.write(ANY), call.flush(), call.write(ANY, 1))
+
+
+def test_counts_and_positions(recorded_mock):
+    """Test the counts and the positions of calls."""
+    log = CallLog(recorded_mock)
+    assert log.count("write") == 4
+    assert log.count_with("write", "a") == 2
+    assert log.positions("write", "a") == [0, 4]
+    assert log.calls("flush") == [call.flush()]
+
+
+def test_called_in_order(recorded_mock):
+    """Test the ordered queries."""
+    log = CallLog(recorded_mock)
+    assert log.called_in_order(call.write("a"), call.flush(), call.write("a"))
+    assert log.called_in_order(call.write("b", end=""), call.write(["unhashable"]))
+    assert not log.called_in_order(call.flush(), call.write("b", end=""))
+    assert not log.called_in_order(call.write("a"), call.write("a"), call.write("a"))
+
+
+def test_log_follows_new_calls_and_resets(recorded_mock):
+    """Test that calls made after a query are indexed, and that a reset empties the log."""
+    log = CallLog(recorded_mock)
+    assert log.count("write") == 4
+    recorded_mock.write("c")
+    assert log.called_with("write", "c")
+    recorded_mock.reset_mock()
+    for _ in range(6):
+        recorded_mock.close()
+    assert log.count("write") == 0
+    assert log.count("close") == 6
+
+
+def test_method_called_in_mock(recorded_mock):
+    """Test that the helper keeps its behaviour and shares one log per mock."""
+    assert method_called_in_mock(recorded_mock, "write", "b")
+    assert not method_called_in_mock(recorded_mock, "write", "c")
+    assert not method_called_in_mock(recorded_mock, "close")
+    assert method_called_in_mock(call_log(recorded_mock), "flush")
+    assert call_log(recorded_mock) is call_log(recorded_mock)
@@ -1,3 +1,7 @@
+import importlib
+import os
+import sys
+import types
 from unittest.mock import MagicMock, patch
 
 from src.utils.test.mock_patching_strategies import (
@@ -5,7 +9,10 @@ from src.utils.test.mock_patching_strategies import (
     ClassPatcherStrategy,
     MappingPatcherStrategy,
     MethodPatcherStrategy,
+    invalidate_targets,
+    resolve_target,
 )
+from src.utils.test.mock_stubs import MappingStub, Stub
 
 
 def test_method_patcher(mock_context):
@@ -87,3 +94,77 @@ def test_class_patcher(mock_context):
         assert instance.method2() == 42
     finally:
         patcher.stop()
+
+
+def test_lightweight_patchers(mock_context):
+    """Test that the lightweight mode patches with stubs."""
+    mapping_patcher = MappingPatcherStrategy(lightweight=True).execute(
+        mock_context["target_path"], "map_name", {"key": "value"}
+    )
+    class_patcher = ClassPatcherStrategy(lightweight=True).execute(
+        mock_context["target_path"], "TestClass", {"method1": "return1"}
+    )
+    try:
+        mock_dict = mapping_patcher.start()
+        mock_class = class_patcher.start()
+        assert isinstance(mock_dict, MappingStub)
+        assert mock_dict["key"] == "value"
+        assert isinstance(mock_class, Stub)
+        assert mock_class().method1() == "return1"
+    finally:
+        class_patcher.stop()
+        mapping_patcher.stop()
+
+
+def test_patcher_creates_fresh_mocks(mock_context):
+    """Test that each start of a patcher replaces the target with a new mock."""
+    patcher = MethodPatcherStrategy().execute(mock_context["target_path"], "method_name", lambda x: x)
+    first = patcher.start()
+    patcher.stop()
+    second = patcher.start()
+    patcher.stop()
+    assert first is not second
+    patcher.stop()
+
+
+def test_resolve_target():
+    """Test that nested targets resolve to the owner object and the attribute name."""
+    assert resolve_target("os", "path.exists") == (os.path, "exists")
+    assert resolve_target("os", "environ") == (os, "environ")
+
+
+def test_resolve_target_is_cached():
+    """Test that a resolved target is not imported again."""
+    invalidate_targets()
+    resolve_target("os", "path.exists")
+    with patch("pkgutil.resolve_name") as mock_resolve:
+        assert resolve_target("os", "path.exists") == (os.path, "exists")
+    mock_resolve.assert_not_called()
+
+
+def test_resolve_target_after_reload(tmp_path, monkeypatch):
+    """Test that a reloaded module is resolved again."""
+    (tmp_path / "reloaded_target.py").write_text("class Owner:\n    value = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("reloaded_target")
+    try:
+        first, _ = resolve_target("reloaded_target", "Owner.value")
+        importlib.reload(module)
+        second, attribute = resolve_target("reloaded_target", "Owner.value")
+        assert first is not second
+        assert second is module.Owner and attribute == "value"
+    finally:
+        del sys.modules["reloaded_target"]
+
+
+def test_resolve_target_after_replaced_module():
+    """Test that a module replaced in sys.modules is resolved again."""
+    sys.modules["replaced_target"] = types.ModuleType("replaced_target")
+    try:
+        first, _ = resolve_target("replaced_target", "value")
+        sys.modules["replaced_target"] = types.ModuleType("replaced_target")
+        second, _ = resolve_target("replaced_target", "value")
+        assert first is not second
+        assert second is sys.modules["replaced_target"]
+    finally:
+        del sys.modules["replaced_target"]
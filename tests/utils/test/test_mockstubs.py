@@ -0,0 +1,83 @@
+from unittest.mock import call
+
+import pytest
+
+from src.utils.test.mock_methods import method_called_in_mock
+from src.utils.test.mock_stubs import MappingStub, Stub, create_class_stub
+
+
+def test_stub_records_calls():
+    """Test that a stub returns its value and records its calls."""
+    stub = Stub(return_value=3)
+    assert stub(1, key="value") == 3
+    assert stub.called
+    assert stub.call_count == 1
+    assert stub.call_args == call(1, key="value")
+    stub.assert_called_once_with(1, key="value")
+    stub.assert_any_call(1, key="value")
+
+
+def test_stub_assertions_fail():
+    """Test that the call assertions of a stub raise on mismatches."""
+    stub = Stub()
+    stub.assert_not_called()
+    with pytest.raises(AssertionError):
+        stub.assert_called()
+    stub(1)
+    stub(2)
+    with pytest.raises(AssertionError):
+        stub.assert_called_once()
+    with pytest.raises(AssertionError):
+        stub.assert_called_with(1)
+    with pytest.raises(AssertionError):
+        stub.assert_any_call(3)
+
+
+def test_stub_members():
+    """Test that members are created on access and their calls recorded on the root stub."""
+    stub = Stub()
+    stub.play(1)
+    stub.music.load("file")
+    stub.play.assert_called_once_with(1)
+    assert stub.play is stub.play
+    assert stub.method_calls == [call.play(1), call.music.load("file")]
+    assert method_called_in_mock(stub, "music.load", "file")
+    with pytest.raises(AttributeError):
+        stub._private
+    with pytest.raises(AttributeError):
+        stub.unknown_attribute = 1
+
+
+def test_stub_reset():
+    """Test that resetting forgets the calls of the stub and its members."""
+    stub = Stub()
+    stub()
+    stub.play()
+    stub.reset_mock()
+    stub.assert_not_called()
+    stub.play.assert_not_called()
+    assert stub.method_calls == []
+
+
+def test_mapping_stub():
+    """Test that a mapping stub reads and writes its mapping and records the accesses."""
+    data = {"key": "value"}
+    stub = MappingStub(data)
+    assert stub["key"] == "value"
+    stub["other"] = 1
+    assert "other" in stub
+    assert data == {"key": "value", "other": 1}
+    assert stub.method_calls[0] == ("__getitem__", ("key",), {})
+
+
+def test_class_stub():
+    """Test that the class stub and its instance have the configured methods."""
+    stub = create_class_stub({"get_num_channels": 1})
+    instance = stub("file.wav")
+    assert stub.get_num_channels() == 1
+    assert instance.get_num_channels() == 1
+    assert stub() is instance
+    instance.play()
+    instance.play.assert_called_once()
+    stub.assert_called_with()
+    assert stub.call_count == 2